@@ -62,13 +62,13 @@ CREATE TABLE IF NOT EXISTS distric_stats (
     pm25_value INTEGER,
     create_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     district_id TEXT REFERENCES districts(id),
-    UNIQUE(district_id, date, hour, component_id)
+    -- hour is NULL for daily rows; NULLS NOT DISTINCT lets ON CONFLICT match them
+    CONSTRAINT uq_distric_stats_key UNIQUE NULLS NOT DISTINCT (district_id, date, hour, component_id)
 );
 
 CREATE INDEX idx_stats_date ON distric_stats(date);
-CREATE INDEX idx_stats_district ON distric_stats(district_id);
-CREATE INDEX idx_stats_component ON distric_stats(component_id);
-CREATE INDEX idx_stats_date_district ON distric_stats(date, district_id);
+CREATE INDEX idx_stats_district_component_date ON distric_stats(district_id, component_id, date);
+CREATE INDEX idx_stats_district_date_hour ON distric_stats(district_id, date, hour);
 
 -- ============================================
 -- DONE
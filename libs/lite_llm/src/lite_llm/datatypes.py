@@ -32,6 +32,8 @@ class MessageRole(str, Enum):
 
 class CompletionMessage(BaseLLMMessage):
     role: MessageRole
+    # Provider prompt-cache marker, e.g. {'type': 'ephemeral'} for Anthropic models
+    cache_control: dict[str, str] | None = None
 
 
 class TokensLLM(BaseModel):
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from collections import deque
 from collections.abc import AsyncGenerator
 from collections.abc import Generator
 from contextlib import asynccontextmanager
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import Optional
+from typing import TypeVar
 
 import httpx
 from base import BaseModel
 from base import BaseService
 from logger import get_logger
+from pydantic import PrivateAttr
 
 from .datatypes import CompletionMessage
 from .datatypes import Message
@@ -23,6 +28,61 @@ from .settings import LiteLLMSetting
 
 logger = get_logger(__name__)
 
+T = TypeVar('T', bound=BaseModel)
+
+
+def _set_additional_properties_false(schema: Dict[str, Any]) -> None:
+    """Fix JSON schema in place for OpenAI structured output strict mode.
+
+    - Sets additionalProperties=false on all object types
+    - Ensures all properties are listed in 'required'
+
+    Nested schemas are walked with an explicit stack, so deeply nested models
+    cannot hit the recursion limit.
+    """
+    stack = deque([schema])
+    while stack:
+        node = stack.pop()
+        properties = node.get('properties')
+        if node.get('type') == 'object' or properties is not None:
+            node['additionalProperties'] = False
+            # Strict mode requires all properties in 'required'
+            if properties is not None:
+                node['required'] = list(properties)
+        stack.extend(node.get('$defs', {}).values())
+        if properties:
+            stack.extend(properties.values())
+        if 'items' in node:
+            stack.append(node['items'])
+
+
+@lru_cache(maxsize=None)
+def _strict_response_format(return_type: type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the strict ``json_schema`` response format for a return type once per process.
+
+    Generating and patching the JSON schema walks the whole model on every call; caching
+    it also keeps the schema byte-identical across requests, so providers that compile
+    schemas into decoding grammars can reuse the compiled grammar. Callers must not mutate
+    the returned dict.
+
+    Args:
+        return_type (type[BaseModel]): The expected response model.
+
+    Returns:
+        Dict[str, Any]: The ``response_format`` payload entry.
+    """
+    schema = return_type.model_json_schema()
+    _set_additional_properties_false(schema)
+    return {
+        'type': 'json_schema',
+        'json_schema': {
+            'name': return_type.__name__,
+            'schema': schema,
+            'strict': True,
+        },
+    }
+
 
 class LiteLLMInput(BaseModel):
     """
@@ -39,6 +99,8 @@ class LiteLLMInput(BaseModel):
         tools (Optional[list[dict[str, str | object]]]): Tools available to the model.
         count_tokens (bool): Whether to count tokens in the response.
         stream (bool): Whether to stream the response.
+        extra_body (Optional[dict[str, Any]]): Backend-specific fields merged into the request
+            body, e.g. scheduler hints understood by self-hosted vLLM/SGLang deployments.
     """
 
     message: Message
@@ -50,12 +112,16 @@ class LiteLLMInput(BaseModel):
     tools: Optional[list[dict[str, str | object]]] = None
     count_tokens: bool = False
     stream: bool = False
+    extra_body: Optional[dict[str, Any]] = None
 
 
 class LiteLLMOutput(BaseModel):
     """
     Output model for LiteLLM service responses.
 
+    When the request set ``return_type``, ``response`` is already a validated
+    instance of that type; use ``parsed`` instead of re-validating it.
+
     Attributes:
         response (Response): The response content from the LLM.
         metadata (dict[str, Any]): Additional metadata about the response.
@@ -68,6 +134,23 @@ class LiteLLMOutput(BaseModel):
     count_tokens: bool = False
     tokens: TokensLLM = TokensLLM()
 
+    def parsed(self, return_type: type[T]) -> T:
+        """
+        Return the structured response without validating it again.
+
+        Args:
+            return_type (type[T]): The ``return_type`` the request was made with.
+
+        Returns:
+            T: The response instance.
+
+        Raises:
+            ValueError: If the response is not an instance of ``return_type``.
+        """
+        if not isinstance(self.response, return_type):
+            raise ValueError(f'Expected {return_type.__name__}, got {type(self.response).__name__}')
+        return self.response
+
 
 class LiteLLMEmbeddingInput(BaseModel):
     """
@@ -93,9 +176,11 @@ class LiteLLMEmbeddingOutput(BaseModel):
 
     Attributes:
         vector (list): The embedding vector returned from the API.
+        vectors (list[list]): All embedding vectors, in input order, when a list of texts is embedded.
     """
 
     vector: list
+    vectors: list[list] = []
 
 
 class LiteLLMService(BaseService):
@@ -106,68 +191,92 @@ class LiteLLMService(BaseService):
     requests to LiteLLM-compatible APIs, with support for various models including
     OpenAI and Claude models. It supports both text completion and embedding operations.
 
+    HTTP clients are created on first use and kept for the lifetime of the
+    service so connections are pooled and kept alive across requests; call
+    ``close``/``aclose`` on shutdown.
+
     Attributes:
         settings (LiteLLMSetting): Configuration settings for the service.
     """
 
     settings: LiteLLMSetting
 
+    _http_client: httpx.Client | None = PrivateAttr(default=None)
+    _async_http_client: httpx.AsyncClient | None = PrivateAttr(default=None)
+    _inflight: dict[str, asyncio.Future] = PrivateAttr(default_factory=dict)
+
     @property
     def headers(self) -> dict[str, str]:
         return {
             'Authorization': f'Bearer {self.settings.token.get_secret_value()}',
         }
 
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
+
     @property
     @contextmanager
     def client(self) -> Generator[httpx.Client]:
         """
-        Context manager for creating a synchronous HTTP client.
+        Context manager yielding the shared synchronous HTTP client.
 
         Yields:
-            httpx.Client: A configured HTTP client with authentication headers.
+            httpx.Client: A pooled HTTP client with authentication headers.
 
         Raises:
             ValueError: If authentication fails (401 status).
             httpx.HTTPStatusError: For other HTTP errors.
         """
-        client = httpx.Client(
-            base_url=self.settings.url.unicode_string().rstrip('/'),
-            headers={
-                'Authorization': f'Bearer {self.settings.token.get_secret_value()}',
-                'Content-Type': 'application/json',
-            },
-            timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
-        )
-        try:
-            yield client
-        except Exception as e:
-            raise e
-        finally:
-            client.close()
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.Client(
+                base_url=self.settings.url.unicode_string().rstrip('/'),
+                headers={
+                    'Authorization': f'Bearer {self.settings.token.get_secret_value()}',
+                    'Content-Type': 'application/json',
+                },
+                timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
+                limits=self.limits,
+            )
+        yield self._http_client
 
     @property
     @asynccontextmanager
     async def async_client(self) -> AsyncGenerator[httpx.AsyncClient]:
         """
-        Async context manager for creating an asynchronous HTTP client.
+        Async context manager yielding the shared asynchronous HTTP client.
 
         Yields:
-            httpx.AsyncClient: A configured async HTTP client with authentication headers.
-        """
-        client = httpx.AsyncClient(
-            base_url=self.settings.url.unicode_string().rstrip('/'),
-            headers={
-                'Authorization': f'Bearer {self.settings.token.get_secret_value()}',
-                'Content-Type': 'application/json',
-            },
-            timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
-            limits=httpx.Limits(max_connections=self.settings.max_connections, max_keepalive_connections=self.settings.max_keepalive_connections),
-        )
-        try:
-            yield client
-        finally:
-            await client.aclose()
+            httpx.AsyncClient: A pooled async HTTP client with authentication headers.
+        """
+        if self._async_http_client is None or self._async_http_client.is_closed:
+            self._async_http_client = httpx.AsyncClient(
+                base_url=self.settings.url.unicode_string().rstrip('/'),
+                headers={
+                    'Authorization': f'Bearer {self.settings.token.get_secret_value()}',
+                    'Content-Type': 'application/json',
+                },
+                timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
+                limits=self.limits,
+            )
+        yield self._async_http_client
+
+    def close(self) -> None:
+        """Close the shared synchronous HTTP client, if it was created."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients, if they were created."""
+        self.close()
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
 
     def process(self, inputs: LiteLLMInput) -> LiteLLMOutput:
         """
@@ -189,6 +298,7 @@ class LiteLLMService(BaseService):
             model=inputs.model if inputs.model else self.settings.model,
             presence_penalty=inputs.presence_penalty if inputs.presence_penalty else 0,
             count_tokens=inputs.count_tokens,
+            extra_body=inputs.extra_body,
         )
 
     async def process_async(self, inputs: LiteLLMInput) -> LiteLLMOutput:
@@ -211,6 +321,7 @@ class LiteLLMService(BaseService):
             model=inputs.model if inputs.model else self.settings.model,
             presence_penalty=inputs.presence_penalty if inputs.presence_penalty else 0,
             count_tokens=inputs.count_tokens,
+            extra_body=inputs.extra_body,
         )
 
     def embedding(self, inputs: LiteLLMEmbeddingInput) -> LiteLLMEmbeddingOutput:
@@ -292,6 +403,7 @@ class LiteLLMService(BaseService):
                 n=inputs.n if inputs.n else 1,
                 model=inputs.model if inputs.model else self.settings.model,
                 presence_penalty=inputs.presence_penalty if inputs.presence_penalty else 0,
+                extra_body=inputs.extra_body,
             )
             payload['stream'] = True
 
@@ -326,6 +438,7 @@ class LiteLLMService(BaseService):
         model: str,
         presence_penalty: int,
         count_tokens: bool = False,
+        extra_body: Optional[dict[str, Any]] = None,
     ) -> LiteLLMOutput:
         """
         Execute synchronous inference using the LLM API.
@@ -338,6 +451,7 @@ class LiteLLMService(BaseService):
             model (str): The model name to use for inference.
             presence_penalty (int): Presence penalty for token usage.
             count_tokens (bool): Whether to count tokens in the response.
+            extra_body (Optional[dict[str, Any]]): Backend-specific fields merged into the request body.
 
         Returns:
             LiteLLMOutput: The processed response from the LLM.
@@ -354,6 +468,7 @@ class LiteLLMService(BaseService):
                 n=n,
                 model=model,
                 presence_penalty=presence_penalty,
+                extra_body=extra_body,
             )
 
             try:
@@ -380,6 +495,7 @@ class LiteLLMService(BaseService):
         model: str,
         presence_penalty: int,
         count_tokens: bool = False,
+        extra_body: Optional[dict[str, Any]] = None,
     ) -> LiteLLMOutput:
         """
         Execute asynchronous inference using the LLM API.
@@ -392,6 +508,7 @@ class LiteLLMService(BaseService):
             model (str): The model name to use for inference.
             presence_penalty (int): Presence penalty for token usage.
             count_tokens (bool): Whether to count tokens in the response.
+            extra_body (Optional[dict[str, Any]]): Backend-specific fields merged into the request body.
 
         Returns:
             LiteLLMOutput: The processed response from the LLM.
@@ -408,11 +525,14 @@ class LiteLLMService(BaseService):
                 n=n,
                 model=model,
                 presence_penalty=presence_penalty,
+                extra_body=extra_body,
             )
             try:
-                response = await client.post('/v1/chat/completions', json=payload)
-                response.raise_for_status()
-                response_data = response.json()
+                response_data = await self.__post_coalesced(
+                    client=client,
+                    url='/v1/chat/completions',
+                    payload=payload,
+                )
 
                 return self.__postprocessing_response(
                     response=response_data,
@@ -423,6 +543,58 @@ class LiteLLMService(BaseService):
             except Exception as e:
                 raise e
 
+    async def __post_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def __post_coalesced(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        POST a request, sharing one provider call among identical concurrent requests.
+
+        Concurrent callers with the same payload await a single in-flight task
+        instead of each issuing a provider request. The shared task is shielded,
+        so cancelling one caller does not cancel it for the others.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client to send the request with.
+            url (str): The endpoint path.
+            payload (Dict[str, Any]): The JSON request body.
+
+        Returns:
+            Dict[str, Any]: The decoded JSON response.
+        """
+        if not self.settings.coalesce_requests:
+            return await self.__post_json(client, url, payload)
+
+        key = url + json.dumps(payload, sort_keys=True, default=str)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__post_json(client, url, payload))
+            self._inflight[key] = task
+
+            def _release(done: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                if not done.cancelled():
+                    done.exception()  # Mark as retrieved when every caller was cancelled
+
+            task.add_done_callback(_release)
+        else:
+            logger.debug('Coalescing identical in-flight LLM request', extra={'url': url})
+
+        return await asyncio.shield(task)
+
     def __embedding_by_llm(
         self,
         *,
@@ -522,6 +694,7 @@ class LiteLLMService(BaseService):
         n: int,
         model: str,
         presence_penalty: int,
+        extra_body: Optional[dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Build the request payload for the chat completion API.
@@ -533,6 +706,7 @@ class LiteLLMService(BaseService):
             n (int): Number of completions to generate.
             model (str): The model name to use for inference.
             presence_penalty (int): Presence penalty for token usage.
+            extra_body (Optional[dict[str, Any]]): Backend-specific fields merged into the payload.
 
         Returns:
             Dict[str, Any]: The formatted request payload for the API.
@@ -540,7 +714,7 @@ class LiteLLMService(BaseService):
         if 'claude' in model.lower():
             payload = {
                 'model': model,
-                'messages': [self.__parse_to_openai_message(m) for m in message],
+                'messages': [self.__parse_to_openai_message(m, with_cache_control=True) for m in message],
                 'max_tokens': self.settings.max_completion_tokens,
                 'n': n,
             }
@@ -556,43 +730,24 @@ class LiteLLMService(BaseService):
             }
 
         if return_type:
-            schema = return_type.model_json_schema()
-            self.__set_additional_properties_false(schema)
-            payload['response_format'] = {
-                'type': 'json_schema',
-                'json_schema': {
-                    'name': return_type.__name__,
-                    'schema': schema,
-                    'strict': True,
-                },
-            }
+            payload['response_format'] = _strict_response_format(return_type)
+        if extra_body:
+            payload.update(extra_body)
         return payload
 
-    @staticmethod
-    def __set_additional_properties_false(schema: Dict[str, Any]) -> None:
-        """Recursively fix JSON schema for OpenAI structured output strict mode.
-
-        - Sets additionalProperties=false on all object types
-        - Ensures all properties are listed in 'required'
-        """
-        if schema.get('type') == 'object' or 'properties' in schema:
-            schema['additionalProperties'] = False
-            # Strict mode requires all properties in 'required'
-            if 'properties' in schema:
-                schema['required'] = list(schema['properties'].keys())
-        for defn in schema.get('$defs', {}).values():
-            LiteLLMService.__set_additional_properties_false(defn)
-        for prop in schema.get('properties', {}).values():
-            LiteLLMService.__set_additional_properties_false(prop)
-        if 'items' in schema:
-            LiteLLMService.__set_additional_properties_false(schema['items'])
-
-    def __parse_to_openai_message(self, message: CompletionMessage) -> Dict[str, Any]:
+    def __parse_to_openai_message(
+        self,
+        message: CompletionMessage,
+        with_cache_control: bool = False,
+    ) -> Dict[str, Any]:
         """
         Parse CompletionMessage to OpenAI API message format.
 
         Args:
             message (CompletionMessage): CompletionMessage object to convert.
+            with_cache_control (bool): Whether to forward the message's cache_control
+                marker (only honoured by providers with explicit prompt caching, e.g. Anthropic).
+                OpenAI models cache identical prompt prefixes automatically.
 
         Returns:
             Dict[str, str]: OpenAI API message format with role and content fields.
@@ -605,6 +760,15 @@ class LiteLLMService(BaseService):
                     'image_url': message.image_url,
                 }],
             }
+        if with_cache_control and message.cache_control:
+            return {
+                'role': message.role.value,
+                'content': [{
+                    'type': TypeMessage.TEXT.value,
+                    'text': message.content,
+                    'cache_control': message.cache_control,
+                }],
+            }
         return {
             'role': message.role.value,
             'content': message.content,
@@ -700,7 +864,7 @@ class LiteLLMService(BaseService):
             count_token (bool): Flag indicating whether to count tokens used in the response (currently unused).
 
         Returns:
-            LiteLLMEmbeddingOutput: The processed output containing the first embedding vector.
+            LiteLLMEmbeddingOutput: The processed output containing the first embedding vector and all vectors in input order.
 
         Raises:
             ValueError: If the response data is empty or invalid.
@@ -708,7 +872,7 @@ class LiteLLMService(BaseService):
         if not response.get('data'):
             raise ValueError('No data returned in embedding response')
 
-        embeddings = [item['embedding'] for item in response['data']]
+        embeddings = [item['embedding'] for item in sorted(response['data'], key=lambda item: item.get('index', 0))]
 
         tokens = TokensLLM()
         if count_token and response.get('usage'):
@@ -718,6 +882,7 @@ class LiteLLMService(BaseService):
 
         return LiteLLMEmbeddingOutput(
             vector=embeddings[0],
+            vectors=embeddings,
         )
 
     async def check_health(self) -> bool:
@@ -727,14 +892,8 @@ class LiteLLMService(BaseService):
             bool: True if healthy, False otherwise
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
-                limits=httpx.Limits(max_connections=self.settings.max_connections, max_keepalive_connections=self.settings.max_keepalive_connections),
-            ) as client:
-                r = await client.get(
-                    self.settings.url.unicode_string().rstrip('/') + '/health',
-                    headers=self.headers,
-                )
+            async with self.async_client as client:
+                r = await client.get('/health', headers=self.headers)
             if r.status_code == 200 and r.json()['unhealthy_count'] == 0:
                 return True
 
@@ -23,5 +23,7 @@ class LiteLLMSetting(BaseModel):
     connect_timeout: int
     max_connections: int
     max_keepalive_connections: int
+    keepalive_expiry: float = 60.0
+    coalesce_requests: bool = True
     context_window: int
     condition_model: str
@@ -5,6 +5,7 @@ import sys
 
 import structlog
 from rich.console import Console
+from rich.traceback import Traceback
 from rich.traceback import install as install_rich_traceback
 from structlog.stdlib import BoundLogger
 from structlog.types import EventDict
@@ -141,8 +142,6 @@ def setup_logging(
 
         # Use rich traceback for prettier output when not in JSON mode
         if rich_tracebacks and not json_logs:
-            from rich.traceback import Traceback
-
             console.print(
                 Traceback.from_exception(
                     exc_type,
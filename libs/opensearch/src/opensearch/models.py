@@ -10,3 +10,4 @@ class AddDocumentInput(BaseModel):
     text: str
     embedding: list[float]
     metadata: Optional[dict[str, Any]] = None
+    id: Optional[str] = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 from typing import Optional
 from uuid import uuid4
@@ -7,6 +8,7 @@ from uuid import uuid4
 from base import BaseModel
 from base import BaseService
 from opensearchpy import OpenSearch
+from opensearchpy import helpers
 
 from .models import AddDocumentInput
 from .settings import OpenSearchSettings
@@ -22,12 +24,19 @@ class OpenSearchOutput(BaseModel):
     results: list[dict]
 
 
+# Bulk indexing limits; 429 rejections are retried with exponential backoff
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+BULK_MAX_RETRIES = 5
+BULK_INITIAL_BACKOFF = 2
+
+
 class OpenSearchService(BaseService):
     settings: OpenSearchSettings
 
-    @property
+    @cached_property
     def client(self) -> OpenSearch:
-        """Create and return an OpenSearch client."""
+        """OpenSearch client, created once so its connection pool is reused across calls."""
         return OpenSearch(
             hosts=[{'host': self.settings.host, 'port': self.settings.port}],
             http_compress=True,
@@ -122,28 +131,69 @@ class OpenSearchService(BaseService):
         response = self.client.search_pipeline.delete(id=pipeline_id)
         return response.get('acknowledged', False)
 
-    def add_documents(self, documents: list[AddDocumentInput], index_name: str) -> bool:
+    def add_documents(
+        self,
+        documents: list[AddDocumentInput],
+        index_name: str,
+        thread_count: int = 1,
+    ) -> bool:
         """
-        Add documents to OpenSearch. Generic method that works with any Document type.
+        Add documents to OpenSearch in bulk requests. Generic method that works with any Document type.
+
+        Documents with an ``id`` are indexed under it so re-indexing overwrites them; others get a random id.
+        With ``thread_count`` > 1 the bulk chunks are sent concurrently via ``parallel_bulk``.
 
         Args:
             documents (list[AddDocumentInput]): A list of AddDocumentInput objects.
             index_name (str): The name of the index to add documents to.
+            thread_count (int): Number of threads sending bulk chunks concurrently.
         Returns:
-            bool: True if documents were added successfully, False otherwise.
+            bool: True if all documents were added successfully, False otherwise.
         """
         if not self.index_exists(index_name=index_name) or not documents:
             return False
 
-        for doc in documents:
-            _ = self.client.index(
-                index=index_name,
-                body=doc.model_dump(),
-                id=str(uuid4()),
+        client = self.client
+        actions = (
+            {
+                '_op_type': 'index',
+                '_index': index_name,
+                '_id': doc.id or str(uuid4()),
+                '_source': doc.model_dump(exclude={'id'}),
+            }
+            for doc in documents
+        )
+
+        if thread_count <= 1:
+            _, errors = helpers.bulk(
+                client,
+                actions,
+                chunk_size=BULK_CHUNK_SIZE,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                max_retries=BULK_MAX_RETRIES,
+                initial_backoff=BULK_INITIAL_BACKOFF,
+                raise_on_error=False,
                 refresh=True,
             )
-
-        return True
+            return not errors
+
+        # The bounded queue applies backpressure on the action generator;
+        # results must be consumed for the chunks to be sent at all.
+        errors = []
+        for ok, item in helpers.parallel_bulk(
+            client,
+            actions,
+            thread_count=thread_count,
+            queue_size=thread_count * 2,
+            chunk_size=BULK_CHUNK_SIZE,
+            max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+            raise_on_error=False,
+        ):
+            if not ok:
+                errors.append(item)
+        client.indices.refresh(index=index_name)
+
+        return not errors
 
     async def process(self, inputs: OpenSearchInput) -> OpenSearchOutput:
         """
@@ -0,0 +1,37 @@
+"""Optional Cython build for the pg controller hot path.
+
+The schema, province controller and CRUD helper modules are pure-Python glue
+that runs on every database read. This script compiles them in place so the
+resulting extension modules shadow the ``.py`` sources; the sources are kept in
+the tree and are imported transparently whenever no compiled module is present
+(PyPy, debug runs, or environments without a C toolchain).
+
+Usage:
+    uv sync --group cython
+    python setup.py build_ext --inplace
+"""
+
+from __future__ import annotations
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+CYTHON_MODULES = [
+    'src/pg/controller/schemas.py',
+    'src/pg/controller/province_controller.py',
+    'src/pg/controller/utils.py',
+]
+
+setup(
+    name='pg',
+    package_dir={'': 'src'},
+    ext_modules=cythonize(
+        CYTHON_MODULES,
+        compiler_directives={
+            'language_level': 3,
+            # Pydantic inspects signatures and annotations at class creation.
+            'binding': True,
+            'annotation_typing': False,
+        },
+    ),
+)
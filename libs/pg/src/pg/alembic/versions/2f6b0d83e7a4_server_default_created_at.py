@@ -0,0 +1,52 @@
+"""server_default_created_at
+
+Revision ID: 2f6b0d83e7a4
+Revises: e3a8f52b6c19
+Create Date: 2026-10-15 11:05:12.664028
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6b0d83e7a4'
+down_revision: Union[str, Sequence[str], None] = 'e3a8f52b6c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATED_TABLES = (
+    'districts',
+    'air_component',
+    'distric_stats',
+    'user',
+    'user_authentications',
+    'conversation',
+    'message',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in DATED_TABLES:
+        op.alter_column(
+            table_name,
+            'created_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in DATED_TABLES:
+        op.alter_column(
+            table_name,
+            'created_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
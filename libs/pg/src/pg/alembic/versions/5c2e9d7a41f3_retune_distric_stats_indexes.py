@@ -0,0 +1,36 @@
+"""retune_distric_stats_indexes
+
+Revision ID: 5c2e9d7a41f3
+Revises: 81eef9a67b62
+Create Date: 2026-10-15 09:12:40.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e9d7a41f3'
+down_revision: Union[str, Sequence[str], None] = '81eef9a67b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_stats_district_component_date', 'distric_stats', ['district_id', 'component_id', 'date'], unique=False)
+    op.create_index('idx_stats_district_date_hour', 'distric_stats', ['district_id', 'date', 'hour'], unique=False)
+    op.drop_index('idx_stats_date_district', table_name='distric_stats')
+    op.drop_index('idx_stats_district', table_name='distric_stats')
+    op.drop_index('idx_stats_component', table_name='distric_stats')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_stats_component', 'distric_stats', ['component_id'], unique=False)
+    op.create_index('idx_stats_district', 'distric_stats', ['district_id'], unique=False)
+    op.create_index('idx_stats_date_district', 'distric_stats', ['date', 'district_id'], unique=False)
+    op.drop_index('idx_stats_district_date_hour', table_name='distric_stats')
+    op.drop_index('idx_stats_district_component_date', table_name='distric_stats')
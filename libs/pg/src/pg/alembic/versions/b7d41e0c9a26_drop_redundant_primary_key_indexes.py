@@ -0,0 +1,38 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: b7d41e0c9a26
+Revises: 5c2e9d7a41f3
+Create Date: 2026-10-15 10:03:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e0c9a26'
+down_revision: Union[str, Sequence[str], None] = '5c2e9d7a41f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_provinces_id'), table_name='provinces')
+    op.drop_index(op.f('ix_districts_id'), table_name='districts')
+    op.drop_index(op.f('ix_user_id'), table_name='user')
+    op.drop_index(op.f('ix_conversation_id'), table_name='conversation')
+    op.drop_index(op.f('ix_user_authentications_id'), table_name='user_authentications')
+    op.drop_index(op.f('ix_message_id'), table_name='message')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_message_id'), 'message', ['id'], unique=False)
+    op.create_index(op.f('ix_user_authentications_id'), 'user_authentications', ['id'], unique=False)
+    op.create_index(op.f('ix_conversation_id'), 'conversation', ['id'], unique=False)
+    op.create_index(op.f('ix_user_id'), 'user', ['id'], unique=False)
+    op.create_index(op.f('ix_districts_id'), 'districts', ['id'], unique=False)
+    op.create_index(op.f('ix_provinces_id'), 'provinces', ['id'], unique=False)
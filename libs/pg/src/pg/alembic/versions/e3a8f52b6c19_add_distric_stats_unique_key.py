@@ -0,0 +1,34 @@
+"""add_distric_stats_unique_key
+
+Revision ID: e3a8f52b6c19
+Revises: b7d41e0c9a26
+Create Date: 2026-10-15 10:41:55.127390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a8f52b6c19'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e0c9a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # hour is NULL for daily rows; NULLS NOT DISTINCT (PG15+) lets ON CONFLICT match them
+    op.create_unique_constraint(
+        'uq_distric_stats_key',
+        'distric_stats',
+        ['district_id', 'date', 'hour', 'component_id'],
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_distric_stats_key', 'distric_stats', type_='unique')
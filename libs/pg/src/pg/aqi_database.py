@@ -83,9 +83,11 @@ class AQIDatabase(
         """
         engine = create_engine(
             f'postgresql+psycopg2://{self.username}:{self.password}@{self.host}:{self.port}/{self.db}',
-            pool_pre_ping=True,  # Verify connections before using
-            pool_size=10,  # Connection pool size
-            max_overflow=20,  # Extra connections beyond pool_size
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+            pool_use_lifo=self.pool_use_lifo,
         )
         Base.metadata.create_all(engine)
         return sessionmaker(autoflush=False, bind=engine)
@@ -97,6 +99,11 @@ class AQIDatabase(
         host: str,
         port: int,
         db: str,
+        pool_size: int = 20,
+        max_overflow: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        pool_use_lifo: bool = True,
     ):
         """Initialize database connection parameters.
 
@@ -106,6 +113,12 @@ class AQIDatabase(
             host: Database host address
             port: Database port
             db: Database name
+            pool_size: Persistent connections kept in the engine pool
+            max_overflow: Extra connections allowed beyond pool_size
+            pool_recycle: Seconds after which a pooled connection is replaced
+            pool_pre_ping: Test connections for liveness on checkout
+            pool_use_lifo: Reuse the most recently returned connection first,
+                keeping the set of hot backends small
 
         Example:
             >>> db = AQIDatabase(
@@ -121,6 +134,11 @@ class AQIDatabase(
         self.host = host
         self.port = port
         self.db = db
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_use_lifo = pool_use_lifo
 
     @contextmanager
     def get_session(self):
@@ -195,7 +213,8 @@ class AQIDatabase(
             >>> # ... use database ...
             >>> db.close()  # Clean shutdown
         """
-        if hasattr(self, '_sessionmaker'):
+        # cached_property stores its value under the property name
+        if 'sessionmaker' in self.__dict__:
             self.sessionmaker.close_all()
             if self.sessionmaker.kw.get('bind'):
                 self.sessionmaker.kw['bind'].dispose()
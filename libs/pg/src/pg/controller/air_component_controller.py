@@ -17,16 +17,9 @@ from .repository import Repository
 from .schemas import AirComponent
 from .utils import _delete, _get_data, _get_data_by_id, _insert, _update
 
-# Simple logger
-class SimpleLogger:
-    def info(self, msg, **kwargs):
-        print(f"INFO: {msg}")
-    def debug(self, msg, **kwargs):
-        pass
-    def exception(self, msg, **kwargs):
-        print(f"ERROR: {msg}")
-
-logger = SimpleLogger()
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 # Create partial functions
 _insert_method = partial(_insert, logger, AirComponentModel, AirComponent)
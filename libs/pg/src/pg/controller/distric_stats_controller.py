@@ -11,7 +11,7 @@ from datetime import date, datetime
 from functools import partial
 from typing import cast
 
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import bindparam, select, and_, func, desc
 from sqlalchemy.orm import Session, joinedload
 
 from ..model import DistricStats as DistricStatsModel, District as DistrictModel
@@ -19,16 +19,9 @@ from .repository import Repository
 from .schemas import DistricStats, District
 from .utils import _delete, _get_data, _get_data_by_id, _insert, _update
 
-# Simple logger
-class SimpleLogger:
-    def info(self, msg, **kwargs):
-        print(f"INFO: {msg}")
-    def debug(self, msg, **kwargs):
-        pass
-    def exception(self, msg, **kwargs):
-        print(f"ERROR: {msg}")
+from logger import get_logger
 
-logger = SimpleLogger()
+logger = get_logger(__name__)
 
 # Create partial functions
 _insert_method = partial(_insert, logger, DistricStatsModel, DistricStats)
@@ -37,6 +30,52 @@ _delete_method = partial(_delete, logger, DistricStatsModel, DistricStats)
 _get_method = partial(_get_data, logger, DistricStatsModel, DistricStats)
 _get_by_id_method = partial(_get_data_by_id, logger, DistricStatsModel, DistricStats)
 
+# Prebuilt statements; per-call values are supplied as bound parameters
+_LATEST_BY_DISTRICT_STMT = (
+    select(DistricStatsModel)
+    .where(DistricStatsModel.district_id == bindparam('district_id'))
+    .order_by(
+        desc(DistricStatsModel.date),
+        desc(DistricStatsModel.hour),
+    )
+    .limit(1)
+)
+_BY_DISTRICT_AND_DATE_STMT = (
+    select(DistricStatsModel)
+    .where(
+        and_(
+            DistricStatsModel.district_id == bindparam('district_id'),
+            DistricStatsModel.date == bindparam('target_date'),
+        )
+    )
+    .order_by(DistricStatsModel.hour)
+)
+_BY_DISTRICT_DATE_RANGE_STMT = (
+    select(DistricStatsModel)
+    .where(
+        and_(
+            DistricStatsModel.district_id == bindparam('district_id'),
+            DistricStatsModel.date >= bindparam('start_date'),
+            DistricStatsModel.date <= bindparam('end_date'),
+        )
+    )
+    .order_by(
+        DistricStatsModel.date,
+        DistricStatsModel.hour,
+    )
+)
+_AVG_AQI_BY_DISTRICT_DATE_STMT = (
+    select(func.avg(DistricStatsModel.aqi_value))
+    .where(
+        and_(
+            DistricStatsModel.district_id == bindparam('district_id'),
+            DistricStatsModel.date == bindparam('target_date'),
+            DistricStatsModel.aqi_value.isnot(None),
+        )
+    )
+)
+_LATEST_DATE_STMT = select(func.max(DistricStatsModel.date))
+
 
 class DistricStatsController(Repository):
     """Controller for district statistics database operations.
@@ -99,16 +138,10 @@ class DistricStatsController(Repository):
             >>> print(f"Current AQI: {latest.aqi_value}")
         """
         try:
-            stmt = (
-                select(DistricStatsModel)
-                .where(DistricStatsModel.district_id == district_id)
-                .order_by(
-                    desc(DistricStatsModel.date),
-                    desc(DistricStatsModel.hour),
-                )
-                .limit(1)
-            )
-            obj = session.scalars(stmt).first()
+            obj = session.scalars(
+                _LATEST_BY_DISTRICT_STMT,
+                {'district_id': district_id},
+            ).first()
             return DistricStats.model_validate(obj) if obj else None
         except Exception as e:
             logger.exception('Failed to get latest stats', 
@@ -138,17 +171,10 @@ class DistricStatsController(Repository):
             ... )
         """
         try:
-            stmt = (
-                select(DistricStatsModel)
-                .where(
-                    and_(
-                        DistricStatsModel.district_id == district_id,
-                        DistricStatsModel.date == target_date,
-                    )
-                )
-                .order_by(DistricStatsModel.hour)
-            )
-            objs = session.scalars(stmt).all()
+            objs = session.scalars(
+                _BY_DISTRICT_AND_DATE_STMT,
+                {'district_id': district_id, 'target_date': target_date},
+            ).all()
             if len(objs) == 0:
                 return None
             return [DistricStats.model_validate(obj) for obj in objs]
@@ -184,21 +210,10 @@ class DistricStatsController(Repository):
             ... )
         """
         try:
-            stmt = (
-                select(DistricStatsModel)
-                .where(
-                    and_(
-                        DistricStatsModel.district_id == district_id,
-                        DistricStatsModel.date >= start_date,
-                        DistricStatsModel.date <= end_date,
-                    )
-                )
-                .order_by(
-                    DistricStatsModel.date,
-                    DistricStatsModel.hour,
-                )
-            )
-            objs = session.scalars(stmt).all()
+            objs = session.scalars(
+                _BY_DISTRICT_DATE_RANGE_STMT,
+                {'district_id': district_id, 'start_date': start_date, 'end_date': end_date},
+            ).all()
             if len(objs) == 0:
                 return None
             return [DistricStats.model_validate(obj) for obj in objs]
@@ -232,17 +247,10 @@ class DistricStatsController(Repository):
             >>> print(f"Average AQI: {avg_aqi:.1f}")
         """
         try:
-            stmt = (
-                select(func.avg(DistricStatsModel.aqi_value))
-                .where(
-                    and_(
-                        DistricStatsModel.district_id == district_id,
-                        DistricStatsModel.date == target_date,
-                        DistricStatsModel.aqi_value.isnot(None),
-                    )
-                )
-            )
-            result = session.scalars(stmt).first()
+            result = session.scalars(
+                _AVG_AQI_BY_DISTRICT_DATE_STMT,
+                {'district_id': district_id, 'target_date': target_date},
+            ).first()
             return float(result) if result else None
         except Exception as e:
             logger.exception('Failed to calculate average AQI', 
@@ -334,8 +342,7 @@ class DistricStatsController(Repository):
         try:
             if target_date is None:
                 # Get latest date with data
-                stmt = select(func.max(DistricStatsModel.date))
-                target_date = session.scalars(stmt).first()
+                target_date = session.scalars(_LATEST_DATE_STMT).first()
 
             if not target_date:
                 return None
@@ -11,8 +11,10 @@ from collections.abc import Sequence
 from functools import partial
 from typing import cast
 
-from sqlalchemy import select, or_
+from sqlalchemy import bindparam, select, or_
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from ..model import District as DistrictModel
 from .repository import Repository
@@ -23,16 +25,9 @@ from .utils import _get_data_by_id
 from .utils import _insert
 from .utils import _update
 
-# Simple logger for this module
-class SimpleLogger:
-    def info(self, msg, **kwargs):
-        print(f"INFO: {msg}")
-    def debug(self, msg, **kwargs):
-        pass
-    def exception(self, msg, **kwargs):
-        print(f"ERROR: {msg}")
+from logger import get_logger
 
-logger = SimpleLogger()
+logger = get_logger(__name__)
 
 # Create partial functions
 _insert_method = partial(_insert, logger, DistrictModel, District)
@@ -41,6 +36,23 @@ _delete_method = partial(_delete, logger, DistrictModel, District)
 _get_method = partial(_get_data, logger, DistrictModel, District)
 _get_by_id_method = partial(_get_data_by_id, logger, DistrictModel, District)
 
+# Relationships touched when District schemas are validated from ORM rows
+_DISTRICT_LOAD_OPTIONS = (
+    joinedload(DistrictModel.province),
+    selectinload(DistrictModel.stats),
+)
+
+# Prebuilt statements; per-call values are supplied as bound parameters
+_SEARCH_BY_NAME_STMT = select(DistrictModel).where(
+    or_(
+        DistrictModel.name.ilike(bindparam('name_pattern')),
+        DistrictModel.normalized_name.ilike(bindparam('normalized_pattern')),
+    )
+).limit(bindparam('limit'))
+_BY_NORMALIZED_NAME_STMT = select(DistrictModel).where(
+    DistrictModel.normalized_name == bindparam('normalized_name')
+)
+
 
 class DistrictController(Repository):
     """Controller for district database operations.
@@ -69,9 +81,20 @@ class DistrictController(Repository):
         filter: dict[str, object] | None = None,
         order_by: Sequence | None = None,
         limit: int | None = None,
+        load_options: Sequence | None = None,
     ) -> list[District] | None:
-        """Get districts with optional filtering and ordering."""
-        result = _get_method(session, filter, order_by, limit)
+        """Get districts with optional filtering and ordering.
+
+        Province and stats are eager-loaded by default; pass ``load_options``
+        to override (e.g. ``[raiseload('*')]`` to forbid lazy loads).
+        """
+        result = _get_method(
+            session,
+            filter,
+            order_by,
+            limit,
+            _DISTRICT_LOAD_OPTIONS if load_options is None else load_options,
+        )
         return cast(list[District], result) if result else None
 
     def get_district_by_id(self, session: Session, id: str) -> District | None:
@@ -103,14 +126,14 @@ class DistrictController(Repository):
         """
         try:
             search_lower = search_term.lower()
-            stmt = select(DistrictModel).where(
-                or_(
-                    DistrictModel.name.ilike(f'%{search_term}%'),
-                    DistrictModel.normalized_name.ilike(f'%{search_lower}%'),
-                )
-            ).limit(limit)
-            
-            objs = session.scalars(stmt).all()
+            objs = session.scalars(
+                _SEARCH_BY_NAME_STMT,
+                {
+                    'name_pattern': f'%{search_term}%',
+                    'normalized_pattern': f'%{search_lower}%',
+                    'limit': limit,
+                },
+            ).all()
             if len(objs) == 0:
                 return None
             return [District.model_validate(obj) for obj in objs]
@@ -160,10 +183,10 @@ class DistrictController(Repository):
             >>> district = controller.get_district_by_normalized_name(session, 'hoan kiem')
         """
         try:
-            stmt = select(DistrictModel).where(
-                DistrictModel.normalized_name == normalized_name.lower()
-            )
-            obj = session.scalars(stmt).first()
+            obj = session.scalars(
+                _BY_NORMALIZED_NAME_STMT,
+                {'normalized_name': normalized_name.lower()},
+            ).first()
             return District.model_validate(obj) if obj else None
         except Exception as e:
             logger.exception('Failed to get district by normalized name', 
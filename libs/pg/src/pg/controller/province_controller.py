@@ -7,11 +7,11 @@ the sun_assistant Repository pattern with utility functions.
 """
 
 from collections.abc import Sequence
-from functools import partial
-from typing import cast
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload
 
+from ..model import District as DistrictModel
 from ..model import Province as ProvinceModel
 from .repository import Repository
 from .schemas import Province
@@ -21,24 +21,40 @@ from .utils import _get_data_by_id
 from .utils import _insert
 from .utils import _update
 
-# Create a simple logger for this module
-# TODO: Replace with proper logger import when available
-class SimpleLogger:
-    def info(self, msg, **kwargs):
-        print(f"INFO: {msg}")
-    def debug(self, msg, **kwargs):
-        pass
-    def exception(self, msg, **kwargs):
-        print(f"ERROR: {msg}")
+from logger import get_logger
 
-logger = SimpleLogger()
+logger = get_logger(__name__)
 
-# Create partial functions with pre-filled logger and model/schema types
-_insert_method = partial(_insert, logger, ProvinceModel, Province)
-_update_method = partial(_update, logger, ProvinceModel, Province)
-_delete_method = partial(_delete, logger, ProvinceModel, Province)
-_get_method = partial(_get_data, logger, ProvinceModel, Province)
-_get_by_id_method = partial(_get_data_by_id, logger, ProvinceModel, Province)
+# Relationships touched when Province schemas are validated from ORM rows
+_PROVINCE_LOAD_OPTIONS = (
+    selectinload(ProvinceModel.districts).selectinload(DistrictModel.stats),
+)
+
+# Module-level wrappers with pre-filled logger and model/schema types
+def _insert_method(session: Session, model: Province) -> Province:
+    return _insert(logger, ProvinceModel, Province, session, model)
+
+
+def _update_method(session: Session, model: Province) -> Province | None:
+    return _update(logger, ProvinceModel, Province, session, model)
+
+
+def _delete_method(session: Session, id: str) -> Province | None:
+    return _delete(logger, ProvinceModel, Province, session, id)
+
+
+def _get_method(
+    session: Session,
+    filter: dict[str, object] | None = None,
+    order_by: Sequence | None = None,
+    limit: int | None = None,
+    load_options: Sequence | None = None,
+) -> list[Province] | None:
+    return _get_data(logger, ProvinceModel, Province, session, filter, order_by, limit, load_options)
+
+
+def _get_by_id_method(session: Session, id: str) -> Province | None:
+    return _get_data_by_id(logger, ProvinceModel, Province, session, id)
 
 
 class ProvinceController(Repository):
@@ -62,7 +78,7 @@ class ProvinceController(Repository):
             >>> province = Province(id='01', name='Hà Nội')
             >>> result = controller.insert_province(session, province)
         """
-        return cast(Province, _insert_method(session, model))
+        return _insert_method(session, model)
 
     def update_province(self, session: Session, model: Province) -> Province | None:
         """Update an existing province record.
@@ -78,8 +94,7 @@ class ProvinceController(Repository):
             >>> province = Province(id='01', name='Hà Nội Updated')
             >>> result = controller.update_province(session, province)
         """
-        result = _update_method(session, model)
-        return cast(Province, result) if result else None
+        return _update_method(session, model)
 
     def delete_province(self, session: Session, id: str) -> Province | None:
         """Delete a province by ID.
@@ -94,8 +109,7 @@ class ProvinceController(Repository):
         Example:
             >>> deleted = controller.delete_province(session, '01')
         """
-        result = _delete_method(session, id)
-        return cast(Province, result) if result else None
+        return _delete_method(session, id)
 
     def get_provinces(
         self,
@@ -103,6 +117,7 @@ class ProvinceController(Repository):
         filter: dict[str, object] | None = None,
         order_by: Sequence | None = None,
         limit: int | None = None,
+        load_options: Sequence | None = None,
     ) -> list[Province] | None:
         """Get provinces with optional filtering and ordering.
 
@@ -111,6 +126,8 @@ class ProvinceController(Repository):
             filter: Dictionary of filter conditions (e.g., {'name': 'Hà Nội'})
             order_by: Sequence of SQLAlchemy order_by clauses
             limit: Maximum number of results to return
+            load_options: Loader options to apply instead of the default
+                ``selectinload(Province.districts).selectinload(District.stats)``
 
         Returns:
             List of provinces matching criteria, or None if none found
@@ -122,8 +139,13 @@ class ProvinceController(Repository):
             >>> # Get provinces with limit
             >>> provinces = controller.get_provinces(session, limit=10)
         """
-        result = _get_method(session, filter, order_by, limit)
-        return cast(list[Province], result) if result else None
+        return _get_method(
+            session,
+            filter,
+            order_by,
+            limit,
+            _PROVINCE_LOAD_OPTIONS if load_options is None else load_options,
+        )
 
     def get_province_by_id(self, session: Session, id: str) -> Province | None:
         """Get a province by its ID.
@@ -138,5 +160,4 @@ class ProvinceController(Repository):
         Example:
             >>> province = controller.get_province_by_id(session, '01')
         """
-        result = _get_by_id_method(session, id)
-        return cast(Province, result) if result else None
+        return _get_by_id_method(session, id)
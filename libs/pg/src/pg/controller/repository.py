@@ -86,6 +86,7 @@ class Repository(ABC):
         filter: dict[str, object] | None = None,
         order_by: Sequence | None = None,
         limit: int | None = None,
+        load_options: Sequence | None = None,
     ) -> list[Province] | None:
         """Get provinces with optional filtering and ordering.
 
@@ -94,6 +95,7 @@ class Repository(ABC):
             filter: Dictionary of filter conditions
             order_by: Sequence of order_by clauses
             limit: Maximum number of results
+            load_options: Loader options overriding the default eager loading
 
         Returns:
             List of provinces, or None if none found
@@ -128,6 +130,7 @@ class Repository(ABC):
         filter: dict[str, object] | None = None,
         order_by: Sequence | None = None,
         limit: int | None = None,
+        load_options: Sequence | None = None,
     ) -> list[District] | None:
         """Get districts with optional filtering and ordering."""
         raise NotImplementedError()
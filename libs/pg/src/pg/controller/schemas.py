@@ -50,11 +50,15 @@ class DatabaseSchema(Identified, Dated):
 
     Combines Identified and Dated to provide both ID and timestamp fields.
     Configures Pydantic to work with SQLAlchemy ORM models.
+
+    Validators are built lazily (``defer_build``) on first validation, so
+    importing the module does not pay for schemas that are never used.
     """
 
     model_config = ConfigDict(
         from_attributes=True,  # Allow creating from SQLAlchemy models
         arbitrary_types_allowed=True,  # Allow complex types
+        defer_build=True,  # Build the core schema on first use
     )
 
 
@@ -187,12 +191,6 @@ class DistricStats(DatabaseSchema):
     )
 
 
-# Update forward references for relationships
-Province.model_rebuild()
-District.model_rebuild()
-DistricStats.model_rebuild()
-
-
 # ---------------------------------------------------------------------------
 # User / Conversation / Message schemas
 # ---------------------------------------------------------------------------
@@ -286,10 +284,3 @@ class Message(DatabaseSchema):
     question: str = Field(description='User question text')
     answer: str = Field(default='', description='Assistant answer text')
     additional_info: dict | None = Field(default=None, description='Additional JSON metadata')
-
-
-# Rebuild all models for forward references
-User.model_rebuild()
-UserAuthentication.model_rebuild()
-Conversation.model_rebuild()
-Message.model_rebuild()
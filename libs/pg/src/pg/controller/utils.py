@@ -8,13 +8,43 @@ operations to reduce boilerplate code in controller implementations.
 """
 
 from collections.abc import Sequence
+from functools import lru_cache
 
+from sqlalchemy import bindparam
+from sqlalchemy import Select
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..model import Base
 
 
+@lru_cache(maxsize=None)
+def _select_model(model_cls: type[Base]) -> Select:
+    """Return a shared ``select(model_cls)`` statement.
+
+    Statements are immutable, so one instance per model can be reused and
+    extended generatively; SQLAlchemy then memoizes its cache key instead of
+    rebuilding and re-hashing the statement on every call.
+    """
+    return select(model_cls)
+
+
+@lru_cache(maxsize=None)
+def _select_model_by_ids(model_cls: type[Base]) -> Select:
+    """Return a shared ``select(model_cls)`` filtered by an expanding ``ids`` parameter."""
+    return select(model_cls).where(model_cls.id.in_(bindparam('ids', expanding=True)))
+
+
+@lru_cache(maxsize=None)
+def _updatable_fields(data_cls: type) -> tuple[str, ...]:
+    """Return the field names of a Pydantic schema class, minus the primary key.
+
+    Resolved once per class so updates don't rebuild the instance ``__dict__``
+    view or re-check the key name on every call.
+    """
+    return tuple(name for name in data_cls.model_fields if name != 'id')
+
+
 def _insert(
     logger,
     model_cls: type[Base],
@@ -81,8 +111,9 @@ def _update(
     try:
         obj = session.get(model_cls, data.id)
         if obj:
-            for k, v in vars(data).items():
-                if v is not None and k != 'id':  # Don't update primary key
+            for k in _updatable_fields(type(data)):  # Primary key is never updated
+                v = getattr(data, k)
+                if v is not None:
                     setattr(obj, k, v)
 
             session.add(obj)
@@ -90,7 +121,7 @@ def _update(
             session.refresh(obj)
             return schema_cls.model_validate(obj)
         else:
-            logger.info(f'No {schema_cls.__name__} found with id: {data.id}')
+            logger.debug(f'No {schema_cls.__name__} found with id: {data.id}')
             return None
     except Exception as e:
         logger.exception('Failed to update data', extra={'model': model_cls.__name__, 'id': data.id, 'error': str(e)})
@@ -105,6 +136,7 @@ def _get_data(
     filter: dict[str, object] | None = None,
     order_by: Sequence | None = None,
     limit: int | None = None,
+    load_options: Sequence | None = None,
 ) -> list[any] | None:
     """Get arbitrary data with optional filtering, ordering, and limiting.
 
@@ -116,6 +148,8 @@ def _get_data(
         filter: Dictionary of filter conditions (column_name: value)
         order_by: Sequence of SQLAlchemy order_by clauses
         limit: Maximum number of results to return
+        load_options: Sequence of loader options (e.g. selectinload, joinedload,
+            raiseload) applied to the statement
 
     Returns:
         List of data as Pydantic schema instances, or None if no data found
@@ -128,14 +162,16 @@ def _get_data(
         ...                       filter={'province_id': '01'}, limit=10)
     """
     try:
-        statement = select(model_cls)
+        statement = _select_model(model_cls)
         if filter:
             statement = statement.filter_by(**filter)
         if order_by:
             statement = statement.order_by(*order_by)
         if limit:
             statement = statement.limit(limit)
-        
+        if load_options:
+            statement = statement.options(*load_options)
+
         objs = session.scalars(statement=statement).all()
         if len(objs) == 0:
             return None
@@ -213,7 +249,7 @@ def _delete(
             session.commit()
             return schema_cls.model_validate(obj)
         else:
-            logger.info(f'No {schema_cls.__name__} found with id: {id}')
+            logger.debug(f'No {schema_cls.__name__} found with id: {id}')
             return None
     except Exception as e:
         logger.exception('Failed to delete data', extra={'model': model_cls.__name__, 'id': id, 'error': str(e)})
@@ -247,8 +283,8 @@ def _get_data_by_ids(
         ...                              session, ['001', '002', '003'])
     """
     try:
-        statement = select(model_cls).where(model_cls.id.in_(ids))
-        objs = session.scalars(statement=statement).all()
+        statement = _select_model_by_ids(model_cls)
+        objs = session.scalars(statement=statement, params={'ids': ids}).all()
         if len(objs) == 0:
             return None
         return [schema_cls.model_validate(obj) for obj in objs]
@@ -12,6 +12,7 @@ from sqlalchemy import Text
 from sqlalchemy import Integer
 from sqlalchemy import Date
 from sqlalchemy import text
+from sqlalchemy import UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
@@ -26,7 +27,7 @@ class Base(DeclarativeBase):
 class Dated(Base):
     __abstract__ = True
 
-    created_at: Mapped[datetime] = mapped_column(insert_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[Optional[datetime]] = mapped_column(onupdate=func.now(), nullable=True)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
@@ -34,20 +35,21 @@ class Dated(Base):
 class Province(Base):
     __tablename__ = 'provinces'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Relationships
     districts: Mapped[list[District]] = relationship(
         back_populates='province',
         cascade='all, delete-orphan',
+        lazy='selectin',
     )
 
 
 class District(Dated):
     __tablename__ = 'districts'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     province_id: Mapped[str] = mapped_column(
         Text,
         ForeignKey('provinces.id', ondelete='CASCADE'),
@@ -59,6 +61,7 @@ class District(Dated):
 
     # Relationships
     province: Mapped[Province] = relationship(back_populates='districts')
+    # Not eager by default: this is the full time series; controllers selectinload it where needed
     stats: Mapped[list[DistricStats]] = relationship(
         back_populates='district',
         cascade='all, delete-orphan',
@@ -101,9 +104,14 @@ class DistricStats(Dated):
     # Indexes
     __table_args__ = (
         Index('idx_stats_date', 'date'),
-        Index('idx_stats_district', 'district_id'),
-        Index('idx_stats_component', 'component_id'),
-        Index('idx_stats_date_district', 'date', 'district_id'),
+        Index('idx_stats_district_component_date', 'district_id', 'component_id', 'date'),
+        Index('idx_stats_district_date_hour', 'district_id', 'date', 'hour'),
+        # hour is NULL for daily rows; NULLS NOT DISTINCT (PG15+) lets the upsert match them too
+        UniqueConstraint(
+            'district_id', 'date', 'hour', 'component_id',
+            name='uq_distric_stats_key',
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
 
@@ -115,7 +123,7 @@ class DistricStats(Dated):
 class User(Dated):
     __tablename__ = 'user'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     full_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     email: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     dob: Mapped[Optional[datetime]] = mapped_column(nullable=True)
@@ -143,7 +151,7 @@ class User(Dated):
 class UserAuthentication(Dated):
     __tablename__ = 'user_authentications'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     user_id: Mapped[str] = mapped_column(
         Text,
         ForeignKey('user.id', ondelete='CASCADE'),
@@ -166,7 +174,7 @@ class UserAuthentication(Dated):
 class Conversation(Dated):
     __tablename__ = 'conversation'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     user_id: Mapped[str] = mapped_column(
         Text,
         ForeignKey('user.id', ondelete='CASCADE'),
@@ -197,7 +205,7 @@ class Conversation(Dated):
 class Message(Dated):
     __tablename__ = 'message'
 
-    id: Mapped[str] = mapped_column(Text, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
     conversation_id: Mapped[str] = mapped_column(
         Text,
         ForeignKey('conversation.id', ondelete='CASCADE'),
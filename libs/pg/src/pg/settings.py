@@ -18,6 +18,11 @@ class PostgresSettings(BaseModel):
         host (str): Database host address
         port (int): Database port (default: 5432)
         db (str): Database name
+        pool_size (int): Persistent connections kept in the engine pool
+        max_overflow (int): Extra connections allowed beyond pool_size under burst
+        pool_recycle (int): Seconds after which a pooled connection is replaced
+        pool_pre_ping (bool): Test connections for liveness on checkout
+        pool_use_lifo (bool): Reuse the most recently returned connection first
     """
 
     username: str = Field(
@@ -37,3 +42,23 @@ class PostgresSettings(BaseModel):
     db: str = Field(
         description='Database name',
     )
+    pool_size: int = Field(
+        default=20,
+        description='Number of persistent connections kept in the pool',
+    )
+    max_overflow: int = Field(
+        default=30,
+        description='Extra connections allowed beyond pool_size',
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        description='Seconds after which a pooled connection is recycled',
+    )
+    pool_pre_ping: bool = Field(
+        default=True,
+        description='Verify connections before handing them out',
+    )
+    pool_use_lifo: bool = Field(
+        default=True,
+        description='Hand out the most recently used connection first so idle ones can time out',
+    )
@@ -119,6 +119,9 @@ def import_distric_stats(cur):
                 """
                 INSERT INTO distric_stats (district_id, date, hour, component_id, aqi_value, pm25_value, created_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (district_id, date, hour, component_id) DO UPDATE SET
+                    aqi_value = EXCLUDED.aqi_value,
+                    pm25_value = EXCLUDED.pm25_value
                 """,
                 (
                     row["district_id"],
@@ -147,6 +150,9 @@ def import_current_aqi(cur):
                 """
                 INSERT INTO distric_stats (district_id, date, hour, component_id, aqi_value, pm25_value, created_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (district_id, date, hour, component_id) DO UPDATE SET
+                    aqi_value = EXCLUDED.aqi_value,
+                    pm25_value = EXCLUDED.pm25_value
                 """,
                 (
                     row["district_id"],
@@ -176,6 +182,9 @@ def import_forecast(cur):
                 """
                 INSERT INTO distric_stats (district_id, date, hour, component_id, aqi_value, pm25_value, created_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (district_id, date, hour, component_id) DO UPDATE SET
+                    aqi_value = EXCLUDED.aqi_value,
+                    pm25_value = EXCLUDED.pm25_value
                 """,
                 (
                     row["district_id"],
@@ -217,6 +226,9 @@ def import_hanoiair_data(cur):
                 """
                 INSERT INTO distric_stats (district_id, date, hour, component_id, aqi_value, pm25_value, created_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (district_id, date, hour, component_id) DO UPDATE SET
+                    aqi_value = EXCLUDED.aqi_value,
+                    pm25_value = EXCLUDED.pm25_value
                 """,
                 (
                     district_id,
@@ -1,32 +1,112 @@
 #!/usr/bin/env python3
 """
 Script import dữ liệu từ CSV vào PostgreSQL
+
+Dùng psycopg 3 (psycopg[binary], khai báo trong pyproject.toml gốc; cài bằng `uv sync`)
 """
 
-import psycopg2
-from psycopg2.extras import execute_batch
+import psycopg
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
 import os
 
 DB_CONFIG = {
     'host': 'localhost',
     'port': 5432,
-    'database': 'hanoiair_db',
+    'dbname': 'hanoiair_db',
     'user': 'hanoiair_user',
     'password': 'hanoiair_pass'
 }
 
+# Số dòng CSV đọc và ghi mỗi lần, giữ bộ nhớ cố định bất kể kích thước file
+BATCH_SIZE = 5000
+
+# Số process import song song cho các bảng phụ thuộc districts
+MAX_WORKERS = 4
+
 def connect_db():
     """Kết nối đến PostgreSQL"""
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        conn = psycopg.connect(**DB_CONFIG)
         print("✅ Kết nối database thành công")
         return conn
     except Exception as e:
         print(f"❌ Lỗi kết nối: {e}")
         return None
 
+def iter_batches(reader, size=BATCH_SIZE):
+    """Đọc lần lượt từng lô tối đa `size` dòng từ csv.reader"""
+    while True:
+        batch = list(islice(reader, size))
+        if not batch:
+            return
+        yield batch
+
+def column_index(header):
+    """Map tên cột -> vị trí trong dòng CSV"""
+    return {name: i for i, name in enumerate(header)}
+
+def build_converter(header, fields):
+    """Sinh một lần hàm chuyển dòng CSV -> tuple giá trị insert từ header.
+
+    `fields` là danh sách (kiểu, cột) theo đúng thứ tự tham số trong câu INSERT.
+    Kiểu: 'str' (giữ nguyên chuỗi CSV) hoặc 'const' (giá trị cố định, `cột`
+    chính là giá trị đó). Vị trí cột được nhúng thẳng vào mã sinh ra nên mỗi
+    dòng không còn tra dict. Việc ép kiểu số/ngày do PostgreSQL làm qua cast
+    trong câu SQL (vd. NULLIF(%s, '')::numeric), không làm phía Python.
+    """
+    col = column_index(header)
+    parts = []
+    for kind, name in fields:
+        if kind == 'const':
+            parts.append(repr(name))
+        elif kind == 'str':
+            parts.append(f"r[{col[name]}]")
+        else:
+            raise ValueError(f"Kiểu cột không hợp lệ: {kind}")
+    namespace = {}
+    exec(f"def convert(r):\n    return ({', '.join(parts)},)", namespace)
+    return namespace['convert']
+
+def read_converter(reader, filename, fields):
+    """Đọc header của file và sinh hàm chuyển dòng; trả về None nếu file rỗng"""
+    header = next(reader, None)
+    if not header:
+        print(f"⚠️  File {filename} rỗng, bỏ qua")
+        return None
+    return build_converter(header, fields)
+
+def write_batch(conn, cursor, sql, convert, batch):
+    """Ghi một lô dòng CSV, trả về số dòng đã ghi.
+
+    Cả lô chạy trong một savepoint. Nếu lô lỗi, ghi lại từng dòng trong
+    savepoint riêng để chỉ bỏ qua (và log) các dòng hỏng thay vì hủy cả file.
+    Dòng thiếu cột được bỏ qua ngay khi chuyển đổi.
+    """
+    rows = []
+    for r in batch:
+        try:
+            rows.append(convert(r))
+        except IndexError:
+            print(f"⚠️  Bỏ qua dòng thiếu cột: {r}")
+    try:
+        with conn.transaction():
+            cursor.executemany(sql, rows)
+        return len(rows)
+    except psycopg.Error:
+        pass
+    count = 0
+    for row in rows:
+        try:
+            with conn.transaction():
+                cursor.execute(sql, row)
+            count += 1
+        except psycopg.Error as e:
+            print(f"⚠️  Bỏ qua dòng lỗi {row}: {e}")
+    return count
+
 def import_districts(conn, filename='districts.csv'):
     """Import dữ liệu districts"""
     if not os.path.exists(filename):
@@ -36,25 +116,24 @@ def import_districts(conn, filename='districts.csv'):
     cursor = conn.cursor()
     count = 0
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        convert = read_converter(reader, filename, [
+            ('str', 'internal_id'), ('str', 'name'), ('str', 'type'), ('const', '12'),
+        ])
+        if convert is None:
+            return 0
         
-        for row in rows:
-            try:
-                cursor.execute("""
-                    INSERT INTO districts (internal_id, name, type, province_id)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (internal_id) DO UPDATE SET
-                        name = EXCLUDED.name,
-                        type = EXCLUDED.type
-                """, (row['internal_id'], row['name'], row['type'], '12'))
-                count += 1
-            except Exception as e:
-                print(f"  ⚠️  Lỗi insert {row['name']}: {e}")
-    
-    conn.commit()
-    print(f"✅ Import {count}/{len(rows)} districts")
+        for batch in iter_batches(reader):
+            count += write_batch(conn, cursor, """
+                INSERT INTO districts (internal_id, name, type, province_id)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (internal_id) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    type = EXCLUDED.type
+            """, convert, batch)
+    
+    print(f"✅ Import {count} districts")
     return count
 
 def import_current_aqi(conn, filename='current_aqi.csv'):
@@ -66,32 +145,25 @@ def import_current_aqi(conn, filename='current_aqi.csv'):
     cursor = conn.cursor()
     count = 0
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        convert = read_converter(reader, filename, [
+            ('str', 'district_id'), ('str', 'date'), ('str', 'date'),
+            ('str', 'aqi_value'), ('str', 'component'),
+        ])
+        if convert is None:
+            return 0
         
-        for row in rows:
-            try:
-                measurement_time = f"{row['date']} 00:00:00"
-                cursor.execute("""
-                    INSERT INTO current_aqi 
-                    (district_internal_id, measurement_date, measurement_time, aqi_value, component_id)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (district_internal_id, measurement_time, component_id) DO UPDATE SET
-                        aqi_value = EXCLUDED.aqi_value
-                """, (
-                    row['district_id'], 
-                    row['date'], 
-                    measurement_time,
-                    float(row['aqi_value']) if row['aqi_value'] else None,
-                    row['component']
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  ⚠️  Lỗi insert AQI: {e}")
-    
-    conn.commit()
-    print(f"✅ Import {count}/{len(rows)} current AQI records")
+        for batch in iter_batches(reader):
+            count += write_batch(conn, cursor, """
+                INSERT INTO current_aqi 
+                (district_internal_id, measurement_date, measurement_time, aqi_value, component_id)
+                VALUES (%s, %s::date, %s::timestamp, NULLIF(%s, '')::numeric, %s)
+                ON CONFLICT (district_internal_id, measurement_time, component_id) DO UPDATE SET
+                    aqi_value = EXCLUDED.aqi_value
+            """, convert, batch)
+    
+    print(f"✅ Import {count} current AQI records")
     return count
 
 def import_rankings(conn, filename='rankings.csv'):
@@ -103,33 +175,27 @@ def import_rankings(conn, filename='rankings.csv'):
     cursor = conn.cursor()
     count = 0
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        convert = read_converter(reader, filename, [
+            ('str', 'administrative_id'), ('str', 'date'), ('str', 'rank'),
+            ('str', 'aqi_avg'), ('str', 'aqi_prev'),
+        ])
+        if convert is None:
+            return 0
         
-        for row in rows:
-            try:
-                cursor.execute("""
-                    INSERT INTO aqi_rankings 
-                    (district_admin_id, ranking_date, rank, aqi_avg, aqi_prev)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (district_admin_id, ranking_date, component_id) DO UPDATE SET
-                        rank = EXCLUDED.rank,
-                        aqi_avg = EXCLUDED.aqi_avg,
-                        aqi_prev = EXCLUDED.aqi_prev
-                """, (
-                    row['administrative_id'],
-                    row['date'],
-                    int(row['rank']) if row['rank'] else None,
-                    float(row['aqi_avg']) if row['aqi_avg'] else None,
-                    float(row['aqi_prev']) if row['aqi_prev'] else None
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  ⚠️  Lỗi insert ranking: {e}")
-    
-    conn.commit()
-    print(f"✅ Import {count}/{len(rows)} rankings")
+        for batch in iter_batches(reader):
+            count += write_batch(conn, cursor, """
+                INSERT INTO aqi_rankings 
+                (district_admin_id, ranking_date, rank, aqi_avg, aqi_prev)
+                VALUES (%s, %s::date, NULLIF(%s, '')::integer, NULLIF(%s, '')::numeric, NULLIF(%s, '')::numeric)
+                ON CONFLICT (district_admin_id, ranking_date, component_id) DO UPDATE SET
+                    rank = EXCLUDED.rank,
+                    aqi_avg = EXCLUDED.aqi_avg,
+                    aqi_prev = EXCLUDED.aqi_prev
+            """, convert, batch)
+    
+    print(f"✅ Import {count} rankings")
     return count
 
 def import_forecast(conn, filename='forecast.csv'):
@@ -144,34 +210,27 @@ def import_forecast(conn, filename='forecast.csv'):
     # Lấy base_date từ dữ liệu (ngày crawl)
     base_date = datetime.now().strftime('%Y-%m-%d')
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        convert = read_converter(reader, filename, [
+            ('str', 'district_id'), ('str', 'date'), ('const', base_date),
+            ('str', 'pm25_value'), ('str', 'aqi_value'), ('str', 'component'),
+        ])
+        if convert is None:
+            return 0
         
-        for row in rows:
-            try:
-                cursor.execute("""
-                    INSERT INTO forecast_data 
-                    (district_internal_id, forecast_date, base_date, pm25_value, aqi_value, component)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (district_internal_id, forecast_date, component) DO UPDATE SET
-                        pm25_value = EXCLUDED.pm25_value,
-                        aqi_value = EXCLUDED.aqi_value,
-                        base_date = EXCLUDED.base_date
-                """, (
-                    row['district_id'],
-                    row['date'],
-                    base_date,
-                    float(row['pm25_value']) if row['pm25_value'] else None,
-                    float(row['aqi_value']) if row['aqi_value'] else None,
-                    row['component']
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  ⚠️  Lỗi insert forecast: {e}")
-    
-    conn.commit()
-    print(f"✅ Import {count}/{len(rows)} forecast records")
+        for batch in iter_batches(reader):
+            count += write_batch(conn, cursor, """
+                INSERT INTO forecast_data 
+                (district_internal_id, forecast_date, base_date, pm25_value, aqi_value, component)
+                VALUES (%s, %s::date, %s::date, NULLIF(%s, '')::numeric, NULLIF(%s, '')::numeric, %s)
+                ON CONFLICT (district_internal_id, forecast_date, component) DO UPDATE SET
+                    pm25_value = EXCLUDED.pm25_value,
+                    aqi_value = EXCLUDED.aqi_value,
+                    base_date = EXCLUDED.base_date
+            """, convert, batch)
+    
+    print(f"✅ Import {count} forecast records")
     return count
 
 def import_historical(conn, filename='historical.csv'):
@@ -183,61 +242,71 @@ def import_historical(conn, filename='historical.csv'):
     cursor = conn.cursor()
     count = 0
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        convert = read_converter(reader, filename, [
+            ('str', 'province_id'), ('str', 'date'),
+            ('str', 'pm25_value'), ('str', 'aqi_value'), ('str', 'component'),
+        ])
+        if convert is None:
+            return 0
         
-        for row in rows:
-            try:
-                cursor.execute("""
-                    INSERT INTO historical_data 
-                    (province_id, measurement_date, pm25_value, aqi_value, component)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (province_id, measurement_date, component) DO UPDATE SET
-                        pm25_value = EXCLUDED.pm25_value,
-                        aqi_value = EXCLUDED.aqi_value
-                """, (
-                    row['province_id'],
-                    row['date'],
-                    float(row['pm25_value']) if row['pm25_value'] else None,
-                    float(row['aqi_value']) if row['aqi_value'] else None,
-                    row['component']
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  ⚠️  Lỗi insert historical: {e}")
-    
-    conn.commit()
-    print(f"✅ Import {count}/{len(rows)} historical records")
+        for batch in iter_batches(reader):
+            count += write_batch(conn, cursor, """
+                INSERT INTO historical_data 
+                (province_id, measurement_date, pm25_value, aqi_value, component)
+                VALUES (%s, %s::date, NULLIF(%s, '')::numeric, NULLIF(%s, '')::numeric, %s)
+                ON CONFLICT (province_id, measurement_date, component) DO UPDATE SET
+                    pm25_value = EXCLUDED.pm25_value,
+                    aqi_value = EXCLUDED.aqi_value
+            """, convert, batch)
+    
+    print(f"✅ Import {count} historical records")
     return count
 
+def run_import(import_fn, filename):
+    """Chạy một import trên connection riêng (mỗi process một connection).
+
+    Mỗi import là một transaction; dữ liệu có thể import lại (ON CONFLICT) nên
+    không cần chờ fsync WAL khi commit.
+    """
+    conn = connect_db()
+    if not conn:
+        raise RuntimeError("Không thể kết nối database")
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+        count = import_fn(conn, filename)
+        conn.commit()
+        return count
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
 def main():
     print("=" * 70)
     print("📥 BẮT ĐẦU IMPORT DỮ LIỆU VÀO POSTGRESQL")
     print("=" * 70)
     
-    conn = connect_db()
-    if not conn:
-        print("❌ Không thể kết nối database")
-        return
-    
     try:
         total = 0
         
+        # Đợt 1: districts phải có trước vì các bảng còn lại tham chiếu tới nó
         print("\n📍 Bước 1: Import districts...")
-        total += import_districts(conn)
-        
-        print("\n📊 Bước 2: Import current AQI...")
-        total += import_current_aqi(conn)
-        
-        print("\n🏆 Bước 3: Import rankings...")
-        total += import_rankings(conn)
+        total += run_import(import_districts, 'districts.csv')
         
-        print("\n🔮 Bước 4: Import forecast data...")
-        total += import_forecast(conn)
-        
-        print("\n📈 Bước 5: Import historical data...")
-        total += import_historical(conn)
+        # Đợt 2: các bảng còn lại độc lập với nhau, import song song
+        print("\n📊 Bước 2: Import current AQI, rankings, forecast, historical song song...")
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(run_import, import_current_aqi, 'current_aqi.csv'),
+                executor.submit(run_import, import_rankings, 'rankings.csv'),
+                executor.submit(run_import, import_forecast, 'forecast.csv'),
+                executor.submit(run_import, import_historical, 'historical.csv'),
+            ]
+            total += sum(future.result() for future in futures)
         
         print("\n" + "=" * 70)
         print(f"✅ HOÀN THÀNH! Đã import tổng cộng {total} records")
@@ -245,10 +314,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Lỗi: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
-        print("🔒 Đã đóng kết nối database")
 
 if __name__ == "__main__":
     main()
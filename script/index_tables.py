@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from lite_llm import LiteLLMService
 from lite_llm import LiteLLMSetting
 from opensearch import OpenSearchService
 from opensearch import OpenSearchSettings
+from redis import Redis  # type: ignore[import-untyped]
+from aqi_agent.domain.table_pruner import clear_exact_cache
+from aqi_agent.domain.table_pruner.modules.table_indexer import EmbeddingCache
 from aqi_agent.domain.table_pruner.service import TableIndexerInput
 from aqi_agent.domain.table_pruner.service import TableIndexerService
 from aqi_agent.shared.settings.table_pruner import TablePrunerSettings
@@ -69,6 +72,30 @@ def parse_args() -> argparse.Namespace:
         default=int(os.getenv('LITELLM__DIMENSIONS', '1536')),
         help='Embedding vector dimensions (default: 1536)',
     )
+    parser.add_argument(
+        '--embedding-data-type',
+        choices=['byte', 'float'],
+        default=os.getenv('TABLE_PRUNER__EMBEDDING_DATA_TYPE', 'byte'),
+        help='knn_vector data type; byte stores int8-quantized vectors (default: byte)',
+    )
+    parser.add_argument(
+        '--embedding-batch-size',
+        type=int,
+        default=64,
+        help='Number of table descriptions embedded per request (default: 64)',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=int(os.getenv('TABLE_PRUNER__CONCURRENCY', '8')),
+        help='Number of threads sending bulk indexing requests (default: 8)',
+    )
+    parser.add_argument(
+        '--embedding-cache-path',
+        type=str,
+        default=os.getenv('TABLE_PRUNER__EMBEDDING_CACHE_PATH', '~/.cache/aqi_agent/emb.db'),
+        help='SQLite file caching description embeddings (default: ~/.cache/aqi_agent/emb.db)',
+    )
     return parser.parse_args()
 
 
@@ -115,12 +142,15 @@ async def main(args: argparse.Namespace) -> None:
         knn_size=args.knn_size,
         model=args.model,
         max_completion_tokens=args.max_completion_tokens,
+        embedding_data_type=args.embedding_data_type,
     )
 
+    embedding_cache = EmbeddingCache(args.embedding_cache_path)
     table_indexer = TableIndexerService(
         litellm_service=litellm_service,
         opensearch_service=opensearch_service,
         settings=table_pruner_settings,
+        embedding_cache=embedding_cache,
     )
 
     # ── Load MDL ──────────────────────────────────────────────────────────────
@@ -133,21 +163,30 @@ async def main(args: argparse.Namespace) -> None:
         print(f'❌ MDL file not found: {mdl_path}')
         raise FileNotFoundError(f'MDL file not found: {mdl_path}')
 
-    with open(mdl_path) as f:
-        mdl = json.load(f)
+    mdl = orjson.loads(mdl_path.read_bytes())
 
     print(f'📄 Loaded MDL from: {mdl_path}')
     print(f'📊 Models found   : {[m["name"] for m in mdl["models"]]}')
 
     # ── Build index body & search pipeline body ───────────────────────────────
+    # Bulk-load settings: no periodic refresh, async translog, no replicas.
+    # Restored to serving values once indexing is done.
     index_body = {
-        'settings': {'index.knn': True},
+        'settings': {
+            'index.knn': True,
+            'refresh_interval': '-1',
+            'translog.durability': 'async',
+            'translog.sync_interval': '30s',
+            'translog.flush_threshold_size': '1gb',
+            'number_of_replicas': 0,
+        },
         'mappings': {
             'properties': {
                 'text': {'type': 'text'},
                 'embedding': {
                     'type': 'knn_vector',
                     'dimension': args.dimensions,
+                    'data_type': args.embedding_data_type,
                     'method': {
                         'name': 'hnsw',
                         'space_type': 'cosinesimil',
@@ -175,13 +214,41 @@ async def main(args: argparse.Namespace) -> None:
 
     # ── Run via process() ─────────────────────────────────────────────────────
     print(f'\n📥 Indexing {len(mdl["models"])} table(s) into OpenSearch...')
-    output = await table_indexer.process(
-        inputs=TableIndexerInput(
-            index_body=index_body,
-            search_pipeline_body=search_pipeline_body,
-            mdl=mdl,
-        ),
+    try:
+        output = await table_indexer.process(
+            inputs=TableIndexerInput(
+                index_body=index_body,
+                search_pipeline_body=search_pipeline_body,
+                mdl=mdl,
+                embedding_batch_size=args.embedding_batch_size,
+                concurrency=args.concurrency,
+            ),
+        )
+    finally:
+        await litellm_service.aclose()
+        embedding_cache.close()
+        # Restore serving settings even if the bulk load failed part-way
+        if opensearch_service.client.indices.exists(index=args.index_name):
+            opensearch_service.client.indices.put_settings(
+                index=args.index_name,
+                body={'index': {'refresh_interval': '5s', 'translog.durability': 'request'}},
+            )
+            opensearch_service.client.indices.refresh(index=args.index_name)
+
+    # ── Invalidate cached pruning results built from the previous index ───────
+    redis_client = Redis(
+        host=os.getenv('REDIS__HOST', 'localhost'),
+        port=int(os.getenv('REDIS__PORT', '6379')),
+        db=int(os.getenv('REDIS__DB', '0')),
+        password=os.getenv('REDIS__PASSWORD') or None,
     )
+    try:
+        deleted = clear_exact_cache(redis_client)
+        print(f'🧹 Cleared {deleted} cached table pruner result(s)')
+    except Exception as e:
+        print(f'⚠️  Could not clear the table pruner cache in Redis: {e}')
+    finally:
+        redis_client.close()
 
     if output.success:
         print('✅ Table indexing completed successfully!')
@@ -190,4 +257,10 @@ async def main(args: argparse.Namespace) -> None:
 
 
 if __name__ == '__main__':
-    asyncio.run(main(parse_args()))
+    try:
+        # uvloop ships with uvicorn[standard] on POSIX; fall back to the stdlib loop elsewhere
+        import uvloop
+    except ImportError:
+        asyncio.run(main(parse_args()))
+    else:
+        uvloop.run(main(parse_args()))
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
 
 import uvicorn
 from asgi_correlation_id import CorrelationIdMiddleware
 from aqi_agent.api.helpers import LoggingMiddleware
 from aqi_agent.api.routers.manager import api_router
+from aqi_agent.application import AQIAgentApplication
 from aqi_agent.shared.resources import Resources
 from aqi_agent.shared.utils import get_settings
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from lite_llm import LiteLLMService
 from logger import get_logger
 from logger import setup_logging
@@ -23,6 +27,20 @@ logger = get_logger('api')
 settings = get_settings()
 
 
+async def _warm_up(resources: Resources) -> None:
+    """Open shared clients and pools so the first request does not pay for their setup."""
+    _ = resources.opensearch_service.client
+    try:
+        # Creates the engine (and any missing tables) off the event loop
+        await asyncio.to_thread(lambda: resources.sql_database.sessionmaker)
+    except Exception as e:
+        logger.warning('Database warm-up failed', extra={'error': str(e)})
+    try:
+        await resources.litellm_service.check_health()
+    except Exception as e:
+        logger.warning('LiteLLM warm-up failed', extra={'error': str(e)})
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app.state.resources = Resources(
@@ -36,6 +54,11 @@ async def lifespan(app: FastAPI):
             host=settings.postgres.host,
             port=settings.postgres.port,
             db=settings.postgres.db,
+            pool_size=settings.postgres.pool_size,
+            max_overflow=settings.postgres.max_overflow,
+            pool_recycle=settings.postgres.pool_recycle,
+            pool_pre_ping=settings.postgres.pool_pre_ping,
+            pool_use_lifo=settings.postgres.pool_use_lifo,
         ),
         opensearch_service=OpenSearchService(
             settings=settings.opensearch,
@@ -48,13 +71,26 @@ async def lifespan(app: FastAPI):
             ssl=settings.redis.ssl,
         ),
     )
-    yield
+    # Built once so the LangGraph graph is compiled at startup, not per request
+    app.state.aqi_agent_application = AQIAgentApplication(
+        resources=app.state.resources,
+    )
+    resources = app.state.resources
+    async with AsyncExitStack() as stack:
+        # Release the shared pools on shutdown; every service borrows these through Resources.
+        # Callbacks run in reverse order, and each one runs even if the app or an earlier close raised
+        stack.callback(resources.redis_client.close)
+        stack.callback(resources.sql_database.close)
+        stack.push_async_callback(resources.litellm_service.aclose)
+        await _warm_up(resources)
+        yield
 
 
 app = FastAPI(
     title='AQI Agent API - Air Quality Data Assistant',
     version='1.0',
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
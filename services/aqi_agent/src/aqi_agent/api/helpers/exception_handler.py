@@ -3,9 +3,12 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Optional
 
+import orjson
 from base import BaseModel
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import Response
+from pydantic import BaseModel as PydanticBaseModel
 
 
 class ResponseMessage(str, Enum):
@@ -19,6 +22,9 @@ class ResponseMessage(str, Enum):
     UNAUTHORIZED = 'Unauthorized !!!'
 
 
+_SUCCESS_MESSAGE_JSON = orjson.dumps(ResponseMessage.SUCCESS.value)
+
+
 class ExceptionHandler(BaseModel):
     logger: Any
     service_name: str
@@ -31,14 +37,14 @@ class ExceptionHandler(BaseModel):
         message: str,
         data: Optional[dict] = None,
         status_code: int = status.HTTP_200_OK,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         response_data = {'message': message}
         if data:
             response_data.update(data)
 
-        return JSONResponse(content=response_data, status_code=status_code)
+        return ORJSONResponse(content=response_data, status_code=status_code)
 
-    def handle_exception(self, e: str, extra: dict) -> JSONResponse:
+    def handle_exception(self, e: str, extra: dict) -> ORJSONResponse:
         self.logger.exception(e, extra=extra)
 
         return self._create_response(
@@ -46,7 +52,7 @@ class ExceptionHandler(BaseModel):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
-    def handle_not_found_error(self, message: str, extra: dict) -> JSONResponse:
+    def handle_not_found_error(self, message: str, extra: dict) -> ORJSONResponse:
         self.logger.error(
             message,
             extra=extra,
@@ -57,7 +63,7 @@ class ExceptionHandler(BaseModel):
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    def handle_success(self, output: dict) -> JSONResponse:
+    def handle_success(self, output: dict) -> ORJSONResponse:
         data = {'info': output}
 
         return self._create_response(
@@ -66,7 +72,24 @@ class ExceptionHandler(BaseModel):
             status_code=status.HTTP_200_OK,
         )
 
-    def handle_bad_request(self, message: str, extra: dict) -> JSONResponse:
+    def handle_success_model(self, output: PydanticBaseModel) -> Response:
+        """Build the success envelope around a Pydantic output in one pass.
+
+        The output is serialized straight to JSON bytes by pydantic-core
+        (``model_dump_json``) instead of going through ``jsonable_encoder``
+        and ``json.dumps``, which build and walk an intermediate dict.
+        """
+        body = b'{"message":%s,"info":%s}' % (
+            _SUCCESS_MESSAGE_JSON,
+            output.model_dump_json().encode(),
+        )
+        return Response(
+            content=body,
+            media_type='application/json',
+            status_code=status.HTTP_200_OK,
+        )
+
+    def handle_bad_request(self, message: str, extra: dict) -> ORJSONResponse:
         self.logger.error(
             message,
             extra=extra,
@@ -76,7 +99,7 @@ class ExceptionHandler(BaseModel):
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    def handle_unprocessable_entity(self, message: str, extra: dict) -> JSONResponse:
+    def handle_unprocessable_entity(self, message: str, extra: dict) -> ORJSONResponse:
         self.logger.error(
             message,
             extra=extra,
@@ -86,14 +109,14 @@ class ExceptionHandler(BaseModel):
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    def handle_rate_limit_exceeded(self, message: str, extra: dict) -> JSONResponse:
+    def handle_rate_limit_exceeded(self, message: str, extra: dict) -> ORJSONResponse:
         self.logger.warning('Rate limit exceeded', extra=extra)
         return self._create_response(
             ResponseMessage.RATE_LIMIT_EXCEEDED.value,
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         )
 
-    def handle_unauthorized_error(self, message: str, extra: dict) -> JSONResponse:
+    def handle_unauthorized_error(self, message: str, extra: dict) -> ORJSONResponse:
         self.logger.warning(
             message,
             extra=extra,
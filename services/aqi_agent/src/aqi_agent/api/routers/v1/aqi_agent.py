@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import time
+from time import perf_counter
 
 from aqi_agent.api.helpers.exception_handler import ExceptionHandler
-from aqi_agent.application.service import AQIAgentApplication
 from aqi_agent.application.service import AQIAgentInput
 from aqi_agent.application.service import AQIAgentOutput
 from aqi_agent.shared.exception import UnauthorizedException
 from aqi_agent.shared.exception import ValidationException
+from aqi_agent.shared.utils import get_aqi_agent_application
 from aqi_agent.shared.utils import get_resources
 from aqi_agent.shared.utils import get_settings
 from fastapi import APIRouter
 from fastapi import BackgroundTasks
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from logger import get_logger
 
 aqi_agent_router = APIRouter()
@@ -30,7 +29,7 @@ async def aqi_agent(
     request: Request,
     background_tasks: BackgroundTasks,
     inputs: AQIAgentInput,
-) -> JSONResponse:
+) -> Response:
 
     exception_handler = ExceptionHandler(
         logger=logger.bind(),
@@ -39,9 +38,7 @@ async def aqi_agent(
 
     try:
         resources = get_resources(request)
-        aqi_agent_application = AQIAgentApplication(
-            resources=resources,
-        )
+        aqi_agent_application = get_aqi_agent_application(request)
     except Exception as e:
         return exception_handler.handle_exception(
             e=f'Error during application initialization: {e!s}',
@@ -83,12 +80,12 @@ async def aqi_agent(
         )
 
     try:
-        start_time = time.time()
+        start_time = perf_counter()
         aqi_agent_response = await aqi_agent_application.process(
             inputs=inputs,
             background_tasks=background_tasks,
         )
-        end_time = time.time()
+        end_time = perf_counter()
 
         logger.info(
             'AQI Agent request processed',
@@ -116,8 +113,4 @@ async def aqi_agent(
             },
         )
 
-    return exception_handler.handle_success(
-        jsonable_encoder(
-            aqi_agent_response,
-        ),
-    )
+    return exception_handler.handle_success_model(aqi_agent_response)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 from typing import List
 from typing import Literal
@@ -34,9 +35,7 @@ from aqi_agent.shared.models.state import SQLGeneratorState
 from aqi_agent.shared.models.state import SQLValidatorState
 from aqi_agent.shared.models.state import TablePrunerState
 from aqi_agent.shared.resources import Resources
-from easydict import EasyDict
 from fastapi import BackgroundTasks
-from fastapi.encoders import jsonable_encoder
 from langgraph.graph import END
 from langgraph.graph import START
 from langgraph.graph import StateGraph
@@ -46,6 +45,78 @@ from logger import get_logger
 logger = get_logger(__name__)
 
 
+# Graph routing functions are stateless, so they live at module scope
+# instead of being re-created on every graph compilation.
+def _rephrase_question_route(
+    state: ChatwithDBState,
+) -> List[Literal['table_pruner', 'retrieve_example', 'human_intervent']]:
+    if state.get('rephrased_state', {}).get('need_context', False):
+        return ['table_pruner', 'retrieve_example']
+    return ['human_intervent']
+
+
+def _answer_cache_route(
+    state: ChatwithDBState,
+) -> List[Literal['table_pruner', 'retrieve_example', 'human_intervent', 'end']]:
+    if state.get('answer_generator_state', {}).get('from_cache', False):
+        return ['end']
+    return _rephrase_question_route(state)
+
+
+def _interrupt_router(
+    state: ChatwithDBState,
+) -> Literal['rephrase_question', 'end']:
+    if not state.get('interrupt', False):
+        return 'rephrase_question'
+    return 'end'
+
+
+def _generate_mode_route(state: ChatwithDBState) -> str:
+    if state.get('example_retrieval_state', {}).get('examples', []):
+        logger.info(
+            'Found %d examples, proceeding to Match and Generate pipeline.',
+            len(state.get('example_retrieval_state', {}).get('examples', [])),
+        )
+        return 'match_sql_generator'
+    elif state.get('table_pruner_state', {}).get('pruned_schema', ''):
+        logger.info('No examples found but pruned schema is available, proceeding to Think and Generate pipeline.')
+        return 'planner'
+
+    logger.warning('No examples and no pruned schema found, proceeding to human intervention for clarification.')
+    return 'human_intervent'
+
+
+def _planner_route(
+    state: ChatwithDBState,
+) -> Literal['mismatch_sql_generator', 'human_intervent']:
+    if state.get('planner_state', {}).get('requires_clarification', False):
+        return 'human_intervent'
+    return 'mismatch_sql_generator'
+
+
+def _route_sql_validator(
+    state: ChatwithDBState,
+) -> Literal['sql_execution_handler', 'human_intervent']:
+    if state.get('sql_validator_state', {}).get('is_valid', False):
+        return 'sql_execution_handler'
+    return 'human_intervent'
+
+
+def _route_sql_execution(
+    state: ChatwithDBState,
+) -> Literal['fixsql_agent', 'answer_generator', 'human_intervent']:
+    sql_execution_state = state.get('sql_execution_state', {})
+
+    # Check if max retries exceeded first
+    if sql_execution_state.get('exceeded_max_retries', False):
+        logger.warning('SQL fix retry limit exceeded. Navigating to human_intervent.')
+        return 'human_intervent'
+
+    if sql_execution_state.get('error_message', ''):
+        return 'fixsql_agent'
+    return 'answer_generator'
+
+
 class AQIAgentInput(BaseModel):
     question: str
     conversation_id: str
@@ -86,6 +157,7 @@ class AQIAgentApplication(BaseService):
             opensearch_service=self.resources.opensearch_service,
             litellm_service=self.resources.litellm_service,
             table_pruner_settings=self.resources.settings.table_pruner,
+            redis_client=self.resources.redis_client,
         )
 
     @property
@@ -110,7 +182,7 @@ class AQIAgentApplication(BaseService):
             settings=self.resources.settings.human_intervent,
         )
 
-    @property
+    @cached_property
     def autocorrector_service(self) -> AutocorrectorService:
         return AutocorrectorService(
             redis_client=self.resources.redis_client,
@@ -123,6 +195,7 @@ class AQIAgentApplication(BaseService):
             litellm_service=self.resources.litellm_service,
             autocorrector_service=self.autocorrector_service,
             settings=self.resources.settings.match_sql_generator,
+            sql_execution_handler_service=self.sql_execution_handler_service,
         )
 
     @property
@@ -133,7 +206,7 @@ class AQIAgentApplication(BaseService):
             settings=self.resources.settings.mismatch_sql_generator,
         )
 
-    @property
+    @cached_property
     def answer_generator_service(self) -> AnswerGeneratorService:
         return AnswerGeneratorService(
             litellm_service=self.resources.litellm_service,
@@ -144,8 +217,9 @@ class AQIAgentApplication(BaseService):
     def sql_validator_service(self) -> SQLValidatorService:
         return SQLValidatorService()
 
-    @property
+    @cached_property
     def sql_execution_handler_service(self) -> SQLExecutionHandlerService:
+        # Shared with the match generator so speculative executions reach the execution node
         return SQLExecutionHandlerService(
             sql_database=self.resources.sql_database,
             settings=self.resources.settings.sql_execution,
@@ -158,50 +232,68 @@ class AQIAgentApplication(BaseService):
             settings=self.resources.settings.fixsql_agent,
         )
 
-    @property
+    @cached_property
     def memory_updater_service(self) -> MemoryUpdaterService:
+        # Used by every request's background task; build it once with the graph
         return MemoryUpdaterService(
             sql_database=self.resources.sql_database,
             settings=self.resources.settings.memory_updater,
             litellm_service=self.resources.litellm_service,
         )
 
-    def join_nodes(self, state: ChatwithDBState) -> ChatwithDBState:
+    def join_nodes(self, state: ChatwithDBState) -> dict:
         """
         Join the outputs of parallel nodes (table_pruner, retrieve_example)
         back into the main state.
-        """
-        return state
 
-    @property
-    def nodes(self) -> EasyDict:
-        return EasyDict(
-            {
-                'interrupt_checker': self.interrupt_checker_service.gprocess,
-                'rephrase_question': self.rephrase_service.gprocess,
-                'retrieve_history': self.history_retrieval_service.gprocess,
-                'retrieve_example': self.example_management_service.gprocess,
-                'table_pruner': self.table_pruner_service.gprocess,
-                'planner': self.planner_service.gprocess,
-                'match_sql_generator': self.match_sql_generator_service.gprocess,
-                'answer_generator': self.answer_generator_service.gprocess,
-                'join_nodes': self.join_nodes,
-                'human_intervent': self.human_intervent_service.gprocess,
-                'mismatch_sql_generator': self.mismatch_sql_generator_service.gprocess,
-                'sql_validator': self.sql_validator_service.gprocess,
-                'fixsql_agent': self.fixsql_agent_service.gprocess,
-                'sql_execution_handler': self.sql_execution_handler_service.gprocess,
-            },
-        )
-
-    async def check_interrupt_node(self, state: ChatwithDBState) -> ChatwithDBState:
+        The branches have already written their own keys, so this returns an
+        empty partial update instead of re-writing every state channel.
+        """
+        return {}
+
+    @cached_property
+    def nodes(self) -> dict[str, Any]:
+        return {
+            'interrupt_checker': self.interrupt_checker_service.gprocess,
+            'rephrase_question': self.rephrase_service.gprocess,
+            'retrieve_history': self.history_retrieval_service.gprocess,
+            'retrieve_example': self.example_management_service.gprocess,
+            'table_pruner': self.table_pruner_service.gprocess,
+            'planner': self.planner_service.gprocess,
+            'match_sql_generator': self.match_sql_generator_service.gprocess,
+            'answer_generator': self.answer_generator_service.gprocess,
+            'answer_cache': self.answer_generator_service.cached_gprocess,
+            'join_nodes': self.join_nodes,
+            'human_intervent': self.human_intervent_service.gprocess,
+            'mismatch_sql_generator': self.mismatch_sql_generator_service.gprocess,
+            'sql_validator': self.sql_validator_service.gprocess,
+            'fixsql_agent': self.fixsql_agent_service.gprocess,
+            'sql_execution_handler': self.sql_execution_handler_service.gprocess,
+        }
+
+    async def check_interrupt_node(self, state: ChatwithDBState) -> dict:
         """
         Interrupt the graph when need_context is False,
         allowing human-in-the-loop confirmation before proceeding.
         """
         logger.info('Checking for interrupt', extra={'rephrased_state': state['interrupt']})
         interrupt(state)
-        return {**state, 'interrupt': True}
+        return {'interrupt': True}
+
+    @cached_property
+    def compiled_graph(self) -> Any:
+        """
+        State graph compiled once per application instance.
+
+        All per-request data lives in the ChatwithDBState passed to ``ainvoke``,
+        so concurrent requests share this compiled graph safely.
+        """
+        return self._build_graph()
+
+    def model_post_init(self, __context: Any) -> None:
+        # Compile eagerly so the first request does not pay for it
+        _ = self.compiled_graph
+        _ = self.memory_updater_service
 
     def _build_graph(self) -> Any:
         """
@@ -219,44 +311,35 @@ class AQIAgentApplication(BaseService):
         for node, action in self.nodes.items():
             graph.add_node(node, action)
 
-        def rephrase_question_route(
-            state: ChatwithDBState,
-        ) -> List[Literal['table_pruner', 'retrieve_example', 'human_intervent']]:
-            if state.get('rephrased_state', {}).get('need_context', False):
-                return ['table_pruner', 'retrieve_example']
-            return ['human_intervent']
-
-        def interrupt_router(
-            state: ChatwithDBState,
-        ) -> Literal['retrieve_history', 'end']:
-            if not state.get('interrupt', False):
-                return 'retrieve_history'
-            return 'end'
-
-        # START -> interrupt_checker
+        # START -> [interrupt_checker || retrieve_history]
+        # History retrieval does not depend on the interrupt check, so both lookups run in
+        # the same step; when the graph is interrupted the fetched history is simply unused.
         graph.add_edge(START, 'interrupt_checker')
+        graph.add_edge(START, 'retrieve_history')
 
-        # interrupt_checker -> retrieve_history | END
+        # interrupt_checker -> rephrase_question | END
+        # rephrase_question runs in the next step, after retrieve_history has also finished
         graph.add_conditional_edges(
             'interrupt_checker',
-            interrupt_router,
+            _interrupt_router,
             {
-                'retrieve_history': 'retrieve_history',
+                'rephrase_question': 'rephrase_question',
                 'end': END,
             },
         )
 
-        # retrieve_history -> rephrase_question
-        graph.add_edge('retrieve_history', 'rephrase_question')
+        # rephrase_question -> answer_cache
+        graph.add_edge('rephrase_question', 'answer_cache')
 
-        # rephrase_question -> [table_pruner || retrieve_example] | human_intervent
+        # answer_cache -> END (hit) | [table_pruner || retrieve_example] | human_intervent
         graph.add_conditional_edges(
-            'rephrase_question',
-            rephrase_question_route,
+            'answer_cache',
+            _answer_cache_route,
             {
                 'table_pruner': 'table_pruner',
                 'retrieve_example': 'retrieve_example',
                 'human_intervent': 'human_intervent',
+                'end': END,
             },
         )
 
@@ -264,24 +347,10 @@ class AQIAgentApplication(BaseService):
         graph.add_edge('retrieve_example', 'join_nodes')
         graph.add_edge('table_pruner', 'join_nodes')
 
-        def generate_mode_route(state: ChatwithDBState) -> str:
-            if state.get('example_retrieval_state', {}).get('examples', []):
-                logger.info(
-                    'Found %d examples, proceeding to Match and Generate pipeline.',
-                    len(state.get('example_retrieval_state', {}).get('examples', [])),
-                )
-                return 'match_sql_generator'
-            elif state.get('table_pruner_state', {}).get('pruned_schema', ''):
-                logger.info('No examples found but pruned schema is available, proceeding to Think and Generate pipeline.')
-                return 'planner'
-
-            logger.warning('No examples and no pruned schema found, proceeding to human intervention for clarification.')
-            return 'human_intervent'
-
         # join_nodes -> match_sql_generator | planner | human_intervent
         graph.add_conditional_edges(
             'join_nodes',
-            generate_mode_route,
+            _generate_mode_route,
             {
                 'match_sql_generator': 'match_sql_generator',
                 'planner': 'planner',
@@ -292,17 +361,10 @@ class AQIAgentApplication(BaseService):
         # match_sql_generator -> sql_validator
         graph.add_edge('match_sql_generator', 'sql_validator')
 
-        def planner_route(
-            state: ChatwithDBState,
-        ) -> Literal['mismatch_sql_generator', 'human_intervent']:
-            if state.get('planner_state', {}).get('requires_clarification', False):
-                return 'human_intervent'
-            return 'mismatch_sql_generator'
-
         # planner -> mismatch_sql_generator | human_intervent
         graph.add_conditional_edges(
             'planner',
-            planner_route,
+            _planner_route,
             {
                 'mismatch_sql_generator': 'mismatch_sql_generator',
                 'human_intervent': 'human_intervent',
@@ -312,41 +374,20 @@ class AQIAgentApplication(BaseService):
         # mismatch_sql_generator -> sql_validator
         graph.add_edge('mismatch_sql_generator', 'sql_validator')
 
-        def route_sql_validator(
-            state: ChatwithDBState,
-        ) -> Literal['sql_execution_handler', 'human_intervent']:
-            if state.get('sql_validator_state', {}).get('is_valid', False):
-                return 'sql_execution_handler'
-            return 'human_intervent'
-
         # sql_validator -> sql_execution_handler | human_intervent
         graph.add_conditional_edges(
             'sql_validator',
-            route_sql_validator,
+            _route_sql_validator,
             {
                 'sql_execution_handler': 'sql_execution_handler',
                 'human_intervent': 'human_intervent',
             },
         )
 
-        def route_sql_execution(
-            state: ChatwithDBState,
-        ) -> Literal['fixsql_agent', 'answer_generator', 'human_intervent']:
-            sql_execution_state = state.get('sql_execution_state', {})
-
-            # Check if max retries exceeded first
-            if sql_execution_state.get('exceeded_max_retries', False):
-                logger.warning('SQL fix retry limit exceeded. Navigating to human_intervent.')
-                return 'human_intervent'
-
-            if sql_execution_state.get('error_message', ''):
-                return 'fixsql_agent'
-            return 'answer_generator'
-
         # sql_execution_handler -> fixsql_agent | answer_generator | human_intervent
         graph.add_conditional_edges(
             'sql_execution_handler',
-            route_sql_execution,
+            _route_sql_execution,
             {
                 'fixsql_agent': 'fixsql_agent',
                 'answer_generator': 'answer_generator',
@@ -424,6 +465,7 @@ class AQIAgentApplication(BaseService):
             answer_generator_state=AnswerGeneratorState(
                 answer='',
                 able_to_answer=False,
+                from_cache=False,
             ),
             sql_validator_state=SQLValidatorState(
                 is_valid=False,
@@ -454,10 +496,8 @@ class AQIAgentApplication(BaseService):
         chatwithdb_state: ChatwithDBState = self.__init_chatbot_state(
             inputs=inputs,
         )
-        compiled_graph = self._build_graph()
-        graph_output = await compiled_graph.ainvoke(
-            jsonable_encoder(chatwithdb_state),
-        )
+        # The initial state holds only JSON-native values, so it is passed as-is
+        graph_output = await self.compiled_graph.ainvoke(chatwithdb_state)
 
         need_context = graph_output.get('rephrased_state', {}).get('need_context', False)
         requires_clarification = graph_output.get('planner_state', {}).get('requires_clarification', False)
@@ -468,7 +508,9 @@ class AQIAgentApplication(BaseService):
             and not graph_output.get('example_retrieval_state', {}).get('examples', [])
         )
 
-        if not need_context or requires_clarification or exceeded_max_retries or no_relevant_schema:
+        if graph_output.get('answer_generator_state', {}).get('from_cache', False):
+            response = graph_output['answer_generator_state']['answer']
+        elif not need_context or requires_clarification or exceeded_max_retries or no_relevant_schema:
             response = graph_output.get('human_intervent_state', {}).get('answer', '')
         elif need_context:
             response = graph_output.get('answer_generator_state', {}).get('answer', '')
@@ -1,25 +1,37 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections import OrderedDict
 
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.state import AnswerGeneratorState
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.settings import AnswerGeneratorSettings
-from fastapi.encoders import jsonable_encoder
+from aqi_agent.shared.utils import current_date_time
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
 from lite_llm import MessageRole
 from logger import get_logger
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from .prompts import ANSWER_GENERATOR_SYSTEM_PROMPT
 from .prompts import ANSWER_GENERATOR_USER_PROMPT
 
 logger = get_logger(__name__)
 
+# Canned replies for results the LLM would only restate (no rows / no result), by answer language
+_NO_DATA_ANSWERS = {
+    'Vietnamese': 'Mình không tìm thấy dữ liệu phù hợp với yêu cầu của bạn. Bạn thử đổi khoảng thời gian hoặc điều kiện khác nhé.',
+    'English': 'No data was found matching your criteria. Please try a different time range or criteria.',
+}
+_NO_RESULT_ANSWERS = {
+    'Vietnamese': 'Mình chưa lấy được dữ liệu cho câu hỏi này. Bạn thử diễn đạt lại hoặc cung cấp thêm chi tiết nhé.',
+    'English': 'The data could not be retrieved for this question. Please rephrase it or provide more details.',
+}
+
 
 class AnswerGeneratorInput(BaseModel):
     question: str
@@ -44,7 +56,8 @@ class AnswerGeneratorService(BaseService):
     """Service for generating natural language answers from SQL query results.
 
     Takes the user's question, the executed SQL query, and its results,
-    then uses an LLM to produce a clear, human-readable response.
+    then uses an LLM to produce a clear, human-readable response. Answers are
+    cached per rephrased question so repeats can skip the whole pipeline.
 
     Attributes:
         settings: Configuration settings for the answer generator.
@@ -56,6 +69,32 @@ class AnswerGeneratorService(BaseService):
     settings: AnswerGeneratorSettings
     litellm_service: LiteLLMService
 
+    _cache: OrderedDict[tuple[str, str], tuple[float, str]] = PrivateAttr(default_factory=OrderedDict)
+
+    @staticmethod
+    def _cache_key(rephrased_question: str, language: str) -> tuple[str, str]:
+        """Key answers by the normalized self-contained question and the answer language."""
+        return ' '.join(rephrased_question.lower().split()), language
+
+    def _cache_get(self, key: tuple[str, str]) -> str | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, answer = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return answer
+
+    def _cache_put(self, key: tuple[str, str], answer: str) -> None:
+        if self.settings.cache_size <= 0:
+            return
+        self._cache[key] = (time.monotonic() + self.settings.cache_ttl, answer)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.settings.cache_size:
+            self._cache.popitem(last=False)
+
     def _prepare_conversation_history(
         self,
         conversation_memories: list[dict] | None = None,
@@ -83,7 +122,7 @@ class AnswerGeneratorService(BaseService):
                 role=MessageRole.SYSTEM,
                 content=ANSWER_GENERATOR_SYSTEM_PROMPT.format(
                     language=inputs.language,
-                    date_time=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                    date_time=current_date_time(),
                     display_rows=self.settings.display_rows,
                 ),
             ),
@@ -100,6 +139,23 @@ class AnswerGeneratorService(BaseService):
             ),
         ]
 
+    @staticmethod
+    def _deterministic_answer(inputs: AnswerGeneratorInput) -> AnswerGeneratorOutput | None:
+        """Answer empty or missing results without the LLM, which could only restate them.
+
+        Returns None when the result has rows or the language has no canned reply.
+        """
+        if inputs.execution_result is None:
+            answers = _NO_RESULT_ANSWERS
+        elif inputs.number_of_rows == 0:
+            answers = _NO_DATA_ANSWERS
+        else:
+            return None
+        answer = answers.get(inputs.language)
+        if answer is None:
+            return None
+        return AnswerGeneratorOutput(answer=answer, able_to_answer=False)
+
     async def _call_llm(self, messages: list[CompletionMessage]) -> AnswerGeneratorOutput | None:
         """Call LLM and return structured output, or None if response is invalid."""
         response = await self.litellm_service.process_async(
@@ -114,13 +170,14 @@ class AnswerGeneratorService(BaseService):
             ),
         )
         if isinstance(response.response, AnswerGeneratorOutput):
-            return AnswerGeneratorOutput(**jsonable_encoder(response.response))
+            return response.response
         return None
 
     async def process(self, inputs: AnswerGeneratorInput) -> AnswerGeneratorOutput:
         """Generate a natural language answer from SQL execution results.
 
         Retries are delegated to the LiteLLM service via num_retry setting.
+        Empty or missing results get a canned reply instead of an LLM call.
 
         Args:
             inputs: AnswerGeneratorInput with question, SQL query, and execution results.
@@ -128,6 +185,12 @@ class AnswerGeneratorService(BaseService):
         Returns:
             AnswerGeneratorOutput with the generated answer and ability flag.
         """
+        if self.settings.skip_empty_results:
+            deterministic = self._deterministic_answer(inputs)
+            if deterministic is not None:
+                logger.info('Answered empty result without LLM', extra={'question': inputs.question})
+                return deterministic
+
         messages = self._build_messages(inputs)
 
         try:
@@ -175,10 +238,18 @@ class AnswerGeneratorService(BaseService):
                 ),
             )
 
+            rephrased_question = rephrased_state.get('rephrased_main_question', '')
+            if output.able_to_answer and rephrased_question:
+                self._cache_put(
+                    self._cache_key(rephrased_question, rephrased_state.get('language', 'Vietnamese')),
+                    output.answer,
+                )
+
             return {
                 'answer_generator_state': AnswerGeneratorState(
                     answer=output.answer,
                     able_to_answer=output.able_to_answer,
+                    from_cache=False,
                 ),
             }
 
@@ -191,9 +262,43 @@ class AnswerGeneratorService(BaseService):
                 'answer_generator_state': AnswerGeneratorState(
                     answer='Xin lỗi, mình không thể xử lý yêu cầu lúc này. Vui lòng thử lại.',
                     able_to_answer=False,
+                    from_cache=False,
                 ),
             }
 
+    async def cached_gprocess(self, state: ChatwithDBState) -> dict:
+        """Look up a recent answer to the same rephrased question for the LangGraph state graph.
+
+        The rephrased question is self-contained (history is already resolved
+        into it), so answers are shared across conversations for
+        ``settings.cache_ttl`` seconds.
+
+        Args:
+            state: The ChatwithDBState after question rephrasing.
+
+        Returns:
+            dict: 'answer_generator_state' with the cached answer on a hit, otherwise empty.
+        """
+        rephrased_state = state.get('rephrased_state', {})
+        rephrased_question = rephrased_state.get('rephrased_main_question', '')
+        if not rephrased_state.get('need_context', False) or not rephrased_question:
+            return {}
+
+        answer = self._cache_get(
+            self._cache_key(rephrased_question, rephrased_state.get('language', 'Vietnamese')),
+        )
+        if answer is None:
+            return {}
+
+        logger.info('Answer cache hit', extra={'rephrased_question': rephrased_question})
+        return {
+            'answer_generator_state': AnswerGeneratorState(
+                answer=answer,
+                able_to_answer=True,
+                from_cache=True,
+            ),
+        }
+
     async def process_stream(self, inputs: AnswerGeneratorInput):
         """Stream the generated answer chunk by chunk."""
         logger.info(
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import logging
+import time
 import unicodedata
+from dataclasses import dataclass
+from itertools import chain
 
 import sqlglot
 from base import BaseService
 from aqi_agent.shared.models import Correction
 from aqi_agent.shared.settings import AutocorrectorSettings
 from logger import get_logger
+from pydantic import PrivateAttr
 from rapidfuzz import fuzz
 from rapidfuzz import process
 from redis import Redis 
@@ -19,16 +24,29 @@ from .models import AutocorrectorOutput
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class _ColumnGazetteer:
+    """Cached values of one column, preloaded for exact and fuzzy lookups."""
+    expires_at: float
+    values: list[str]
+    value_set: frozenset[str]
+    normalized: dict[str, str]
+
+
 class FuzzyCorrectorService(BaseService):
     """Service for fuzzy correction of SQL WHERE clause values using Redis cache.
 
     This service performs fuzzy matching on WHERE column = 'value' conditions
     and replaces them with WHERE column IN (...) when matches exceed threshold.
+    A value that equals a cached one up to case and accents is corrected to it
+    directly, without fuzzy scoring.
     """
 
     redis_client: Redis
     settings: AutocorrectorSettings
 
+    _gazetteers: dict[str, _ColumnGazetteer] = PrivateAttr(default_factory=dict)
+
     def _remove_accents(self, input_str: str) -> str:
         """Remove accents from input text for fuzzy matching normalization.
 
@@ -127,15 +145,21 @@ class FuzzyCorrectorService(BaseService):
                     key = key.decode('utf-8')
                 matched_keys.append(key)
 
-            result = {}
+            if not matched_keys:
+                return {}
+
+            # Fetch every matched list in one round-trip
+            pipeline = self.redis_client.pipeline(transaction=False)
             for key in matched_keys:
-                values = self.redis_client.lrange(key, 0, -1)
-                decoded_values = [
-                    v.decode('utf-8') if isinstance(v, bytes) else v
-                    for v in values
-                ]
-                if decoded_values:
-                    result[key] = decoded_values
+                pipeline.lrange(key, 0, -1)
+
+            result = {}
+            for key, values in zip(matched_keys, pipeline.execute()):
+                if values:
+                    result[key] = [
+                        v.decode('utf-8') if isinstance(v, bytes) else v
+                        for v in values
+                    ]
 
             return result
         except Exception:
@@ -145,20 +169,44 @@ class FuzzyCorrectorService(BaseService):
             )
             raise
 
+    def _normalize(self, value: str) -> str:
+        """Lowercase, strip and remove accents from a value for fuzzy matching."""
+        return self._remove_accents(value.lower().strip())
+
+    def _normalized_cache_map(self, cached_values: list[str]) -> dict[str, str]:
+        """Map normalized cached values to their first original spelling.
+
+        Built once per condition so the cached values are normalized once, not
+        once for every value being matched against them.
+
+        Args:
+            cached_values: List of candidate values from cache.
+
+        Returns:
+            Dict mapping normalized value to original cached value.
+        """
+        normalized_cache_map: dict[str, str] = {}
+        for val in cached_values:
+            normalized_cache_map.setdefault(self._normalize(val), val)
+        return normalized_cache_map
+
     def _fuzzy_match(
         self,
         query_value: str,
         cached_values: list[str],
         threshold: int,
         max_matches: int | None,
+        normalized_cache_map: dict[str, str] | None = None,
     ) -> list[str]:
-        """Perform fuzzy matching of a query value against a list of cached values.
+        """Perform fuzzy matching of a query value against cached values.
 
         Args:
             query_value: The value to match.
             cached_values: List of candidate values from cache.
             threshold: Minimum similarity score (0-100) to include a match.
             max_matches: Maximum number of matches to return, or None for unlimited.
+            normalized_cache_map: ``_normalized_cache_map(cached_values)``, when the
+                caller already has it; built here otherwise.
 
         Returns:
             List of matched cached values exceeding the threshold, ordered by score.
@@ -166,20 +214,19 @@ class FuzzyCorrectorService(BaseService):
         try:
             if not query_value or not cached_values:
                 return []
+            if normalized_cache_map is None:
+                normalized_cache_map = self._normalized_cache_map(cached_values)
 
-            query_normalized = self._remove_accents(query_value.lower().strip())
+            query_normalized = self._normalize(query_value)
 
-            normalized_cache_map: dict[str, str] = {}
-            for val in cached_values:
-                norm_val = self._remove_accents(val.lower().strip())
-                if norm_val not in normalized_cache_map:
-                    normalized_cache_map[norm_val] = val
-
-            normalized_cached_list = list(normalized_cache_map.keys())
+            # Exact match once case and accents are ignored: no scoring needed
+            exact = normalized_cache_map.get(query_normalized)
+            if exact is not None:
+                return [exact]
 
             results = process.extract(
                 query_normalized,
-                normalized_cached_list,
+                list(normalized_cache_map),
                 scorer=fuzz.WRatio if len(query_normalized) > 5 else fuzz.QRatio,
                 limit=max_matches,
                 score_cutoff=threshold,
@@ -197,36 +244,44 @@ class FuzzyCorrectorService(BaseService):
         except Exception:
             logger.exception(
                 'Failed to perform fuzzy match.',
-                extra={'query_value': query_value, 'cached_values': cached_values},
+                extra={'query_value': query_value, 'cached_values_count': len(cached_values)},
             )
             raise
 
-    def _get_unique_cached_values(
+    def _get_gazetteer(
         self, column: exp.Column, table_mapping: dict[str, str],
-    ) -> list[str]:
-        """Get deduplicated cached values for a column from Redis.
+    ) -> _ColumnGazetteer | None:
+        """Get the preloaded cached values for a column, loading them from Redis when stale.
+
+        Values are deduplicated and normalized once per column and kept for
+        ``settings.values_cache_ttl`` seconds, so repeated corrections against
+        the same column skip the Redis scan and the normalization pass.
 
         Args:
             column: A sqlglot Column expression.
             table_mapping: Dict mapping alias/tables from ``_extract_table_mapping``.
 
         Returns:
-            Deduplicated list of cached values, or empty list if none found.
+            The column's gazetteer, or None if no values are cached for it.
         """
         column_str = self._get_column_name(column, table_mapping)
-        cached_map = self._find_cached_values_for_column(column_str)
+        now = time.monotonic()
+        gazetteer = self._gazetteers.get(column_str)
+        if gazetteer is not None and gazetteer.expires_at > now:
+            return gazetteer if gazetteer.values else None
 
-        if not cached_map:
-            return []
-
-        seen: set[str] = set()
-        unique_cached: list[str] = []
-        for v in (v for values in cached_map.values() for v in values):
-            if v not in seen:
-                seen.add(v)
-                unique_cached.append(v)
-
-        return unique_cached
+        cached_map = self._find_cached_values_for_column(column_str)
+        # dict.fromkeys dedupes in insertion order in a single C-level pass
+        values = list(dict.fromkeys(chain.from_iterable(cached_map.values())))
+        gazetteer = _ColumnGazetteer(
+            expires_at=now + self.settings.values_cache_ttl,
+            values=values,
+            value_set=frozenset(values),
+            normalized=self._normalized_cache_map(values),
+        )
+        if self.settings.values_cache_ttl > 0:
+            self._gazetteers[column_str] = gazetteer
+        return gazetteer if values else None
 
     def _deduplicate_expressions(
         self, expressions: list[exp.Expression],
@@ -292,107 +347,97 @@ class FuzzyCorrectorService(BaseService):
                 return inner
         return None
 
-    def _extract_where_equality_conditions(
-        self, expression: exp.Expression,
-    ) -> list[dict]:
-        """Extract WHERE column = 'string_literal' conditions from the SQL AST.
+    def _eq_condition(self, eq_node: exp.EQ) -> dict | None:
+        """Build an EQ condition from ``column = 'string_literal'``, or None if it doesn't apply.
 
         Handles reversed operands (``'value' = column``) and function-wrapped
         columns/literals (e.g. ``LOWER(col) = LOWER('val')``).
-
-        Args:
-            expression: A sqlglot Expression representing the parsed SQL query.
-
-        Returns:
-            List of dicts with keys ``column``, ``value``, and ``eq_node``.
         """
-        try:
-            conditions: list[dict] = []
-
-            where = expression.find(exp.Where)
-            if not where:
-                return conditions
-
-            for eq_node in where.find_all(exp.EQ):
-                left = eq_node.left
-                right = eq_node.right
-
-                # Handle reversed operands: 'Value' = column (bare or wrapped)
-                if self._unwrap_literal(left) is not None and self._unwrap_column(right) is not None:
-                    left, right = right, left
-
-                # Unwrap function-wrapped column (e.g. LOWER(col), UPPER(col), TRIM(col))
-                column = self._unwrap_column(left)
-                if column is None:
-                    continue
-
-                # Unwrap function-wrapped literal on value side (e.g. LOWER('val'))
-                literal = self._unwrap_literal(right)
-                if literal is None:
-                    continue
+        left = eq_node.left
+        right = eq_node.right
+
+        # Handle reversed operands: 'Value' = column (bare or wrapped)
+        if self._unwrap_literal(left) is not None and self._unwrap_column(right) is not None:
+            left, right = right, left
+
+        # Unwrap function-wrapped column (e.g. LOWER(col), UPPER(col), TRIM(col))
+        column = self._unwrap_column(left)
+        if column is None:
+            return None
+
+        # Unwrap function-wrapped literal on value side (e.g. LOWER('val'))
+        literal = self._unwrap_literal(right)
+        if literal is None:
+            return None
+
+        return {
+            'column': column,
+            'value': literal.this,
+            'eq_node': eq_node,
+        }
+
+    def _in_condition(self, in_node: exp.In) -> dict | None:
+        """Build an IN condition from ``column IN ('val1', ...)``, or None if it doesn't apply.
+
+        Only applies when the column is a direct (or function-wrapped) column
+        reference and the IN list contains at least one string literal (not a
+        subquery).
+        """
+        # Unwrap function-wrapped columns (e.g. LOWER(col), UPPER(col), TRIM(col))
+        column = self._unwrap_column(in_node.this)
+        if column is None:
+            return None
+
+        in_expressions = in_node.expressions
+        if not in_expressions:
+            return None
+
+        has_string_literal = any(
+            isinstance(e, exp.Literal) and e.is_string
+            for e in in_expressions
+        )
+        if not has_string_literal:
+            return None
 
-                conditions.append({
-                    'column': column,
-                    'value': literal.this,
-                    'eq_node': eq_node,
-                })
+        return {
+            'column': column,
+            'in_node': in_node,
+        }
 
-            return conditions
-        except Exception:
-            logger.exception(
-                'Failed to extract WHERE equality conditions from SQL expression.',
-                extra={'expression': expression.sql() if expression else None},
-            )
-            raise
-
-    def _extract_where_in_conditions(
+    def _extract_where_conditions(
         self, expression: exp.Expression,
-    ) -> list[dict]:
-        """Extract WHERE column IN ('val1', 'val2', ...) conditions from the SQL AST.
-
-        Only extracts IN conditions where the column is a direct column reference
-        (or function-wrapped) and the IN list contains at least one string literal
-        (not a subquery).
+    ) -> tuple[list[dict], list[dict]]:
+        """Extract correctable EQ and IN conditions from the WHERE clause in one AST walk.
 
         Args:
             expression: A sqlglot Expression representing the parsed SQL query.
 
         Returns:
-            List of dicts with keys ``column`` and ``in_node``.
+            Tuple of (EQ conditions with keys ``column``, ``value`` and ``eq_node``;
+            IN conditions with keys ``column`` and ``in_node``).
         """
         try:
-            conditions: list[dict] = []
+            eq_conditions: list[dict] = []
+            in_conditions: list[dict] = []
 
             where = expression.find(exp.Where)
             if not where:
-                return conditions
-
-            for in_node in where.find_all(exp.In):
-                # Unwrap function-wrapped columns (e.g. LOWER(col), UPPER(col), TRIM(col))
-                column = self._unwrap_column(in_node.this)
-                if column is None:
-                    continue
-
-                in_expressions = in_node.expressions
-                if not in_expressions:
-                    continue
+                return eq_conditions, in_conditions
 
-                has_string_literal = any(
-                    isinstance(e, exp.Literal) and e.is_string
-                    for e in in_expressions
-                )
-                if not has_string_literal:
-                    continue
-
-                conditions.append({
-                    'column': column,
-                    'in_node': in_node,
-                })
+            for node in where.find_all(exp.EQ, exp.In):
+                if isinstance(node, exp.EQ):
+                    condition = self._eq_condition(node)
+                    if condition is not None:
+                        eq_conditions.append(condition)
+                else:
+                    condition = self._in_condition(node)
+                    if condition is not None:
+                        in_conditions.append(condition)
 
-            return conditions
+            return eq_conditions, in_conditions
         except Exception:
             logger.exception(
-                'Failed to extract WHERE IN conditions from SQL expression.',
+                'Failed to extract WHERE conditions from SQL expression.',
                 extra={'expression': expression.sql() if expression else None},
             )
             raise
@@ -408,7 +453,7 @@ class FuzzyCorrectorService(BaseService):
 
         Args:
             conditions: Pre-extracted list of EQ conditions from
-                ``_extract_where_equality_conditions``.
+                ``_extract_where_conditions``.
             table_mapping: Dict mapping alias/tables from ``_extract_table_mapping``.
             fuzzy_threshold: Minimum similarity score to accept a match.
             max_matches: Maximum number of replacement values per condition.
@@ -424,11 +469,13 @@ class FuzzyCorrectorService(BaseService):
                 original_value: str = cond['value']
                 eq_node: exp.EQ = cond['eq_node']
 
-                unique_cached = self._get_unique_cached_values(column, table_mapping)
-                if not unique_cached or original_value in unique_cached:
+                gazetteer = self._get_gazetteer(column, table_mapping)
+                if gazetteer is None or original_value in gazetteer.value_set:
                     continue
 
-                matches = self._fuzzy_match(original_value, unique_cached, fuzzy_threshold, max_matches)
+                matches = self._fuzzy_match(
+                    original_value, gazetteer.values, fuzzy_threshold, max_matches, gazetteer.normalized,
+                )
                 if not matches:
                     continue
 
@@ -465,7 +512,7 @@ class FuzzyCorrectorService(BaseService):
 
         Args:
             conditions: Pre-extracted list of IN conditions from
-                ``_extract_where_in_conditions``.
+                ``_extract_where_conditions``.
             table_mapping: Dict mapping alias/tables from ``_extract_table_mapping``.
             fuzzy_threshold: Minimum similarity score to accept a match.
             max_matches: Maximum number of replacement values per original value.
@@ -480,8 +527,8 @@ class FuzzyCorrectorService(BaseService):
                 column: exp.Column = cond['column']
                 in_node: exp.In = cond['in_node']
 
-                unique_cached = self._get_unique_cached_values(column, table_mapping)
-                if not unique_cached:
+                gazetteer = self._get_gazetteer(column, table_mapping)
+                if gazetteer is None:
                     continue
 
                 new_expressions: list[exp.Expression] = []
@@ -493,11 +540,13 @@ class FuzzyCorrectorService(BaseService):
                         continue
 
                     original_value = item_expr.this
-                    if original_value in unique_cached:
+                    if original_value in gazetteer.value_set:
                         new_expressions.append(item_expr.copy())
                         continue
 
-                    matches = self._fuzzy_match(original_value, unique_cached, fuzzy_threshold, max_matches)
+                    matches = self._fuzzy_match(
+                        original_value, gazetteer.values, fuzzy_threshold, max_matches, gazetteer.normalized,
+                    )
                     if matches:
                         new_expressions.extend(exp.Literal.string(m) for m in matches)
                         corrections.append(Correction(original_value=original_value, corrected_values=matches))
@@ -548,8 +597,7 @@ class FuzzyCorrectorService(BaseService):
             if expression is None:
                 continue
             table_mapping = self._extract_table_mapping(expression)
-            eq_conditions = self._extract_where_equality_conditions(expression)
-            in_conditions = self._extract_where_in_conditions(expression)
+            eq_conditions, in_conditions = self._extract_where_conditions(expression)
             all_corrections += self._process_eq_conditions(eq_conditions, table_mapping, fuzzy_threshold, max_matches)
             all_corrections += self._process_in_conditions(in_conditions, table_mapping, fuzzy_threshold, max_matches)
 
@@ -557,14 +605,15 @@ class FuzzyCorrectorService(BaseService):
             expr.sql() for expr in parsed_statements if expr is not None
         )
 
-        logger.info(
-            'Completed fuzzy correction of SQL query.',
-            extra={
-                'original_query': sql_query,
-                'corrected_query': corrected_sql,
-                'corrections': [c for c in all_corrections],
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                'Completed fuzzy correction of SQL query.',
+                extra={
+                    'original_query': sql_query,
+                    'corrected_query': corrected_sql,
+                    'corrections': list(all_corrections),
+                },
+            )
         return AutocorrectorOutput(
             corrected_sql_query=corrected_sql,
             corrections=all_corrections or None,
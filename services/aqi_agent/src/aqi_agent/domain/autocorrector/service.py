@@ -1,6 +1,8 @@
 """Autocorrector service for SQL query processing and corrections."""
 from __future__ import annotations
 
+from functools import cached_property
+
 from base import BaseService
 from aqi_agent.domain.autocorrector.models import AutocorrectorInput
 from aqi_agent.domain.autocorrector.models import AutocorrectorOutput
@@ -20,7 +22,7 @@ class AutocorrectorService(BaseService):
     redis_client: Redis
     settings: AutocorrectorSettings
 
-    @property
+    @cached_property
     def fuzzy_corrector(self) -> FuzzyCorrectorService:
         return FuzzyCorrectorService(
             redis_client=self.redis_client, settings=self.settings,
@@ -7,6 +7,7 @@ from aqi_agent.shared.models import RetrievedExample
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import ExampleRetrievalState
 from aqi_agent.shared.settings import ExampleManagementSettings
+from aqi_agent.shared.utils import semaphore_gather
 from lite_llm import LiteLLMEmbeddingInput
 from lite_llm import LiteLLMService
 from logger import get_logger
@@ -19,6 +20,9 @@ from .models import ExampleRetrievalOutput
 
 logger = get_logger(__name__)
 
+# Read-only; shared by every search request instead of being rebuilt per call
+_SOURCE_FILTER: dict[str, Any] = {'excludes': ['embedding']}
+
 
 class ExampleManagementService(BaseService):
     litellm_service: LiteLLMService
@@ -62,36 +66,40 @@ class ExampleManagementService(BaseService):
             )
             raise
 
+    async def _build_example_document(self, example: dict) -> AddDocumentInput | None:
+        try:
+            embedding = await self.litellm_service.embedding_async(
+                inputs=LiteLLMEmbeddingInput(
+                    input=example['question'],
+                    embedding_model=self.settings.embedding_model,
+                    encoding_format=self.settings.encoding_format,
+                    dimensions=self.settings.dimensions,
+                ),
+            )
+            return AddDocumentInput(
+                text=example['question'],
+                embedding=embedding.vector,
+                metadata={'sql_query': example['sql_query']},
+            )
+        except Exception as e:
+            logger.exception(
+                'Error generating embedding for example',
+                extra={'error': str(e), 'example': example},
+            )
+            return None
+
     async def index_examples(self, examples: list[dict]) -> bool:
         try:
             if not examples:
                 logger.warning('No examples provided for indexing')
                 return False
 
-            documents: list[AddDocumentInput] = []
-            for example in examples:
-                try:
-                    embedding = await self.litellm_service.embedding_async(
-                        inputs=LiteLLMEmbeddingInput(
-                            input=example['question'],
-                            embedding_model=self.settings.embedding_model,
-                            encoding_format=self.settings.encoding_format,
-                            dimensions=self.settings.dimensions,
-                        ),
-                    )
-                    documents.append(
-                        AddDocumentInput(
-                            text=example['question'],
-                            embedding=embedding.vector,
-                            metadata={'sql_query': example['sql_query']},
-                        ),
-                    )
-                except Exception as e:
-                    logger.exception(
-                        'Error generating embedding for example',
-                        extra={'error': str(e), 'example': example},
-                    )
-                    continue
+            # Embed examples concurrently, capped to avoid flooding the LLM proxy
+            results = await semaphore_gather(
+                *(self._build_example_document(example) for example in examples),
+                max_coroutines=self.settings.max_concurrency,
+            )
+            documents = [document for document in results if document is not None]
 
             return self.opensearch_service.add_documents(
                 documents=documents,
@@ -115,7 +123,7 @@ class ExampleManagementService(BaseService):
                 ),
             )
             return {
-                '_source': {'excludes': ['embedding']},
+                '_source': _SOURCE_FILTER,
                 'query': {
                     'knn': {
                         'embedding': {
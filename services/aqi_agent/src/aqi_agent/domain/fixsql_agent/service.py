@@ -5,7 +5,6 @@ from base import BaseService
 from aqi_agent.domain.planner.models import SubTaskModel
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.settings import FixSQLAgentSettings
-from fastapi.encoders import jsonable_encoder
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -158,9 +157,7 @@ class FixSQLService(BaseService):
                 ),
             )
 
-            fixsql_result: FixSQLModel = FixSQLModel(
-                **jsonable_encoder(response.response),
-            )
+            fixsql_result = response.parsed(FixSQLModel)
 
             logger.info(
                 'FixSQL agent result',
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.memory import Answer
@@ -8,7 +10,6 @@ from aqi_agent.shared.models.memory import Question
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import HistoryRetrievalState
 from aqi_agent.shared.settings.history_retrieval import HistoryRetrievalSettings
-from fastapi.encoders import jsonable_encoder
 from logger import get_logger
 from pg import SQLDatabase
 from pg.model import Message as MessageModel
@@ -30,20 +31,19 @@ class HistoryRetrievalService(BaseService):
     settings: HistoryRetrievalSettings
 
     async def process(self, inputs: HistoryRetrievalInput) -> HistoryRetrievalOutput:
-        try:
-            conversation_memories = self.__get_conversation_memories(
-                conversation_id=inputs.conversation_id,
-            )
-        except Exception as e:
-            logger.exception('Error in HistoryRetrievalService: ', extra={'error': str(e)})
+        # Both lookups are independent blocking queries; run them side by side off the event loop
+        conversation_memories, conversation_summary = await asyncio.gather(
+            asyncio.to_thread(self.__get_conversation_memories, inputs.conversation_id),
+            asyncio.to_thread(self.__get_conversation_summary, inputs.conversation_id),
+            return_exceptions=True,
+        )
+
+        if isinstance(conversation_memories, Exception):
+            logger.exception('Error in HistoryRetrievalService: ', exc_info=conversation_memories, extra={'error': str(conversation_memories)})
             conversation_memories = []
 
-        try:
-            conversation_summary = self.__get_conversation_summary(
-                conversation_id=inputs.conversation_id,
-            )
-        except Exception as e:
-            logger.exception('Error in HistoryRetrievalService: ', extra={'error': str(e)})
+        if isinstance(conversation_summary, Exception):
+            logger.exception('Error in HistoryRetrievalService: ', exc_info=conversation_summary, extra={'error': str(conversation_summary)})
             conversation_summary = ''
 
         logger.info(
@@ -111,7 +111,7 @@ class HistoryRetrievalService(BaseService):
             }
         return {
             'history_retrieval_state': HistoryRetrievalState(
-                conversation_memories=[jsonable_encoder(conversation_memory) for conversation_memory in output.conversation_memories],
+                conversation_memories=[conversation_memory.model_dump(mode='json') for conversation_memory in output.conversation_memories],
                 conversation_summary=output.conversation_summary,
             ),
         }
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
 
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import HumanInterventState
 from aqi_agent.shared.settings import HumanInterventSettings
-from fastapi.encoders import jsonable_encoder
+from aqi_agent.shared.utils import current_date_time
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -77,7 +76,7 @@ class HumanInterventService(BaseService):
                     role=MessageRole.SYSTEM,
                     content=HUMAN_INTERVENT_SYSTEM_PROMPT.format(
                         language=inputs.language,
-                        date_time=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                        date_time=current_date_time(),
                     ),
                 ),
                 CompletionMessage(
@@ -105,7 +104,7 @@ class HumanInterventService(BaseService):
             )
 
             if isinstance(response.response, HumanInterventOutput):
-                return HumanInterventOutput(**jsonable_encoder(response.response))
+                return response.response
 
         except Exception as e:
             logger.exception(
@@ -195,7 +194,7 @@ class HumanInterventService(BaseService):
                     role=MessageRole.SYSTEM,
                     content=HUMAN_INTERVENT_SYSTEM_PROMPT.format(
                         language=inputs.language,
-                        date_time=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                        date_time=current_date_time(),
                     ),
                 ),
                 CompletionMessage(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.state import ChatwithDBState
@@ -25,6 +27,22 @@ class InterruptCheckerService(BaseService):
     sql_database: SQLDatabase
 
     async def process(self, inputs: InterruptCheckerInput) -> InterruptCheckerOutput:
+        # Blocking query; run it off the event loop so history retrieval can proceed alongside
+        is_confirming = await asyncio.to_thread(self.__is_confirming, inputs)
+
+        if is_confirming:
+            logger.info(
+                f'Conversation with id {inputs.conversation_id} is in confirming status, jump to the interrupted state.',
+                extra={'conversation_id': inputs.conversation_id, 'is_confirming': is_confirming},
+            )
+        else:
+            logger.info(
+                f'Conversation with id {inputs.conversation_id} is not in confirming status, continuing the process.',
+                extra={'conversation_id': inputs.conversation_id, 'is_confirming': is_confirming},
+            )
+        return InterruptCheckerOutput(interrupt=is_confirming)
+
+    def __is_confirming(self, inputs: InterruptCheckerInput) -> bool:
         with self.sql_database.get_session() as session:
             converstaion = self.sql_database.get_conversation_by_id(session, inputs.conversation_id)
             if not converstaion:
@@ -43,18 +61,7 @@ class InterruptCheckerService(BaseService):
                 is_confirming = converstaion_model.is_confirming
             else:
                 is_confirming = converstaion.is_confirming
-
-        if is_confirming:
-            logger.info(
-                f'Conversation with id {inputs.conversation_id} is in confirming status, jump to the interrupted state.',
-                extra={'conversation_id': inputs.conversation_id, 'is_confirming': is_confirming},
-            )
-        else:
-            logger.info(
-                f'Conversation with id {inputs.conversation_id} is not in confirming status, continuing the process.',
-                extra={'conversation_id': inputs.conversation_id, 'is_confirming': is_confirming},
-            )
-        return InterruptCheckerOutput(interrupt=is_confirming)
+        return is_confirming
 
     async def gprocess(self, state: ChatwithDBState) -> dict:
         try:
@@ -69,6 +76,6 @@ class InterruptCheckerService(BaseService):
         except Exception as e:
             logger.exception(
                 'Failed to construct InterruptCheckerInput from state, error: %s',
-                extra={'error': str(e), 'state': state},
+                extra={'error': str(e), 'conversation_id': state.get('conversation_id')},
             )
             raise e
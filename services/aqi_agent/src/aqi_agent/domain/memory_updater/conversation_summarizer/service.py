@@ -7,7 +7,6 @@ from base import BaseService
 from aqi_agent.shared.models.memory import QAMemoryPair
 from aqi_agent.shared.settings.memory_updater import ConversationSummarizerSettings
 from aqi_agent.shared.utils import qa_message_to_string
-from fastapi.encoders import jsonable_encoder
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -69,7 +68,7 @@ class ConversationSummarizerService(BaseService):
                     presence_penalty=self.conversation_summarizer_settings.presence_penalty,
                 ),
             )
-            return ConversationSummarizerOutput(**jsonable_encoder(response.response))
+            return response.parsed(ConversationSummarizerOutput)
         except Exception as e:
             logger.warning(
                 'LLM processing error during conversation summarization',
@@ -5,7 +5,6 @@ from base import BaseService
 from aqi_agent.shared.models.memory import QAMemoryPair
 from aqi_agent.shared.settings.memory_updater import ConversationTitleGeneratorSettings
 from aqi_agent.shared.utils import qa_message_to_string
-from fastapi.encoders import jsonable_encoder
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -62,7 +61,7 @@ class ConversationTitleGeneratorService(BaseService):
                     presence_penalty=self.conversation_title_generator_settings.presence_penalty,
                 ),
             )
-            return ConversationTitleGeneratorOutput(**jsonable_encoder(response.response))
+            return response.parsed(ConversationTitleGeneratorOutput)
         except Exception as e:
             logger.warning(
                 'LLM processing error during conversation title generation',
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from base import BaseModel
@@ -92,6 +93,7 @@ class MemoryUpdaterService(BaseService):
         Orchestrates the complete memory update workflow:
         1. Retrieves or generates conversation title
         2. Summarizes the conversation with recent and latest messages
+           (concurrently with title generation)
         3. Uploads message pair to database
         4. Extracts and updates user attributes based on the conversation
 
@@ -139,110 +141,163 @@ class MemoryUpdaterService(BaseService):
                     summary='',
                 )
 
-        if not conversation_response.title:
-            if not inputs.qa_pair.qa_list or len(inputs.qa_pair.qa_list) < 2:
-                qa_pair = QAMemoryPair(
-                    qa_list=(Question(question=''), Answer(answer='')),
-                )
-            else:
-                qa_pair = QAMemoryPair(
-                    qa_list=(
-                        Question(question=inputs.qa_pair.qa_list[0].question),
-                        Answer(answer=inputs.qa_pair.qa_list[1].answer),
-                    ),
-                )
-            try:
-                conversation_response = (
-                    await self.conversation_title_generator_service.process(
-                        inputs=ConversationTitleGeneratorInput(
-                            qa_pair=qa_pair,
-                        ),
-                    )
-                )
-            except Exception as e:
-                logger.warning(
-                    'Failed to generate conversation title',
-                    extra={
-                        'error': str(e),
-                        'conversation_id': inputs.conversation_id,
-                    },
-                )
+        # Title generation and summarization are independent LLM calls; run them concurrently
+        title, summary_attribute = await asyncio.gather(
+            self.__generate_title(
+                conversation=conversation_response,
+                qa_pair=inputs.qa_pair,
+                conversation_id=inputs.conversation_id,
+            ),
+            self.__summarize(
+                conversation_id=inputs.conversation_id,
+                latest_message=inputs.qa_pair,
+                recent_messages=inputs.recent_messages,
+            ),
+        )
 
+        # Update conversation with summary
         try:
-            conversation_lastest_summary = self.__get_current_summary_from_conversation(
+            self.__update_conversation(
                 conversation_id=inputs.conversation_id,
+                summary=summary_attribute,
+                title=title,
             )
         except Exception as e:
             logger.warning(
-                'Failed to retrieve conversation summary',
+                'Failed to update conversation',
                 extra={
                     'error': str(e),
                     'conversation_id': inputs.conversation_id,
                 },
             )
-            conversation_lastest_summary = None
 
         try:
-            conversation_summarizer_response = (
-                await self.conversation_summarizer_service.process(
-                    inputs=ConversationSummarizerInput(
-                        latest_summary=conversation_lastest_summary or '',
-                        latest_message=inputs.qa_pair,
-                        recent_messages=inputs.recent_messages,
+            # Synchronous DB insert; run it off the event loop
+            await asyncio.to_thread(
+                self.upload_message_memory_service.process,
+                UploadMessageMemoryInput(
+                    conversation_id=inputs.conversation_id,
+                    question=(
+                        inputs.qa_pair.qa_list[0].question if inputs.qa_pair.qa_list else ''
                     ),
-                )
+                    answer=(
+                        inputs.qa_pair.qa_list[1].answer
+                        if inputs.qa_pair.qa_list and len(inputs.qa_pair.qa_list) > 1
+                        else ''
+                    ),
+                    conversation_title=title,
+                    additional_info=inputs.additional_info,
+                ),
             )
-            summary_attribute = conversation_summarizer_response.summary
         except Exception as e:
             logger.warning(
-                'Failed to summarize conversation',
+                'Failed to upload message memory',
                 extra={
                     'error': str(e),
                     'conversation_id': inputs.conversation_id,
                 },
             )
-            summary_attribute = conversation_lastest_summary or ''
 
-        # Update conversation with summary
+    async def __generate_title(
+        self,
+        conversation: Conversation,
+        qa_pair: QAMemoryPair,
+        conversation_id: str,
+    ) -> str:
+        """
+        Generate a title for the conversation if it does not have one yet.
+
+        Args:
+            conversation: Current conversation record.
+            qa_pair: The current question-answer pair.
+            conversation_id: Unique identifier of the conversation.
+
+        Returns:
+            str: The existing title, the generated one, or the existing (empty)
+                title if generation fails.
+        """
+        if conversation.title:
+            return conversation.title
+
+        if not qa_pair.qa_list or len(qa_pair.qa_list) < 2:
+            title_qa_pair = QAMemoryPair(
+                qa_list=(Question(question=''), Answer(answer='')),
+            )
+        else:
+            title_qa_pair = QAMemoryPair(
+                qa_list=(
+                    Question(question=qa_pair.qa_list[0].question),
+                    Answer(answer=qa_pair.qa_list[1].answer),
+                ),
+            )
         try:
-            self.__update_conversation(
-                conversation_id=inputs.conversation_id,
-                summary=summary_attribute,
-                title=conversation_response.title,
+            title_response = await self.conversation_title_generator_service.process(
+                inputs=ConversationTitleGeneratorInput(
+                    qa_pair=title_qa_pair,
+                ),
             )
+            return title_response.title
         except Exception as e:
             logger.warning(
-                'Failed to update conversation',
+                'Failed to generate conversation title',
                 extra={
                     'error': str(e),
-                    'conversation_id': inputs.conversation_id,
+                    'conversation_id': conversation_id,
                 },
             )
+            return conversation.title
 
+    async def __summarize(
+        self,
+        conversation_id: str,
+        latest_message: QAMemoryPair,
+        recent_messages: list[QAMemoryPair],
+    ) -> str:
+        """
+        Summarize the conversation with the recent and latest messages.
+
+        Args:
+            conversation_id: Unique identifier of the conversation.
+            latest_message: The current question-answer pair.
+            recent_messages: Recent question-answer pairs for context.
+
+        Returns:
+            str: The new summary, or the previous one if summarization fails.
+        """
         try:
-            await self.upload_message_memory_service.process(
-                inputs=UploadMessageMemoryInput(
-                    conversation_id=inputs.conversation_id,
-                    question=(
-                        inputs.qa_pair.qa_list[0].question if inputs.qa_pair.qa_list else ''
-                    ),
-                    answer=(
-                        inputs.qa_pair.qa_list[1].answer
-                        if inputs.qa_pair.qa_list and len(inputs.qa_pair.qa_list) > 1
-                        else ''
+            conversation_lastest_summary = self.__get_current_summary_from_conversation(
+                conversation_id=conversation_id,
+            )
+        except Exception as e:
+            logger.warning(
+                'Failed to retrieve conversation summary',
+                extra={
+                    'error': str(e),
+                    'conversation_id': conversation_id,
+                },
+            )
+            conversation_lastest_summary = None
+
+        try:
+            conversation_summarizer_response = (
+                await self.conversation_summarizer_service.process(
+                    inputs=ConversationSummarizerInput(
+                        latest_summary=conversation_lastest_summary or '',
+                        latest_message=latest_message,
+                        recent_messages=recent_messages,
                     ),
-                    conversation_title=conversation_response.title,
-                    additional_info=inputs.additional_info,
-                ),
+                )
             )
+            return conversation_summarizer_response.summary
         except Exception as e:
             logger.warning(
-                'Failed to upload message memory',
+                'Failed to summarize conversation',
                 extra={
                     'error': str(e),
-                    'conversation_id': inputs.conversation_id,
+                    'conversation_id': conversation_id,
                 },
             )
+            return conversation_lastest_summary or ''
 
     def __generate_additional_info(self, inputs: ChatwithDBState) -> dict:
         """
@@ -26,7 +26,7 @@ class UploadMessageMemoryInput(BaseModel):
 class UploadMessageMemoryService(BaseService):
     sql_database: SQLDatabase
 
-    async def process(self, inputs: UploadMessageMemoryInput) -> QAMemoryPair:
+    def process(self, inputs: UploadMessageMemoryInput) -> QAMemoryPair:
         try:
             message = MessageSchema(
                 id=str(uuid.uuid4()),
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import PlannerServiceState
 from aqi_agent.shared.models.state import SubTask
 from aqi_agent.shared.settings import PlannerSettings
-from fastapi.encoders import jsonable_encoder
+from aqi_agent.shared.utils import compile_prompt
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
 from lite_llm import MessageRole
 from logger import get_logger
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from .models import PlannerModel
 from .models import SubTaskModel
@@ -21,6 +28,20 @@ from .prompts import PLANNER_USER_PROMPT
 
 logger = get_logger(__name__)
 
+_render_user_prompt = compile_prompt(PLANNER_USER_PROMPT)
+
+# Known list-all questions ("list all districts", "liệt kê các tỉnh") are planned
+# without an LLM call; anything else, however simple it looks, goes to the planner
+_LIST_ALL_RX = re.compile(
+    r'^\s*(?:'
+    r'(?:list|show)(?: me)?(?: all)?(?: the)?|what are(?: all)? the'
+    r'|liệt kê|hiển thị|danh sách|cho (?:tôi|mình) xem'
+    r')\s+(?:tất cả\s+)?(?:các\s+)?'
+    r'(?:districts|provinces|components|pollutants|quận(?: huyện)?|tỉnh(?: thành)?|thành phần|chất ô nhiễm)'
+    r'\s*[.?!]?\s*$',
+    re.IGNORECASE,
+)
+
 
 class PlannerServiceInput(BaseModel):
     rephrased_question: str = Field(
@@ -75,6 +96,9 @@ class PlannerService(BaseService):
     litellm_service: LiteLLMService
     settings: PlannerSettings
 
+    _cache: OrderedDict[tuple[str, str], tuple[float, str]] = PrivateAttr(default_factory=OrderedDict)
+    _cache_locks: dict[tuple[str, str], asyncio.Lock] = PrivateAttr(default_factory=dict)
+
     @staticmethod
     def sanitize(content: str) -> str:
         """
@@ -90,6 +114,68 @@ class PlannerService(BaseService):
             return ''
         return content.strip().replace('\n\n', '\n')
 
+    @staticmethod
+    def _cache_key(question: str, *context: str) -> tuple[str, str]:
+        """
+        Build the plan cache key from the normalized question and a digest of its context.
+
+        Args:
+            question: The rephrased user question.
+            *context: Prompt context the plan depends on (schema, summary, history, ...).
+
+        Returns:
+            A (normalized question, blake2b context digest) tuple.
+        """
+        normalized = ' '.join(question.lower().split())
+        digest = hashlib.blake2b('\0'.join(context).encode('utf-8'), digest_size=16).hexdigest()
+        return normalized, digest
+
+    def _cache_get(self, key: tuple[str, str]) -> PlannerServiceOutput | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return PlannerServiceOutput.model_validate_json(payload)
+
+    def _cache_put(self, key: tuple[str, str], output: PlannerServiceOutput) -> None:
+        self._cache[key] = (time.monotonic() + self.settings.cache_ttl, output.model_dump_json())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.settings.cache_size:
+            evicted, _ = self._cache.popitem(last=False)
+            lock = self._cache_locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._cache_locks[evicted]
+
+    @staticmethod
+    def _trivial_plan(question: str) -> PlannerServiceOutput | None:
+        """
+        Build a single-step plan for known list-all questions.
+
+        Args:
+            question: The rephrased user question.
+
+        Returns:
+            A direct-query plan, or None when the question needs the LLM planner.
+        """
+        if not _LIST_ALL_RX.match(question):
+            return None
+        return PlannerServiceOutput(
+            subtasks=[
+                SubTaskModel(
+                    task_id='t1',
+                    description=question,
+                    depends_on=[],
+                    sql_hint='Direct SELECT without filtering, sorting or aggregation',
+                ),
+            ],
+            requires_clarification=False,
+            planning_summary='List-all question; planned without the LLM.',
+        )
+
     def _format_conversation_history(
         self,
         recent_turns: list[CompletionMessage],
@@ -124,6 +210,9 @@ class PlannerService(BaseService):
 
         Takes a rephrased user question along with context and generates
         clarification questions and ordered subtasks for SQL generation.
+        Known list-all questions get a single-step plan without an LLM call.
+        Plans are cached per normalized question and context; concurrent
+        requests for the same key wait for a single LLM call.
 
         Args:
             inputs: The input data containing the rephrased question,
@@ -137,16 +226,62 @@ class PlannerService(BaseService):
             ValueError: If the input question is invalid or missing.
             Exception: If the LLM service fails to process the request.
         """
+        if self.settings.skip_trivial:
+            trivial = self._trivial_plan(inputs.rephrased_question)
+            if trivial is not None:
+                logger.info('Planner skipped for list-all question')
+                return trivial
+
         recent_turns_txt = self._format_conversation_history(
             recent_turns=inputs.conversation_history,
         )
 
-        system_prompt = PLANNER_SYSTEM_PROMPT.format(
-            schema=inputs.schema if inputs.schema else 'Schema not provided.',
+        if self.settings.cache_size <= 0:
+            return await self._plan(inputs, recent_turns_txt)
+
+        key = self._cache_key(
+            inputs.rephrased_question,
+            inputs.schema,
+            inputs.conversation_summary,
+            recent_turns_txt,
+            inputs.additional_context,
         )
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info('Planner cache hit', extra={'question': key[0]})
+            return cached
 
-        # Build the user prompt
-        user_prompt = PLANNER_USER_PROMPT.format(
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+                output = await self._plan(inputs, recent_turns_txt)
+                self._cache_put(key, output)
+                return output
+        finally:
+            if key not in self._cache and not lock.locked():
+                self._cache_locks.pop(key, None)
+
+    async def _plan(
+        self,
+        inputs: PlannerServiceInput,
+        recent_turns_txt: str,
+    ) -> PlannerServiceOutput:
+        """
+        Call the LLM to build a plan for the given inputs.
+
+        Args:
+            inputs: The planner input.
+            recent_turns_txt: The formatted conversation history.
+
+        Returns:
+            The PlannerServiceOutput produced by the LLM.
+        """
+        # Build the user prompt; the schema lives here so the system prompt stays cacheable
+        user_prompt = _render_user_prompt(
+            schema=inputs.schema if inputs.schema else 'Schema not provided.',
             rephrased_question=inputs.rephrased_question,
             conversation_summary=inputs.conversation_summary or 'No summary available.',
             recent_turns=recent_turns_txt,
@@ -156,7 +291,8 @@ class PlannerService(BaseService):
         messages: list[CompletionMessage] = [
             CompletionMessage(
                 role=MessageRole.SYSTEM,
-                content=system_prompt,
+                content=PLANNER_SYSTEM_PROMPT,
+                cache_control={'type': 'ephemeral'},
             ),
             CompletionMessage(
                 role=MessageRole.USER,
@@ -172,10 +308,11 @@ class PlannerService(BaseService):
                 n=self.settings.n,
                 model=self.settings.model,
                 presence_penalty=self.settings.presence_penalty,
+                extra_body=self.settings.extra_body or None,
             ),
         )
 
-        planner_result: PlannerModel = PlannerModel(**jsonable_encoder(response.response))
+        planner_result = response.parsed(PlannerModel)
 
         logger.info(
             'Planner result',
@@ -5,7 +5,6 @@ from base import BaseService
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import RephraseServiceState
 from aqi_agent.shared.settings import RephraseQuestionSettings
-from fastapi.encoders import jsonable_encoder
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -166,7 +165,7 @@ class RephraseService(BaseService):
         except Exception as e:
             logger.exception('LLM processing failed', extra={'error': str(e)})
             raise e
-        rephrase_result: RephraseModel = RephraseModel(**jsonable_encoder(response.response))
+        rephrase_result = response.parsed(RephraseModel)
         logger.info(
             'Rephrase result',
             extra={
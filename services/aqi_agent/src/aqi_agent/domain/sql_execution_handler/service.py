@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+import orjson
 from base import BaseModel
 from base import BaseService
 from aqi_agent.shared.models.state import ChatwithDBState
@@ -8,12 +14,33 @@ from aqi_agent.shared.settings import SQLExecutionSettings
 from logger import get_logger
 from pg import SQLDatabase
 from pydantic import Field
+from pydantic import PrivateAttr
 from sqlalchemy import text
 
 from .utils import SQLExecutionMessage
 
 logger = get_logger(__name__)
 
+# Longest SQL prefix written to log records
+_LOG_SQL_LIMIT = 512
+
+# Speculative executions kept around waiting for the real query
+_MAX_SPECULATIVE = 32
+
+
+def _format_rows(columns: list[str], rows: list) -> str:
+    """
+    Serialize result rows as compact JSON for the answer-generation prompt.
+
+    Column names are emitted once, followed by one value array per row, instead of
+    the Python repr of Row tuples (``Decimal('45.2')``, ``datetime.date(...)``),
+    which spends several prompt tokens per value.
+    """
+    return orjson.dumps(
+        {'columns': columns, 'rows': [list(row) for row in rows]},
+        default=str,
+    ).decode()
+
 
 class SQLExecutionHandlerInput(BaseModel):
     sql_query: str = Field(..., description='The SQL query to be executed.')
@@ -29,8 +56,74 @@ class SQLExecutionHandlerService(BaseService):
     sql_database: SQLDatabase
     settings: SQLExecutionSettings
 
+    _speculative: dict[str, tuple[float, asyncio.Task]] = PrivateAttr(default_factory=dict)
+    _result_cache: OrderedDict[bytes, tuple[float, SQLExecutionHandlerOutput]] = PrivateAttr(default_factory=OrderedDict)
+
+    @staticmethod
+    def _cache_key(sql_query: str) -> bytes:
+        return hashlib.blake2b(sql_query.encode('utf-8'), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> SQLExecutionHandlerOutput | None:
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, output = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return output
+
+    def _cache_put(self, key: bytes, output: SQLExecutionHandlerOutput) -> None:
+        if output.error_message is not None:
+            return
+        self._result_cache[key] = (time.monotonic() + self.settings.result_cache_ttl, output)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.settings.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def _prune_speculative(self, now: float) -> None:
+        """Cancel speculative executions nobody claimed within ``settings.result_cache_ttl``."""
+        max_age = self.settings.result_cache_ttl
+        stale = [sql for sql, (started_at, _) in self._speculative.items() if now - started_at >= max_age]
+        for sql in stale:
+            self._speculative.pop(sql)[1].cancel()
+
+    def speculate(self, sql_query: str) -> None:
+        """
+        Start executing a likely query in a worker thread before it is confirmed.
+
+        If ``process`` is later called with the same query text within
+        ``settings.result_cache_ttl`` seconds, it reuses this execution instead of
+        running the query again; older executions are dropped so they can't serve
+        stale rows. Only pass queries that have already passed SQL validation.
+
+        Args:
+            sql_query: The validated (sanitized) SQL query.
+        """
+        if not sql_query:
+            return
+        now = time.monotonic()
+        self._prune_speculative(now)
+        if sql_query in self._speculative:
+            return
+        while len(self._speculative) >= _MAX_SPECULATIVE:
+            self._speculative.pop(next(iter(self._speculative)))[1].cancel()
+        self._speculative[sql_query] = (now, asyncio.create_task(asyncio.to_thread(self._execute, sql_query)))
+
+    def discard(self, sql_query: str) -> None:
+        """Drop a speculative execution that turned out not to be needed."""
+        entry = self._speculative.pop(sql_query, None)
+        if entry is not None:
+            entry[1].cancel()
+
     async def process(self, inputs: SQLExecutionHandlerInput) -> SQLExecutionHandlerOutput:
-        """Execute the provided SQL query using the configured SQLDatabase."""
+        """
+        Execute the provided SQL query using the configured SQLDatabase.
+
+        Successful results are cached for ``settings.result_cache_ttl`` seconds,
+        keyed by the exact query text.
+        """
         if not inputs.sql_query or not inputs.sql_query.strip():
             logger.warning(SQLExecutionMessage.EMPTY_QUERY.value)
 
@@ -38,19 +131,47 @@ class SQLExecutionHandlerService(BaseService):
                 execution_result=None,
                 error_message=SQLExecutionMessage.EMPTY_QUERY.value,
             )
+
+        use_cache = self.settings.result_cache_size > 0
+        key = self._cache_key(inputs.sql_query)
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                logger.info('SQL result cache hit', extra={'sql_query': inputs.sql_query[:_LOG_SQL_LIMIT]})
+                self.discard(inputs.sql_query)
+                return cached
+
+        self._prune_speculative(time.monotonic())
+        entry = self._speculative.pop(inputs.sql_query, None)
+        task = entry[1] if entry is not None else None
+        if task is not None and not task.cancelled():
+            logger.info('Reusing speculative SQL execution', extra={'sql_query': inputs.sql_query[:_LOG_SQL_LIMIT]})
+            output = await task
+        else:
+            output = self._execute(inputs.sql_query)
+
+        if use_cache:
+            self._cache_put(key, output)
+        return output
+
+    def _execute(self, sql_query: str) -> SQLExecutionHandlerOutput:
         try:
             with self.sql_database.get_session() as session:
-                result = session.execute(text(inputs.sql_query))
-                result = result.fetchall()
-                number_of_rows = len(result)
-                execution_result = str(result) if number_of_rows <= self.settings.max_rows else str(result[:self.settings.max_rows]) + f'... (and {number_of_rows - self.settings.max_rows} more rows)'
+                cursor = session.execute(text(sql_query))
+                columns = list(cursor.keys())
+                # Only the displayed rows are materialized; the rest are counted as they stream past
+                result = cursor.fetchmany(self.settings.max_rows)
+                number_of_rows = len(result) + sum(1 for _ in cursor)
+                execution_result = _format_rows(columns, result)
+                if number_of_rows > self.settings.max_rows:
+                    execution_result += f'... (and {number_of_rows - self.settings.max_rows} more rows)'
 
-                logger.info(SQLExecutionMessage.SUCCESS.value, extra={'sql_query': inputs.sql_query, 'number_of_rows': number_of_rows})
+                logger.info(SQLExecutionMessage.SUCCESS.value, extra={'sql_query': sql_query[:_LOG_SQL_LIMIT], 'number_of_rows': number_of_rows})
 
         except Exception as e:
             logger.warning(
                 SQLExecutionMessage.EXECUTION_FAILED.value.format(error_message=str(e)),
-                extra={'sql_query': inputs.sql_query},
+                extra={'sql_query': sql_query[:_LOG_SQL_LIMIT]},
             )
             return SQLExecutionHandlerOutput(execution_result=None, error_message=str(e), number_of_rows=None)
 
@@ -115,7 +236,7 @@ class SQLExecutionHandlerService(BaseService):
         except Exception as e:
             logger.warning(
                 SQLExecutionMessage.UNEXPECTED_ERROR.value.format(error_message=str(e)),
-                extra={'sql_query': state.get('sql_validator_state', {}).get('sanitized_query', '')},
+                extra={'sql_query': (state.get('sql_validator_state', {}).get('sanitized_query') or '')[:_LOG_SQL_LIMIT]},
             )
             return {
                 'sql_execution_state': SQLExecutionState(
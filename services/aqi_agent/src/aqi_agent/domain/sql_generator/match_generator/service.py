@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import re
+
 from aqi_agent.domain.sql_generator.base import BaseSQLGeneratorService
 from aqi_agent.domain.sql_generator.base import BaseSQLGeneratorServiceInput
 from aqi_agent.domain.sql_generator.base import BaseSQLGeneratorServiceOutput
 from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import SQLGeneratorState
-from aqi_agent.shared.settings import SQLGeneratorSettings
-from fastapi.encoders import jsonable_encoder
+from aqi_agent.domain.sql_execution_handler import SQLExecutionHandlerService
+from aqi_agent.domain.sql_validator import SQLValidatorInput
+from aqi_agent.domain.sql_validator import SQLValidatorService
+from aqi_agent.shared.settings import MatchSQLGeneratorSettings
+from aqi_agent.shared.utils import payload_digest
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -18,6 +23,8 @@ from .prompts import MATCH_GENERATOR_USER_PROMPT
 
 logger = get_logger(__name__)
 
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
 
 class MatchSQLGeneratorServiceInput(BaseSQLGeneratorServiceInput):
     """
@@ -43,7 +50,58 @@ class MatchSQLGeneratorService(BaseSQLGeneratorService):
     combined with the pruned schema and rephrased question, to generate SQL queries.
     """
     litellm_service: LiteLLMService
-    settings: SQLGeneratorSettings
+    settings: MatchSQLGeneratorSettings
+    sql_execution_handler_service: SQLExecutionHandlerService | None = None
+
+    @staticmethod
+    def _normalize_question(question: str) -> str:
+        """Casefold and collapse punctuation/whitespace so trivially different phrasings compare equal."""
+        return _NON_WORD_RE.sub(' ', question.casefold()).strip()
+
+    def _find_exact_example(self, question: str, examples: list[dict]) -> dict | None:
+        """
+        Find an example whose question is the same as the input question after normalization.
+
+        Args:
+            question: The rephrased user question.
+            examples: List of dicts with 'question' and 'sql_query' keys.
+
+        Returns:
+            The matching example, or None if no example matches exactly.
+        """
+        normalized = self._normalize_question(question)
+        if not normalized:
+            return None
+        for example in examples:
+            if example.get('sql_query') and self._normalize_question(example.get('question', '')) == normalized:
+                return example
+        return None
+
+    async def _speculate_example_sql(self, examples: list[dict]) -> str | None:
+        """
+        Start executing the top-ranked example's SQL while the LLM generates.
+
+        The example SQL is validated first and keyed by its sanitized form, which is
+        exactly what the execution node receives if the LLM returns the same query.
+
+        Args:
+            examples: Retrieved examples, best match first.
+
+        Returns:
+            The sanitized SQL being executed speculatively, or None if nothing was started.
+        """
+        if not (self.settings.speculative_execution and self.sql_execution_handler_service and examples):
+            return None
+        sql_query = examples[0].get('sql_query', '')
+        if not sql_query:
+            return None
+
+        validation = SQLValidatorService().process(SQLValidatorInput(sql_query=sql_query))
+        if not validation.is_valid or not validation.sanitized_query:
+            return None
+
+        self.sql_execution_handler_service.speculate(validation.sanitized_query)
+        return validation.sanitized_query
 
     def _format_examples(self, examples: list[dict]) -> str:
         """
@@ -76,6 +134,8 @@ class MatchSQLGeneratorService(BaseSQLGeneratorService):
 
         Takes a rephrased question, pruned schema, and similar examples,
         then uses a language model to generate an appropriate SQL query.
+        If the question is identical (after normalization) to one of the
+        examples, that example's SQL is returned without calling the model.
 
         Args:
             inputs: MatchSQLGeneratorServiceInput containing the question, schema, and examples.
@@ -86,6 +146,15 @@ class MatchSQLGeneratorService(BaseSQLGeneratorService):
         Raises:
             Exception: If the LLM service fails to process the request.
         """
+        # Fast path: the question is a known example, reuse its SQL without an LLM call
+        exact_example = self._find_exact_example(inputs.question, inputs.examples)
+        if exact_example:
+            logger.info(
+                'Question matches an indexed example exactly, skipping LLM SQL generation.',
+                extra={'example_id': exact_example.get('id'), 'question': inputs.question},
+            )
+            return MatchSQLGeneratorServiceOutput(sql_query=exact_example['sql_query'])
+
         try:
             formatted_examples = self._format_examples(inputs.examples)
         except ValueError as e:
@@ -93,11 +162,15 @@ class MatchSQLGeneratorService(BaseSQLGeneratorService):
                 'Error formatting examples for SQL generation.',
                 extra={
                     'error': str(e),
-                    'examples': inputs.examples,
+                    'examples_count': len(inputs.examples),
+                    'examples_hash': payload_digest(inputs.examples),
                 },
             )
             raise
 
+        # Hide execution latency behind the LLM call when the model reuses the top example
+        speculative_sql = await self._speculate_example_sql(inputs.examples)
+
         try:
             response = await self.litellm_service.process_async(
                 inputs=LiteLLMInput(
@@ -123,15 +196,22 @@ class MatchSQLGeneratorService(BaseSQLGeneratorService):
                 ),
             )
 
-            return MatchSQLGeneratorServiceOutput(**jsonable_encoder(response.response))
+            output = response.parsed(MatchSQLGeneratorServiceOutput)
+            if speculative_sql and output.sql_query.strip() != inputs.examples[0]['sql_query'].strip():
+                self.sql_execution_handler_service.discard(speculative_sql)
+            return output
         except Exception as e:
+            if speculative_sql:
+                self.sql_execution_handler_service.discard(speculative_sql)
             logger.exception(
                 'LLM processing error during sql match and generate process .',
                 extra={
                     'error': str(e),
                     'question': inputs.question,
-                    'db_schema': inputs.db_schema,
-                    'examples': inputs.examples,
+                    'db_schema_len': len(inputs.db_schema),
+                    'db_schema_hash': payload_digest(inputs.db_schema),
+                    'examples_count': len(inputs.examples),
+                    'examples_hash': payload_digest(inputs.examples),
                 },
             )
             raise
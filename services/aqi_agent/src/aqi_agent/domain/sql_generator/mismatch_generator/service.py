@@ -7,7 +7,7 @@ from aqi_agent.shared.models.state import ChatwithDBState
 from aqi_agent.shared.models.state import SQLGeneratorState
 from aqi_agent.shared.models.state import SubTask
 from aqi_agent.shared.settings.sql_generator import SQLGeneratorSettings
-from fastapi.encoders import jsonable_encoder
+from aqi_agent.shared.utils import payload_digest
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -150,7 +150,8 @@ class MismatchSQLGeneratorService(BaseSQLGeneratorService):
                 'Error formatting examples for SQL generation.',
                 extra={
                     'error': str(e),
-                    'examples': inputs.examples,
+                    'examples_count': len(inputs.examples),
+                    'examples_hash': payload_digest(inputs.examples),
                 },
             )
             formatted_examples = ''
@@ -190,7 +191,7 @@ class MismatchSQLGeneratorService(BaseSQLGeneratorService):
                 ),
             )
 
-            return MismatchSQLGeneratorServiceOutput(**jsonable_encoder(response.response))
+            return response.parsed(MismatchSQLGeneratorServiceOutput)
         except Exception as e:
             logger.exception(
                 'Error during SQL generation with LLM service.',
@@ -198,8 +199,9 @@ class MismatchSQLGeneratorService(BaseSQLGeneratorService):
                     'error': str(e),
                     'rephrased_question': inputs.rephrased_question,
                     'planning_summary': inputs.planning_summary,
-                    'subtasks': inputs.subtasks,
-                    'db_schema': inputs.db_schema,
+                    'subtasks_count': len(inputs.subtasks),
+                    'db_schema_len': len(inputs.db_schema),
+                    'db_schema_hash': payload_digest(inputs.db_schema),
                 },
             )
             raise e
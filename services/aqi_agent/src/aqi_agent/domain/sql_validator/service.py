@@ -31,6 +31,9 @@ BLACKLIST_KEYWORDS = [
     'EXEC',
 ]
 
+# One pre-compiled alternation instead of building and matching a pattern per keyword
+_BLACKLIST_RE = re.compile(r'\b(?:' + '|'.join(BLACKLIST_KEYWORDS) + r')\b', re.IGNORECASE)
+
 
 class SQLValidatorInput(BaseModel):
     """Input model for SQL validation."""
@@ -55,20 +58,18 @@ class SQLValidatorService(BaseService):
 
     def _check_blacklist_keywords(self, sql_query: str) -> tuple[bool, str | None]:
         """Check if SQL query contains any blacklisted keywords."""
-        sql_upper = sql_query.upper()
-
-        for keyword in BLACKLIST_KEYWORDS:
-            pattern = r'\b' + keyword + r'\b'
-            if re.search(pattern, sql_upper):
-                error_msg = f'Dangerous keyword detected: {keyword}. Only SELECT queries are allowed.'
-                logger.warning(
-                    'Blacklist keyword detected',
-                    extra={
-                        'keyword': keyword,
-                        'sql_query': sql_query,
-                    },
-                )
-                return False, error_msg
+        match = _BLACKLIST_RE.search(sql_query)
+        if match:
+            keyword = match.group().upper()
+            error_msg = f'Dangerous keyword detected: {keyword}. Only SELECT queries are allowed.'
+            logger.warning(
+                'Blacklist keyword detected',
+                extra={
+                    'keyword': keyword,
+                    'sql_query': sql_query,
+                },
+            )
+            return False, error_msg
 
         return True, None
 
@@ -124,7 +125,7 @@ class SQLValidatorService(BaseService):
             )
             return False, error_msg, None
 
-    async def process(self, inputs: SQLValidatorInput) -> SQLValidatorOutput:
+    def process(self, inputs: SQLValidatorInput) -> SQLValidatorOutput:
         """Validate SQL query through multiple security layers."""
         sql_query = inputs.sql_query.strip()
 
@@ -170,7 +171,7 @@ class SQLValidatorService(BaseService):
         try:
             sql_query = state.get('sql_generator_state', {}).get('sql_query', '')
 
-            output = await self.process(
+            output = self.process(
                 SQLValidatorInput(sql_query=sql_query),
             )
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 from .service import TablePrunerInput
 from .service import TablePrunerOutput
 from .service import TablePrunerService
+from .service import clear_exact_cache
 
 __all__ = [
     'TablePrunerInput',
     'TablePrunerOutput',
     'TablePrunerService',
+    'clear_exact_cache',
 ]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-process cache of serialized results keyed by question embeddings.
+
+    A lookup hits when a stored embedding has cosine similarity of at least
+    ``threshold`` with the query embedding, so rephrasings of a templated
+    question ("AQI hôm nay ở ...") reuse the same result. Vectors are stored
+    unit-normalized in one float32 matrix, so a miss costs a single
+    matrix-vector product instead of a Python loop over the entries.
+
+    Args:
+        threshold (float): Minimum cosine similarity for a hit.
+        max_size (int): Maximum number of entries; least recently used entries are evicted.
+        ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_size: int = 256, ttl: float = 3600.0) -> None:
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self._slots: dict[str, int] = {}
+        self._keys: list[str | None] = [None] * max_size
+        self._payloads: list[str | None] = [None] * max_size
+        self._expires_at = np.full(max_size, -np.inf)
+        self._last_used = np.zeros(max_size, dtype=np.int64)
+        self._vectors: np.ndarray | None = None
+        self._clock = 0
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array)) or 1.0
+        return array / norm
+
+    def _touch(self, slot: int) -> str | None:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+        return self._payloads[slot]
+
+    def get(self, key: str, vector: list[float]) -> str | None:
+        """
+        Return the payload stored for ``key`` or for the most similar embedding.
+
+        Args:
+            key (str): Exact-match key, e.g. the normalized question.
+            vector (list[float]): Embedding of the question.
+
+        Returns:
+            str | None: The cached payload, or None on a miss.
+        """
+        now = time.monotonic()
+        slot = self._slots.get(key)
+        if slot is not None and self._expires_at[slot] > now:
+            return self._touch(slot)
+
+        if self._vectors is None or len(vector) != self._vectors.shape[1]:
+            return None
+
+        scores = self._vectors @ self._normalize(vector)
+        scores[self._expires_at <= now] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._touch(best)
+
+    def put(self, key: str, vector: list[float], payload: str) -> None:
+        """
+        Store a payload under ``key`` and its embedding, reusing expired or least recently used slots.
+
+        Args:
+            key (str): Exact-match key, e.g. the normalized question.
+            vector (list[float]): Embedding of the question.
+            payload (str): Serialized result to cache.
+        """
+        if self.max_size <= 0:
+            return
+        if self._vectors is None or len(vector) != self._vectors.shape[1]:
+            # First entry, or the embedding model changed: start over at the new dimension
+            self._vectors = np.zeros((self.max_size, len(vector)), dtype=np.float32)
+            self._slots.clear()
+            self._keys = [None] * self.max_size
+            self._payloads = [None] * self.max_size
+            self._expires_at.fill(-np.inf)
+
+        now = time.monotonic()
+        slot = self._slots.get(key)
+        if slot is None:
+            expired = np.flatnonzero(self._expires_at <= now)
+            slot = int(expired[0]) if expired.size else int(np.argmin(self._last_used))
+            old_key = self._keys[slot]
+            if old_key is not None:
+                del self._slots[old_key]
+            self._slots[key] = slot
+            self._keys[slot] = key
+
+        self._vectors[slot] = self._normalize(vector)
+        self._payloads[slot] = payload
+        self._expires_at[slot] = now + self.ttl
+        self._touch(slot)
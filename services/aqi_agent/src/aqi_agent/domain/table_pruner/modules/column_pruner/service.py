@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from base import BaseModel
@@ -9,6 +11,9 @@ from aqi_agent.domain.table_pruner.modules.column_pruner.models import ColumnPru
 from aqi_agent.domain.table_pruner.modules.column_pruner.prompts import COLUMN_SELECTION_SYSTEM_PROMPT
 from aqi_agent.domain.table_pruner.modules.column_pruner.prompts import COLUMN_SELECTION_USER_PROMPT
 from aqi_agent.shared.settings.table_pruner import TablePrunerSettings
+from aqi_agent.shared.utils import compile_prompt
+from aqi_agent.shared.utils import current_date_time
+from aqi_agent.shared.utils import payload_digest
 from lite_llm import CompletionMessage
 from lite_llm import LiteLLMInput
 from lite_llm import LiteLLMService
@@ -17,6 +22,69 @@ from logger import get_logger
 
 logger = get_logger(__name__)
 
+_render_user_prompt = compile_prompt(COLUMN_SELECTION_USER_PROMPT)
+
+
+@lru_cache(maxsize=4096)
+def _format_column(
+    col_name: str,
+    col_type: str,
+    description: str,
+    examples: tuple[str, ...],
+) -> str:
+    """
+    Format one DDL column line; table metadata is static, so lines are memoized across requests.
+
+    Args:
+        col_name (str): Column name
+        col_type (str): Column type
+        description (str): Column description
+        examples (tuple[str, ...]): Example values
+
+    Returns:
+        str: Column definition with its description and examples as a trailing comment
+    """
+    col_def = f'    {col_name} {col_type}'
+
+    comments = []
+    if description:
+        comments.append(description)
+    if examples:
+        comments.append(f"Example: {', '.join(examples)}")
+
+    if comments:
+        col_def += f"  -- {'; '.join(comments)}"
+
+    return col_def
+
+
+def _column_definition(col: dict[str, Any]) -> str:
+    properties = col.get('properties', {})
+    return _format_column(
+        col.get('name', 'unknown'),
+        col.get('type', 'VARCHAR'),
+        properties.get('description', ''),
+        tuple(str(e) for e in properties.get('example', [])),
+    )
+
+
+@dataclass(slots=True)
+class _TableColumns:
+    """Column-wise view of one retrieved table: names and DDL lines as parallel lists."""
+    table_name: str
+    names: list[str]
+    definitions: list[str]
+
+
+def _table_columns(table_result: dict[str, Any]) -> _TableColumns:
+    metadata = table_result.get('_source', {}).get('metadata', {})
+    columns = metadata.get('columns', [])
+    return _TableColumns(
+        table_name=metadata.get('table_name', 'unknown_table'),
+        names=[col.get('name', 'unknown') for col in columns],
+        definitions=[_column_definition(col) for col in columns],
+    )
+
 
 class ColumnPrunerInput(BaseModel):
     question: str
@@ -44,42 +112,15 @@ class ColumnPrunerService(BaseService):
         """
         ddl_statements = []
 
-        for table_result in retrieved_tables:
-            source = table_result.get('_source', {})
-            metadata = source.get('metadata', {})
-            table_name = metadata.get('table_name', 'unknown_table')
-            columns = metadata.get('columns', [])
-
-            if not columns:
+        for table in map(_table_columns, retrieved_tables):
+            if not table.definitions:
                 continue
 
-            column_definitions = []
-            for col in columns:
-                col_name = col.get('name', 'unknown')
-                col_type = col.get('type', 'VARCHAR')
-                properties = col.get('properties', {})
-                description = properties.get('description', '')
-                examples = properties.get('example', [])
-
-                col_def = f'    {col_name} {col_type}'
-
-                comments = []
-                if description:
-                    comments.append(description)
-                if examples:
-                    example_str = ', '.join(str(e) for e in examples)
-                    comments.append(f'Example: {example_str}')
-
-                if comments:
-                    col_def += f"  -- {'; '.join(comments)}"
-
-                column_definitions.append(col_def)
-
-            ddl = f'CREATE TABLE {table_name} (\n'
-            ddl += ',\n'.join(column_definitions)
-            ddl += '\n);'
-
-            ddl_statements.append(ddl)
+            ddl_statements.append(''.join([
+                f'CREATE TABLE {table.table_name} (\n',
+                ',\n'.join(table.definitions),
+                '\n);',
+            ]))
 
         return '\n\n'.join(ddl_statements)
 
@@ -99,58 +140,31 @@ class ColumnPrunerService(BaseService):
             str: DDL formatted schema string with only selected columns
         """
         selection_map = {
-            result.table_name: result.columns
+            result.table_name: set(result.columns)
             for result in column_selection.results
         }
 
         ddl_statements = []
 
         for table_result in retrieved_tables:
-            source = table_result.get('_source', {})
-            metadata = source.get('metadata', {})
-            table_name = metadata.get('table_name', 'unknown_table')
-            columns = metadata.get('columns', [])
-
-            if table_name not in selection_map:
-                continue
-
-            selected_column_names = selection_map[table_name]
+            table = _table_columns(table_result)
+            selected_column_names = selection_map.get(table.table_name)
 
             if not selected_column_names:
                 continue
 
-            column_definitions = []
-            for col in columns:
-                col_name = col.get('name', 'unknown')
-
-                if col_name not in selected_column_names:
-                    continue
-
-                col_type = col.get('type', 'VARCHAR')
-                properties = col.get('properties', {})
-                description = properties.get('description', '')
-                examples = properties.get('example', [])
-
-                col_def = f'    {col_name} {col_type}'
-
-                comments = []
-                if description:
-                    comments.append(description)
-                if examples:
-                    example_str = ', '.join(str(e) for e in examples)
-                    comments.append(f'Example: {example_str}')
-
-                if comments:
-                    col_def += f"  -- {'; '.join(comments)}"
-
-                column_definitions.append(col_def)
+            column_definitions = [
+                definition
+                for name, definition in zip(table.names, table.definitions)
+                if name in selected_column_names
+            ]
 
             if column_definitions:
-                ddl = f'CREATE TABLE {table_name} (\n'
-                ddl += ',\n'.join(column_definitions)
-                ddl += ',\n    createdAt DATETIME'
-                ddl += '\n);'
-                ddl_statements.append(ddl)
+                ddl_statements.append(''.join([
+                    f'CREATE TABLE {table.table_name} (\n',
+                    ',\n'.join(column_definitions),
+                    ',\n    createdAt DATETIME\n);',
+                ]))
 
         return '\n\n'.join(ddl_statements)
 
@@ -171,7 +185,8 @@ class ColumnPrunerService(BaseService):
                 'Failed to build DDL schema from retrieved tables',
                 extra={
                     'question': inputs.question,
-                    'retrieved_tables': inputs.retrieved_tables,
+                    'retrieved_tables_count': len(inputs.retrieved_tables),
+                    'retrieved_tables_hash': payload_digest(inputs.retrieved_tables),
                     'error': str(e),
                 },
             )
@@ -197,10 +212,10 @@ class ColumnPrunerService(BaseService):
                         ),
                         CompletionMessage(
                             role=MessageRole.USER,
-                            content=COLUMN_SELECTION_USER_PROMPT.format(
+                            content=_render_user_prompt(
                                 schema=schema,
                                 question=inputs.question,
-                                current_date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                                current_date=current_date_time(),
                             ),
                         ),
                     ],
@@ -229,16 +244,17 @@ class ColumnPrunerService(BaseService):
                 column_selection=column_selection,
             )
 
-            logger.info(
-                'Column pruning completed',
-                extra={
-                    'question': inputs.question,
-                    'tables_count': len(column_selection.results),
-                    'total_columns_selected': sum(
-                        len(r.columns) for r in column_selection.results
-                    ),
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    'Column pruning completed',
+                    extra={
+                        'question': inputs.question,
+                        'tables_count': len(column_selection.results),
+                        'total_columns_selected': sum(
+                            len(r.columns) for r in column_selection.results
+                        ),
+                    },
+                )
 
             return ColumnPrunerOutput(
                 pruned_schema=pruned_schema,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from .cache import EmbeddingCache
+from .quantization import quantize_int8
 from .service import TableIndexerInput
 from .service import TableIndexerOutput
 from .service import TableIndexerService
@@ -8,4 +10,6 @@ __all__ = [
     'TableIndexerService',
     'TableIndexerInput',
     'TableIndexerOutput',
+    'EmbeddingCache',
+    'quantize_int8',
 ]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from array import array
+from pathlib import Path
+
+DEFAULT_EMBEDDING_CACHE_PATH = Path.home() / '.cache' / 'aqi_agent' / 'emb.db'
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of embedding vectors keyed by (sha256(text), provider, model, dimensions).
+
+    Vectors are stored as float32 blobs in a SQLite database so re-indexing unchanged
+    table descriptions does not call the embedding API again.
+
+    Args:
+        path (str | Path): Location of the SQLite database file; parent directories are created.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_EMBEDDING_CACHE_PATH) -> None:
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS embeddings ('
+            'hash TEXT, provider TEXT, model TEXT, dim INT, vec BLOB, '
+            'PRIMARY KEY (hash, provider, model, dim))',
+        )
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get_many(
+        self,
+        texts: list[str],
+        provider: str,
+        model: str,
+        dimensions: int,
+    ) -> dict[str, list[float]]:
+        """
+        Look up cached vectors for the given texts.
+
+        Args:
+            texts (list[str]): Texts to look up.
+            provider (str): Embedding provider identifier.
+            model (str): Embedding model name.
+            dimensions (int): Embedding dimensions.
+
+        Returns:
+            dict[str, list[float]]: Cached vectors keyed by text; misses are absent.
+        """
+        hashes = {self.text_hash(text): text for text in texts}
+        if not hashes:
+            return {}
+
+        placeholders = ', '.join('?' * len(hashes))
+        rows = self._conn.execute(
+            f'SELECT hash, vec FROM embeddings WHERE provider = ? AND model = ? AND dim = ? AND hash IN ({placeholders})',
+            (provider, model, dimensions, *hashes),
+        )
+        return {hashes[digest]: array('f', vec).tolist() for digest, vec in rows}
+
+    def put_many(
+        self,
+        vectors: dict[str, list[float]],
+        provider: str,
+        model: str,
+        dimensions: int,
+    ) -> None:
+        """
+        Store vectors for the given texts, replacing existing entries.
+
+        Args:
+            vectors (dict[str, list[float]]): Vectors keyed by text.
+            provider (str): Embedding provider identifier.
+            model (str): Embedding model name.
+            dimensions (int): Embedding dimensions.
+        """
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO embeddings (hash, provider, model, dim, vec) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (self.text_hash(text), provider, model, dimensions, array('f', vector).tobytes())
+                    for text, vector in vectors.items()
+                ],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
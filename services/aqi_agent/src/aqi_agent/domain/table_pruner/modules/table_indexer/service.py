@@ -12,6 +12,9 @@ from logger import get_logger
 from opensearch import AddDocumentInput
 from opensearch import OpenSearchService
 
+from .cache import EmbeddingCache
+from .quantization import quantize_int8
+
 logger = get_logger(__name__)
 
 
@@ -19,6 +22,8 @@ class TableIndexerInput(BaseModel):
     index_body: dict[str, Any]
     search_pipeline_body: dict[str, Any]
     mdl: dict[str, Any]
+    embedding_batch_size: int = 64
+    concurrency: int = 1
 
 
 class TableIndexerOutput(BaseModel):
@@ -30,6 +35,7 @@ class TableIndexerService(BaseService):
     opensearch_service: OpenSearchService
     litellm_service: LiteLLMService
     settings: TablePrunerSettings
+    embedding_cache: EmbeddingCache | None = None
 
     def create_search_pipeline(self, pipeline_id: str, pipeline_body: dict[str, Any]) -> bool:
         """
@@ -99,51 +105,85 @@ class TableIndexerService(BaseService):
             )
             raise e
 
-    async def index_tables(self, mdl: dict) -> bool:
+    async def index_tables(
+        self,
+        mdl: dict,
+        embedding_batch_size: int = 64,
+        concurrency: int = 1,
+    ) -> bool:
         """
-        Index table descriptions and embeddings into OpenSearch. For each table in the MDL, generate an embedding for its description and index it along with metadata about the table.
+        Index table descriptions and embeddings into OpenSearch. Descriptions already in the embedding cache are reused; the rest are embedded in batches of `embedding_batch_size` texts per request and written back to the cache. Each vector is indexed along with metadata about its table.
 
         Args:
             mdl (dict): The MDL containing table models to be indexed.
+            embedding_batch_size (int): Maximum number of descriptions sent in one embedding request.
+            concurrency (int): Number of threads sending bulk indexing requests concurrently.
 
         Raises:
-            e: If embedding generation or indexing fails.
+            e: If indexing fails.
 
         Returns:
             bool: True if the tables were indexed successfully, False otherwise.
         """
-        documents: list[AddDocumentInput] = []
-        for i, model in enumerate(mdl['models']):
+        models = mdl['models']
+        embedding_settings = self.opensearch_service.settings
+        cache_key = {
+            'provider': self.litellm_service.settings.url.unicode_string(),
+            'model': embedding_settings.embedding_model,
+            'dimensions': embedding_settings.dimensions,
+        }
+
+        texts = list(dict.fromkeys(model['properties']['description'] for model in models))
+        vectors = self.embedding_cache.get_many(texts, **cache_key) if self.embedding_cache else {}
+        misses = [text for text in texts if text not in vectors]
+        logger.info(f'Embedding cache: {len(vectors)} hit(s), {len(misses)} miss(es)')
+
+        for start in range(0, len(misses), embedding_batch_size):
+            batch = misses[start:start + embedding_batch_size]
             try:
-                if i > 0:
+                if start > 0:
                     await asyncio.sleep(1)  # Rate limit protection
-                text = model['properties']['description']
                 embedding_output = await self.litellm_service.embedding_async(
                     inputs=LiteLLMEmbeddingInput(
-                        input=text,
-                        embedding_model=self.opensearch_service.settings.embedding_model,
-                        encoding_format=self.opensearch_service.settings.encoding_format,
-                        dimensions=self.opensearch_service.settings.dimensions,
-                    ),
-                )
-                documents.append(
-                    AddDocumentInput(
-                        text=text,
-                        embedding=embedding_output.vector,
-                        metadata={
-                            'table_name': model['name'],
-                            'columns': model['columns'],
-                        },
+                        input=batch,
+                        embedding_model=embedding_settings.embedding_model,
+                        encoding_format=embedding_settings.encoding_format,
+                        dimensions=embedding_settings.dimensions,
                     ),
                 )
             except Exception as e:
                 logger.warning(
-                    'Failed to generate embedding for table description',
+                    'Failed to generate embeddings for table descriptions',
                     extra={
-                        'table_model': model,
+                        'texts': batch,
                         'error': str(e),
                     },
                 )
+                continue
+
+            batch_vectors = dict(zip(batch, embedding_output.vectors))
+            vectors.update(batch_vectors)
+            if self.embedding_cache:
+                self.embedding_cache.put_many(batch_vectors, **cache_key)
+
+        # The cache keeps float vectors; byte indexes get them quantized here
+        quantize = self.settings.embedding_data_type == 'byte'
+        documents: list[AddDocumentInput] = []
+        for model in models:
+            text = model['properties']['description']
+            if text not in vectors:
+                continue
+            documents.append(
+                AddDocumentInput(
+                    text=text,
+                    embedding=quantize_int8(vectors[text]) if quantize else vectors[text],
+                    id=model['name'],
+                    metadata={
+                        'table_name': model['name'],
+                        'columns': model['columns'],
+                    },
+                ),
+            )
 
         if not documents:
             logger.warning('No documents to index into OpenSearch')
@@ -153,6 +193,7 @@ class TableIndexerService(BaseService):
             result = self.opensearch_service.add_documents(
                 documents=documents,
                 index_name=self.settings.index_name,
+                thread_count=concurrency,
             )
             if not result:
                 logger.warning('Documents indexing was not successful')
@@ -186,6 +227,8 @@ class TableIndexerService(BaseService):
 
         index_tables_result = await self.index_tables(
             mdl=inputs.mdl,
+            embedding_batch_size=inputs.embedding_batch_size,
+            concurrency=inputs.concurrency,
         )
 
         _ = self.create_search_pipeline(
@@ -4,6 +4,7 @@ from typing import Any
 
 from base import BaseModel
 from base import BaseService
+from aqi_agent.domain.table_pruner.modules.table_indexer import quantize_int8
 from aqi_agent.shared.settings import TablePrunerSettings
 from lite_llm import LiteLLMEmbeddingInput
 from lite_llm import LiteLLMService
@@ -13,9 +14,14 @@ from opensearch import OpenSearchService
 
 logger = get_logger(__name__)
 
+# Read-only; shared by every search request instead of being rebuilt per call
+_SOURCE_FILTER: dict[str, Any] = {'excludes': ['embedding']}
+
 
 class TableRetrievalInput(BaseModel):
     query: str
+    # Precomputed query embedding; computed here when omitted
+    embedding: list[float] | None = None
 
 
 class TableRetrievalOutput(BaseModel):
@@ -27,6 +33,26 @@ class TableRetrievalService(BaseService):
     litellm_service: LiteLLMService
     settings: TablePrunerSettings
 
+    async def embed_query(self, query: str) -> list[float]:
+        """
+        Embed a question with the model configured for the table index.
+
+        Args:
+            query (str): The question to embed.
+
+        Returns:
+            list[float]: The embedding vector.
+        """
+        embedding = await self.litellm_service.embedding_async(
+            inputs=LiteLLMEmbeddingInput(
+                input=query,
+                embedding_model=self.opensearch_service.settings.embedding_model,
+                encoding_format=self.opensearch_service.settings.encoding_format,
+                dimensions=self.opensearch_service.settings.dimensions,
+            ),
+        )
+        return embedding.vector
+
     async def process(self, inputs: TableRetrievalInput) -> TableRetrievalOutput:
         """
         Main processing function for the TableRetrievalService. This function generates an embedding for the input query and performs a hybrid search over indexed table descriptions in OpenSearch to retrieve relevant tables.
@@ -41,14 +67,11 @@ class TableRetrievalService(BaseService):
             TableRetrievalOutput: The output data for the table retrieval process.
         """
         try:
-            embedding = await self.litellm_service.embedding_async(
-                inputs=LiteLLMEmbeddingInput(
-                    input=inputs.query,
-                    embedding_model=self.opensearch_service.settings.embedding_model,
-                    encoding_format=self.opensearch_service.settings.encoding_format,
-                    dimensions=self.opensearch_service.settings.dimensions,
-                ),
-            )
+            vector = inputs.embedding
+            if vector is None:
+                vector = await self.embed_query(inputs.query)
+            if self.settings.embedding_data_type == 'byte':
+                vector = quantize_int8(vector)
         except Exception as e1:
             logger.exception(
                 'Failed to generate embedding for query',
@@ -63,11 +86,7 @@ class TableRetrievalService(BaseService):
             search_results = await self.opensearch_service.process(
                 inputs=OpenSearchInput(
                     query_body={
-                        '_source': {
-                            'excludes': [
-                                'embedding',
-                            ],
-                        },
+                        '_source': _SOURCE_FILTER,
                         'query': {
                             'hybrid': {
                                 'queries': [
@@ -79,7 +98,7 @@ class TableRetrievalService(BaseService):
                                     {
                                         'knn': {
                                             'embedding': {
-                                                'vector': embedding.vector,
+                                                'vector': vector,
                                                 'k': self.settings.knn_size,
                                             },
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from typing import Any
 
+import orjson
+
 from base import BaseModel
 from base import BaseService
 from aqi_agent.domain.table_pruner.modules.column_pruner import ColumnPrunerInput
@@ -17,9 +21,40 @@ from aqi_agent.shared.settings import TablePrunerSettings
 from lite_llm import LiteLLMService
 from logger import get_logger
 from opensearch import OpenSearchService
+from pydantic import PrivateAttr
+from redis import Redis  # type: ignore[import-untyped]
+
+from .cache import SemanticCache
 
 logger = get_logger(__name__)
 
+_EXACT_CACHE_PREFIX = 'table_pruner:exact'
+
+
+def clear_exact_cache(redis_client: Redis) -> int:
+    """
+    Delete every exact-match table pruner result from Redis.
+
+    Call after re-indexing the tables; cached pruned schemas would otherwise be
+    served from the previous index until their TTL runs out.
+
+    Args:
+        redis_client (Redis): Client for the Redis database the agent caches into.
+
+    Returns:
+        int: Number of deleted keys.
+    """
+    deleted = 0
+    batch: list[bytes] = []
+    for key in redis_client.scan_iter(match=f'{_EXACT_CACHE_PREFIX}:*', count=500):
+        batch.append(key)
+        if len(batch) >= 500:
+            deleted += redis_client.delete(*batch)
+            batch.clear()
+    if batch:
+        deleted += redis_client.delete(*batch)
+    return deleted
+
 
 class TablePrunerInput(BaseModel):
     question: str
@@ -41,10 +76,23 @@ class TablePrunerService(BaseService):
     opensearch_service: OpenSearchService
     litellm_service: LiteLLMService
     table_pruner_settings: TablePrunerSettings
+    redis_client: Redis | None = None
 
     _table_indexer: TableIndexerService | None = None
     _table_retrieval: TableRetrievalService | None = None
     _column_pruner: ColumnPrunerService | None = None
+    _semantic_cache: SemanticCache | None = PrivateAttr(default=None)
+
+    @property
+    def semantic_cache(self) -> SemanticCache | None:
+        settings = self.table_pruner_settings
+        if self._semantic_cache is None and settings.semantic_cache_size > 0:
+            self._semantic_cache = SemanticCache(
+                threshold=settings.semantic_cache_threshold,
+                max_size=settings.semantic_cache_size,
+                ttl=settings.semantic_cache_ttl,
+            )
+        return self._semantic_cache
 
     @property
     def table_indexer(self) -> TableIndexerService:
@@ -75,6 +123,42 @@ class TablePrunerService(BaseService):
             )
         return self._column_pruner
 
+    def _exact_cache_key(self, normalized_question: str) -> str:
+        digest = hashlib.sha256(
+            orjson.dumps(
+                {
+                    'model': self.table_pruner_settings.model,
+                    'index': self.table_pruner_settings.index_name,
+                    'question': normalized_question,
+                },
+                option=orjson.OPT_SORT_KEYS,
+            ),
+        ).hexdigest()
+        return f'{_EXACT_CACHE_PREFIX}:{digest}'
+
+    async def _exact_cache_get(self, key: str) -> TablePrunerOutput | None:
+        if self.redis_client is None or self.table_pruner_settings.exact_cache_ttl <= 0:
+            return None
+        try:
+            payload = await asyncio.to_thread(self.redis_client.get, key)
+        except Exception as e:
+            logger.warning('Table pruner exact cache lookup failed', extra={'error': str(e)})
+            return None
+        return TablePrunerOutput.model_validate_json(payload) if payload else None
+
+    async def _exact_cache_put(self, key: str, payload: str) -> None:
+        if self.redis_client is None or self.table_pruner_settings.exact_cache_ttl <= 0:
+            return
+        try:
+            await asyncio.to_thread(
+                self.redis_client.setex,
+                key,
+                self.table_pruner_settings.exact_cache_ttl,
+                payload,
+            )
+        except Exception as e:
+            logger.warning('Table pruner exact cache store failed', extra={'error': str(e)})
+
     async def index_tables(self, inputs: TablePrunerIndexInput) -> bool:
         """
         Index table descriptions into OpenSearch for later retrieval.
@@ -104,6 +188,10 @@ class TablePrunerService(BaseService):
         1. Retrieve relevant tables from OpenSearch using hybrid search
         2. Prune columns using LLM to select only relevant columns
 
+        Results are looked up first by exact question in Redis, then by question
+        embedding in the in-process semantic cache; either hit skips both steps.
+        The question embedding is computed once and shared with retrieval.
+
         Args:
             inputs (TablePrunerInput): TablePrunerInput containing the user question
 
@@ -115,10 +203,27 @@ class TablePrunerService(BaseService):
             extra={'question': inputs.question},
         )
 
+        cache_key = ' '.join(inputs.question.lower().split())
+        exact_key = self._exact_cache_key(cache_key)
+        cached_output = await self._exact_cache_get(exact_key)
+        if cached_output is not None:
+            logger.info('Table pruner exact cache hit', extra={'question': inputs.question})
+            return cached_output
+
+        cache = self.semantic_cache
+        embedding = None
+        if cache is not None:
+            embedding = await self.table_retrieval.embed_query(inputs.question)
+            cached = cache.get(cache_key, embedding)
+            if cached is not None:
+                logger.info('Table pruner semantic cache hit', extra={'question': inputs.question})
+                await self._exact_cache_put(exact_key, cached)
+                return TablePrunerOutput.model_validate_json(cached)
+
         # Step 1: Retrieve relevant tables
         logger.info('Retrieving relevant tables from OpenSearch')
         retrieval_output = await self.table_retrieval.process(
-            inputs=TableRetrievalInput(query=inputs.question),
+            inputs=TableRetrievalInput(query=inputs.question, embedding=embedding),
         )
 
         if not retrieval_output.results:
@@ -157,11 +262,17 @@ class TablePrunerService(BaseService):
             },
         )
 
-        return TablePrunerOutput(
+        output = TablePrunerOutput(
             pruned_schema=pruner_output.pruned_schema,
             retrieved_tables=retrieval_output.results,
             column_selection=pruner_output.column_selection,
         )
+        if output.pruned_schema:
+            payload = output.model_dump_json()
+            if cache is not None:
+                cache.put(cache_key, embedding, payload)
+            await self._exact_cache_put(exact_key, payload)
+        return output
 
     async def gprocess(self, state: ChatwithDBState) -> dict:
         """
@@ -174,7 +285,7 @@ class TablePrunerService(BaseService):
         Returns:
             Updated state dictionary with table pruning results.
         """
-        logger.info('Starting table pruner with state: ', extra={'state': state})
+        logger.info('Starting table pruner', extra={'conversation_id': state.get('conversation_id')})
         try:
             inputs = TablePrunerInput(question=state.get('rephrased_state', {}).get('rephrased_main_question', ''))
             output = await self.process(inputs)
@@ -191,6 +302,7 @@ class TablePrunerService(BaseService):
             'table_pruner_state': TablePrunerState(
                 pruned_schema=output.pruned_schema,
                 retrieved_tables=output.retrieved_tables,
-                column_selection=[r.model_dump() for r in output.column_selection.results],
+                # Tables the LLM kept with no columns carry nothing downstream; drop them here
+                column_selection=[r.model_dump() for r in output.column_selection.results if r.columns],
             ),
         }
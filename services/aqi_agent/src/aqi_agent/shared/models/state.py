@@ -137,6 +137,7 @@ class FixSQLAgentState(TypedDict):
 class AnswerGeneratorState(TypedDict):
     answer: str
     able_to_answer: bool
+    from_cache: bool
 
 
 class SQLValidatorState(TypedDict):
@@ -13,3 +13,8 @@ class AnswerGeneratorSettings(BaseModel):
     max_completion_tokens: int
     display_rows: int = 20
     num_retry: int = 1
+    # Reply to empty/missing SQL results with a fixed message instead of calling the LLM
+    skip_empty_results: bool = True
+    # Answers reused for the same rephrased question; keep the TTL short since AQI data updates
+    cache_size: int = 1024
+    cache_ttl: float = 300.0
@@ -22,8 +22,11 @@ class AutocorrectorSettings(BaseModel):
       max_fuzzy_matches: Maximum number of fuzzy matches to return per condition.
           If None, returns all matches above threshold. If set (e.g. 5),
           limits results to top 5 best matches.
+      values_cache_ttl: Seconds a column's cached values are kept in-process
+          after being loaded from Redis. Set to 0 to load them on every lookup.
   """
   redis_key_prefix: str = 'frequent_values:'
   fuzzy_threshold: int = 70
   min_len_ratio: float = 0.4
   max_fuzzy_matches: Optional[int] = 5
+  values_cache_ttl: float = 300.0
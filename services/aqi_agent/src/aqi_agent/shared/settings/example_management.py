@@ -10,3 +10,4 @@ class ExampleManagementSettings(BaseModel):
     embedding_model: str = 'gemini-embedding'
     encoding_format: str = 'float'
     threshold: float = 0.8
+    max_concurrency: int = 8
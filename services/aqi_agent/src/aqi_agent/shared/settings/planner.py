@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from base import BaseModel
 
 
@@ -11,3 +13,9 @@ class PlannerSettings(BaseModel):
     temperature: int = 0
     top_p: int = 1
     max_completion_tokens: int
+    cache_size: int = 4096
+    cache_ttl: float = 3600.0
+    # Plan known list-all questions ("list all districts") without the LLM
+    skip_trivial: bool = True
+    # Backend-specific request fields, e.g. scheduling hints for a self-hosted vLLM/SGLang server
+    extra_body: dict[str, Any] = {}
@@ -13,3 +13,11 @@ class SQLExecutionSettings(BaseModel):
         default=3,
         description='Maximum number of retry attempts for fixing SQL queries.',
     )
+    result_cache_size: int = Field(
+        default=2048,
+        description='Maximum number of successful query results cached in process, keyed by SQL text. 0 disables the cache.',
+    )
+    result_cache_ttl: float = Field(
+        default=60.0,
+        description='Seconds a cached query result stays valid; keep it at or below the AQI data refresh interval.',
+    )
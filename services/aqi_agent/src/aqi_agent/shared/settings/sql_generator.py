@@ -14,7 +14,7 @@ class SQLGeneratorSettings(BaseModel):
 
 
 class MatchSQLGeneratorSettings(SQLGeneratorSettings):
-    pass
+    speculative_execution: bool = True
 
 
 class MismatchSQLGeneratorSettings(SQLGeneratorSettings):
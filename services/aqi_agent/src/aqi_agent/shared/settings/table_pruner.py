@@ -14,3 +14,11 @@ class TablePrunerSettings(BaseModel):
     temperature: int = 0
     top_p: int = 1
     max_completion_tokens: int
+    # knn_vector data type of the table index: 'byte' stores int8-quantized vectors, 'float' raw float32
+    embedding_data_type: str = 'byte'
+    # Reuse pruning results for semantically equivalent questions; size 0 disables
+    semantic_cache_size: int = 256
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_ttl: float = 3600.0
+    # Exact-question results shared through Redis; 0 disables
+    exact_cache_ttl: int = 86400
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import time
+from collections.abc import Callable
 from collections.abc import Coroutine
+from datetime import datetime
 from functools import lru_cache
+from string import Formatter
 
+import orjson
 from aqi_agent.shared.models.memory import QAMemoryPair
 from aqi_agent.shared.settings import Settings
 from fastapi.requests import Request
@@ -23,6 +29,75 @@ def get_resources(request: Request) -> Resources:
     return request.app.state.resources
 
 
+def get_aqi_agent_application(request: Request):
+    return request.app.state.aqi_agent_application
+
+
+# (minute bucket, formatted value) shared by every prompt that embeds the current time
+_NOW_CACHE: tuple[int, str] = (-1, '')
+
+
+def current_date_time() -> str:
+    """
+    Return the current local time as ``YYYY-MM-DD HH:MM``, formatted once per minute.
+
+    Prompts only show minute precision, so the string is cached for the current
+    minute instead of calling ``datetime.now().strftime`` on every request; all
+    prompts built within the same minute also get byte-identical text.
+    """
+    global _NOW_CACHE
+    bucket = int(time.time() // 60)
+    if bucket != _NOW_CACHE[0]:
+        _NOW_CACHE = (bucket, datetime.now().strftime('%Y-%m-%d %H:%M'))
+    return _NOW_CACHE[1]
+
+
+def payload_digest(value: object) -> str:
+    """
+    Return a short blake2b digest of a JSON-serializable payload for log records.
+
+    Large inputs (schemas, examples, retrieved tables) are logged by size and digest
+    instead of by value, so failures on big payloads do not spend CPU and log I/O
+    serializing them.
+
+    Args:
+        value: The payload to fingerprint.
+
+    Returns:
+        str: A 16-character hex digest.
+    """
+    return hashlib.blake2b(orjson.dumps(value, default=str), digest_size=8).hexdigest()
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a ``str.format`` prompt template into static segments once.
+
+    The returned callable renders the template by joining the static segments with
+    the keyword values, without re-parsing the template on every call. Only plain
+    ``{name}`` placeholders are supported (no conversions or format specs).
+
+    Args:
+        template: Prompt template using ``str.format`` syntax.
+
+    Returns:
+        Callable[..., str]: Renders the template from keyword arguments.
+    """
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f'Unsupported placeholder in prompt template: {field}')
+        segments.append((literal, field))
+
+    def render(**kwargs: object) -> str:
+        return ''.join([
+            literal if field is None else f'{literal}{kwargs[field]}'
+            for literal, field in segments
+        ])
+
+    return render
+
+
 def qa_message_to_string(messages: list[QAMemoryPair] | None):
     """
     Formats question and answer pairs to a string.
@@ -39,23 +114,41 @@ def qa_message_to_string(messages: list[QAMemoryPair] | None):
     if not messages:
         return ''
 
-    messages_str = ''
+    parts: list[str] = []
     for message in messages:
         simple_message = message.simplize()
         if simple_message and len(simple_message) == 2:
-            messages_str += f'User: {simple_message[0].get("content", "")}\nChatbot: {simple_message[1].get("content", "")}\n\n'
+            parts.append(f'User: {simple_message[0].get("content", "")}\nChatbot: {simple_message[1].get("content", "")}\n\n')
 
-    return messages_str
+    return ''.join(parts)
 
 
 async def semaphore_gather(
     *coroutines: Coroutine,
     max_coroutines: int,
-):
+) -> list:
+    """
+    Run coroutines concurrently, at most ``max_coroutines`` at a time, and return their results in order.
+
+    Runs inside an ``asyncio.TaskGroup``: the first failure cancels the
+    remaining coroutines, including those still waiting on the semaphore,
+    so they release their connections immediately instead of running to
+    completion. That first error is re-raised as-is, like ``asyncio.gather``.
+    """
     semaphore = asyncio.Semaphore(max_coroutines)
 
     async def _wrap_coroutine(coroutine):
-        async with semaphore:
-            return await coroutine
-
-    return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+        try:
+            async with semaphore:
+                return await coroutine
+        finally:
+            # No-op once awaited; avoids "never awaited" warnings when cancelled while queued
+            coroutine.close()
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(_wrap_coroutine(coroutine)) for coroutine in coroutines]
+    except ExceptionGroup as e:
+        raise e.exceptions[0] from None
+
+    return [task.result() for task in tasks]
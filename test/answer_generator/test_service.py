@@ -0,0 +1,158 @@
+"""
+Unit tests for the AnswerGeneratorService answer cache.
+
+No LLM is called: ``AnswerGeneratorService._call_llm`` is replaced by a
+recording stand-in, and the service module's clock is stepped explicitly.
+
+Run with:
+    pytest test/answer_generator/test_service.py -v
+"""
+from __future__ import annotations
+
+import pytest
+
+from lite_llm import LiteLLMService, LiteLLMSetting
+
+from aqi_agent.domain.answer_generator import service as service_module
+from aqi_agent.domain.answer_generator.service import (
+    AnswerGeneratorOutput,
+    AnswerGeneratorService,
+)
+from aqi_agent.shared.settings import AnswerGeneratorSettings
+from conftest import FakeClock, FakeMethod
+
+
+QUESTION = "AQI trung bình của quận Ba Đình hôm nay là bao nhiêu?"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+pytestmark = pytest.mark.parametrize("fake_monotonic", [service_module], indirect=True, ids=["clock"])
+
+
+def _stub_llm(fake_method, answer: str, able_to_answer: bool = True) -> FakeMethod:
+    """Replace ``_call_llm`` with a recording stand-in that always returns ``answer``."""
+
+    async def call_llm(messages: list) -> AnswerGeneratorOutput:
+        return AnswerGeneratorOutput(answer=answer, able_to_answer=able_to_answer)
+
+    return fake_method(AnswerGeneratorService, "_call_llm", call_llm)
+
+
+def _make_service(**settings) -> AnswerGeneratorService:
+    litellm_settings = LiteLLMSetting(
+        url="http://localhost:9510",
+        token="sk-test",
+        model="test-model",
+        embedding_model="test-embedding",
+        frequency_penalty=0,
+        n=1,
+        presence_penalty=0,
+        temperature=0,
+        top_p=1,
+        max_completion_tokens=1024,
+        encoding_format="float",
+        dimensions=8,
+        max_length=8000,
+        timeout=60,
+        connect_timeout=10,
+        max_connections=10,
+        max_keepalive_connections=5,
+        context_window=100000,
+        condition_model="test-model",
+    )
+    return AnswerGeneratorService(
+        settings=AnswerGeneratorSettings(model="test-model", max_completion_tokens=1024, **settings),
+        litellm_service=LiteLLMService(settings=litellm_settings),
+    )
+
+
+def _state(question: str = QUESTION, need_context: bool = True, language: str = "Vietnamese") -> dict:
+    return {
+        "question": question,
+        "rephrased_state": {
+            "rephrased_main_question": question,
+            "language": language,
+            "need_context": need_context,
+        },
+        "sql_generator_state": {"sql_query": "SELECT aqi_value FROM distric_stats"},
+        "sql_execution_state": {"execution_result": '{"columns":["aqi_value"],"rows":[[42]]}', "number_of_rows": 1},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Unit tests
+# ---------------------------------------------------------------------------
+
+class TestAnswerCache:
+    """gprocess() stores answers, cached_gprocess() serves them."""
+
+    async def test_miss_on_empty_cache(self, fake_monotonic: FakeClock):
+        service = _make_service()
+        assert await service.cached_gprocess(_state()) == {}
+
+    async def test_answer_is_served_from_cache(self, fake_monotonic: FakeClock, fake_method):
+        llm = _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service()
+
+        await service.gprocess(_state())
+        result = await service.cached_gprocess(_state())
+
+        state = result["answer_generator_state"]
+        assert state["answer"] == "AQI là 42."
+        assert state["from_cache"] is True
+        assert len(llm.calls) == 1
+
+    async def test_key_ignores_case_and_whitespace(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service()
+
+        await service.gprocess(_state())
+        result = await service.cached_gprocess(_state(question="  " + QUESTION.upper() + " "))
+
+        assert result["answer_generator_state"]["answer"] == "AQI là 42."
+
+    async def test_language_is_part_of_the_key(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service()
+
+        await service.gprocess(_state())
+
+        assert await service.cached_gprocess(_state(language="English")) == {}
+
+    async def test_entry_expires_after_ttl(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service(cache_ttl=300.0)
+
+        await service.gprocess(_state())
+        fake_monotonic.now += 299.0
+        assert "answer_generator_state" in await service.cached_gprocess(_state())
+
+        fake_monotonic.now += 2.0
+        assert await service.cached_gprocess(_state()) == {}
+
+    async def test_unanswerable_output_is_not_stored(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "Không đủ dữ liệu.", able_to_answer=False)
+        service = _make_service()
+
+        await service.gprocess(_state())
+
+        assert await service.cached_gprocess(_state()) == {}
+
+    async def test_need_context_false_bypasses_cache(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service()
+
+        await service.gprocess(_state())
+
+        assert await service.cached_gprocess(_state(need_context=False)) == {}
+
+    async def test_zero_size_disables_cache(self, fake_monotonic: FakeClock, fake_method):
+        _stub_llm(fake_method, "AQI là 42.")
+        service = _make_service(cache_size=0)
+
+        await service.gprocess(_state())
+
+        assert await service.cached_gprocess(_state()) == {}
@@ -1,6 +1,25 @@
 """
 Root conftest.py — configures pytest-asyncio mode for the whole test suite.
+
+Also provides the shared test doubles for the in-process caches:
+
+- ``fake_monotonic``: replaces ``time`` in the module passed by indirect
+  parametrization with a ``FakeClock``, so TTL expiry can be stepped explicitly::
+
+      @pytest.mark.parametrize("fake_monotonic", [cache_module], indirect=True, ids=["clock"])
+      class TestExpiry:
+          def test_expires(self, fake_monotonic: FakeClock):
+              fake_monotonic.now += 11.0
+
+- ``fake_method``: patches a method on a class with a ``FakeMethod`` that
+  delegates to a stand-in implementation and records each call.
 """
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
 
 
@@ -8,3 +27,52 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests (require live services)"
     )
+
+
+class FakeClock:
+    """Stands in for time.monotonic so TTL expiry can be stepped explicitly."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeMethod:
+    """
+    Stand-in for a service method that records the arguments of each call.
+
+    Instances are not descriptors, so ``impl`` receives the call arguments
+    without ``self``. A call is recorded once ``impl`` returns; for coroutine
+    functions that is when the coroutine is created.
+    """
+
+    def __init__(self, impl: Callable[..., Any]) -> None:
+        self.impl = impl
+        self.calls: list[tuple] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        result = self.impl(*args, **kwargs)
+        self.calls.append(args)
+        return result
+
+
+@pytest.fixture()
+def fake_monotonic(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace ``time`` in the module given as the indirect parameter with a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr(request.param, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture()
+def fake_method(monkeypatch: pytest.MonkeyPatch) -> Callable[[type, str, Callable[..., Any]], FakeMethod]:
+    """Return a factory that patches ``cls.name`` with a FakeMethod around ``impl``."""
+
+    def install(cls: type, name: str, impl: Callable[..., Any]) -> FakeMethod:
+        fake = FakeMethod(impl)
+        monkeypatch.setattr(cls, name, fake)
+        return fake
+
+    return install
@@ -0,0 +1,99 @@
+"""
+Integration tests for eager loading in the pg controllers.
+
+Every relationship a schema touches during ``model_validate`` must be covered
+by the controller's default loader options. The tests append ``raiseload('*')``
+so any relationship left to lazy loading raises instead of silently issuing
+one query per row (N+1).
+
+Run with:
+    pytest test/pg_controller/test_controllers.py -v -s
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+from dotenv import find_dotenv, load_dotenv
+from sqlalchemy.orm import raiseload
+
+# Load project .env so POSTGRES__* vars are available
+load_dotenv(find_dotenv('.env'), override=True)
+
+from pg import SQLDatabase
+from pg.controller.district_controller import _DISTRICT_LOAD_OPTIONS
+from pg.controller.province_controller import _PROVINCE_LOAD_OPTIONS
+from pg.controller.schemas import District
+from pg.controller.schemas import Province
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+PG_USERNAME = os.getenv('POSTGRES__USERNAME', 'hanoiair_user')
+PG_PASSWORD = os.getenv('POSTGRES__PASSWORD', 'hanoiair_pass')
+PG_HOST = os.getenv('POSTGRES__HOST', 'localhost')
+PG_PORT = int(os.getenv('POSTGRES__PORT', '15432'))
+PG_DB = os.getenv('POSTGRES__DB', 'hanoiair_db')
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope='module')
+def sql_database() -> SQLDatabase:
+    """Create a real SQLDatabase connection to PostgreSQL."""
+    return SQLDatabase(
+        username=PG_USERNAME,
+        password=PG_PASSWORD,
+        host=PG_HOST,
+        port=PG_PORT,
+        db=PG_DB,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Integration Tests (requires a running PostgreSQL database)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestEagerLoadingIntegration:
+    """Default loader options must cover every relationship the schemas read."""
+
+    def test_get_districts_has_no_lazy_loads(self, sql_database):
+        """get_districts() validates without any lazy relationship load."""
+        with sql_database.get_session() as session:
+            result = sql_database.get_districts(
+                session,
+                limit=5,
+                load_options=[*_DISTRICT_LOAD_OPTIONS, raiseload('*')],
+            )
+
+        assert result is None or all(isinstance(d, District) for d in result)
+
+    def test_get_provinces_has_no_lazy_loads(self, sql_database):
+        """get_provinces() validates without any lazy relationship load."""
+        with sql_database.get_session() as session:
+            result = sql_database.get_provinces(
+                session,
+                limit=1,
+                load_options=[*_PROVINCE_LOAD_OPTIONS, raiseload('*')],
+            )
+
+        assert result is None or all(isinstance(p, Province) for p in result)
+
+    def test_raiseload_surfaces_lazy_loads(self, sql_database):
+        """Without eager options, raiseload('*') turns the lazy province load into an error."""
+        with sql_database.get_session() as session:
+            if not sql_database.get_districts(session, limit=1):
+                pytest.skip('No districts in the database')
+
+        with pytest.raises(Exception):
+            with sql_database.get_session() as session:
+                sql_database.get_districts(
+                    session,
+                    limit=1,
+                    load_options=[raiseload('*')],
+                )
@@ -23,6 +23,7 @@ from lite_llm import CompletionMessage, LiteLLMService, LiteLLMSetting, MessageR
 
 # Load project .env so LITELLM__TOKEN etc. are available
 load_dotenv(find_dotenv('.env'), override=True)
+from aqi_agent.domain.planner import service as planner_service_module
 from aqi_agent.domain.planner.service import (
     PlannerService,
     PlannerServiceInput,
@@ -30,6 +31,7 @@ from aqi_agent.domain.planner.service import (
 )
 from aqi_agent.domain.planner.models import SubTaskModel
 from aqi_agent.shared.settings import PlannerSettings
+from conftest import FakeClock, FakeMethod
 
 
 # ---------------------------------------------------------------------------
@@ -257,6 +259,156 @@ class TestPlannerServiceOutput:
         assert out.subtasks[0].task_id == "t1"
 
 
+async def _stub_plan(inputs: PlannerServiceInput, recent_turns_txt: str) -> PlannerServiceOutput:
+    """Stand-in for ``_plan`` that yields to the event loop once, like a real LLM call."""
+    await asyncio.sleep(0)
+    return PlannerServiceOutput(
+        subtasks=[SubTaskModel(task_id="t1", description=inputs.rephrased_question, depends_on=[], sql_hint="")],
+        planning_summary="Stubbed plan.",
+    )
+
+
+@pytest.fixture()
+def plan(fake_method) -> FakeMethod:
+    """Replace ``PlannerService._plan`` with a recording stand-in."""
+    return fake_method(PlannerService, "_plan", _stub_plan)
+
+
+@pytest.mark.parametrize("fake_monotonic", [planner_service_module], indirect=True, ids=["clock"])
+class TestPlannerCache:
+    """Unit tests for the plan cache in PlannerService.process() — _plan is stubbed."""
+
+    QUESTION = "Which districts had an average AQI above 100 last week?"
+
+    @pytest.fixture()
+    def service(self, litellm_service: LiteLLMService) -> PlannerService:
+        return PlannerService(
+            litellm_service=litellm_service,
+            settings=PlannerSettings(model=LLM_MODEL, max_completion_tokens=4096, cache_ttl=3600.0),
+        )
+
+    async def test_repeated_question_hits_cache(self, service: PlannerService, fake_monotonic: FakeClock, plan: FakeMethod):
+        first = await service.process(PlannerServiceInput(rephrased_question=self.QUESTION, schema="s"))
+        second = await service.process(PlannerServiceInput(rephrased_question=self.QUESTION.upper(), schema="s"))
+
+        assert second == first
+        assert len(plan.calls) == 1
+
+    async def test_context_change_misses_cache(self, service: PlannerService, fake_monotonic: FakeClock, plan: FakeMethod):
+        await service.process(PlannerServiceInput(rephrased_question=self.QUESTION, schema="s1"))
+        await service.process(PlannerServiceInput(rephrased_question=self.QUESTION, schema="s2"))
+
+        assert len(plan.calls) == 2
+
+    async def test_entry_expires_after_ttl(self, service: PlannerService, fake_monotonic: FakeClock, plan: FakeMethod):
+        await service.process(PlannerServiceInput(rephrased_question=self.QUESTION))
+        fake_monotonic.now += 3599.0
+        await service.process(PlannerServiceInput(rephrased_question=self.QUESTION))
+        assert len(plan.calls) == 1
+
+        fake_monotonic.now += 2.0
+        await service.process(PlannerServiceInput(rephrased_question=self.QUESTION))
+        assert len(plan.calls) == 2
+
+    async def test_concurrent_requests_share_one_plan(self, service: PlannerService, fake_monotonic: FakeClock, plan: FakeMethod):
+        results = await asyncio.gather(
+            *(service.process(PlannerServiceInput(rephrased_question=self.QUESTION)) for _ in range(5)),
+        )
+
+        assert len(plan.calls) == 1
+        assert all(result == results[0] for result in results)
+        assert not service._cache_locks or all(not lock.locked() for lock in service._cache_locks.values())
+
+
+class TestTrivialPlan:
+    """Unit tests for the keyword heuristic that skips the LLM planner."""
+
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "List all districts",
+            "Show all provinces",
+            "show me the components?",
+            "What are the districts?",
+            "Liệt kê các quận",
+            "Danh sách tất cả các tỉnh",
+            "Hiển thị các quận huyện",
+            "Cho tôi xem các chất ô nhiễm",
+        ],
+    )
+    def test_list_all_question_is_trivial(self, question: str):
+        plan = PlannerService._trivial_plan(question)
+
+        assert plan is not None
+        assert plan.requires_clarification is False
+        assert [subtask.description for subtask in plan.subtasks] == [question]
+
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "What is the current air quality?",
+            "Which district has the worst air quality?",
+            "Which district has the best air quality?",
+            "Show yesterday's readings",
+            "Show the latest readings",
+            "Is Hoan Kiem polluted now?",
+            "What is the AQI today?",
+            "Top 5 districts by AQI",
+            "List districts where pollution is high",
+            "List all districts in Hanoi",
+            "Compare the districts",
+            "Quận nào ô nhiễm?",
+            "Chất lượng không khí hiện tại thế nào?",
+            "AQI trung bình của Hà Nội",
+            "Sắp xếp các quận",
+            "Danh sách quận theo tỉnh",
+            "Liệt kê các quận ô nhiễm nhất",
+        ],
+    )
+    def test_question_needing_filters_is_not_trivial(self, question: str):
+        assert PlannerService._trivial_plan(question) is None
+
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "Show XYZ",
+            "Liệt kê XYZ",
+            "Tính XYZ cho các quận",
+        ],
+    )
+    def test_unknown_entity_is_not_trivial(self, question: str):
+        assert PlannerService._trivial_plan(question) is None
+
+    async def test_process_skips_llm_for_trivial_question(
+        self,
+        litellm_service: LiteLLMService,
+        plan: FakeMethod,
+    ):
+        service = PlannerService(
+            litellm_service=litellm_service,
+            settings=PlannerSettings(model=LLM_MODEL, max_completion_tokens=4096),
+        )
+
+        result = await service.process(PlannerServiceInput(rephrased_question="Liệt kê các quận"))
+
+        assert plan.calls == []
+        assert result.subtasks[0].description == "Liệt kê các quận"
+
+    async def test_process_calls_llm_when_skip_disabled(
+        self,
+        litellm_service: LiteLLMService,
+        plan: FakeMethod,
+    ):
+        service = PlannerService(
+            litellm_service=litellm_service,
+            settings=PlannerSettings(model=LLM_MODEL, max_completion_tokens=4096, skip_trivial=False),
+        )
+
+        await service.process(PlannerServiceInput(rephrased_question="Liệt kê các quận"))
+
+        assert len(plan.calls) == 1
+
+
 # ---------------------------------------------------------------------------
 # Integration tests (real LLM call)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,195 @@
+"""
+Unit tests for SQLExecutionHandlerService speculative execution and result caching.
+
+The database is never touched: ``SQLExecutionHandlerService._execute`` is
+replaced by a recording stand-in, and the service module's clock is stepped
+explicitly.
+
+Run with:
+    pytest test/sql_execution_handler/test_service.py -v
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+
+import pytest
+
+from pg import SQLDatabase
+
+from aqi_agent.domain.sql_execution_handler import service as service_module
+from aqi_agent.domain.sql_execution_handler.service import (
+    SQLExecutionHandlerInput,
+    SQLExecutionHandlerOutput,
+    SQLExecutionHandlerService,
+)
+from aqi_agent.shared.settings import SQLExecutionSettings
+from conftest import FakeClock, FakeMethod
+
+
+SQL = "SELECT aqi_value FROM distric_stats LIMIT 1"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+pytestmark = pytest.mark.parametrize("fake_monotonic", [service_module], indirect=True, ids=["clock"])
+
+
+class BlockingExecute:
+    """
+    Stand-in for ``_execute`` that numbers its runs.
+
+    Calls made from a worker thread (speculative executions) block until
+    ``event`` is set, so a test can act while one is still in flight.
+    """
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.runs = itertools.count(1)
+
+    def __call__(self, sql_query: str) -> SQLExecutionHandlerOutput:
+        if threading.current_thread() is not threading.main_thread():
+            self.event.wait(timeout=5)
+        return SQLExecutionHandlerOutput(execution_result=f"run {next(self.runs)}", number_of_rows=1)
+
+
+@pytest.fixture()
+def release() -> BlockingExecute:
+    stand_in = BlockingExecute()
+    yield stand_in
+    stand_in.event.set()
+
+
+@pytest.fixture()
+def execute(fake_method, release: BlockingExecute) -> FakeMethod:
+    return fake_method(SQLExecutionHandlerService, "_execute", release)
+
+
+def _make_service(**settings) -> SQLExecutionHandlerService:
+    return SQLExecutionHandlerService(
+        sql_database=SQLDatabase(username="u", password="p", host="localhost", port=5432, db="d"),
+        settings=SQLExecutionSettings(**settings),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Unit tests
+# ---------------------------------------------------------------------------
+
+class TestSpeculativeExecution:
+    """speculate() / discard() / process() interplay."""
+
+    async def test_process_reuses_speculative_execution(
+        self,
+        fake_monotonic: FakeClock,
+        execute: FakeMethod,
+        release: BlockingExecute,
+    ):
+        service = _make_service()
+        release.event.set()
+
+        service.speculate(SQL)
+        result = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+
+        assert result.execution_result == "run 1"
+        assert execute.calls == [(SQL,)]
+        assert SQL not in service._speculative
+
+    async def test_discard_cancels_speculative_execution(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service()
+
+        service.speculate(SQL)
+        task = service._speculative[SQL][1]
+        service.discard(SQL)
+        await asyncio.sleep(0)
+
+        assert SQL not in service._speculative
+        assert task.cancelled()
+
+    async def test_stale_speculative_execution_is_not_reused(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service(result_cache_ttl=60.0)
+
+        service.speculate(SQL)
+        task = service._speculative[SQL][1]
+        fake_monotonic.now += 61.0
+        result = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert result.execution_result == "run 1"
+        assert execute.calls == [(SQL,)]
+
+    async def test_stale_entries_are_pruned_on_next_speculate(
+        self,
+        fake_monotonic: FakeClock,
+        execute: FakeMethod,
+        release: BlockingExecute,
+    ):
+        service = _make_service(result_cache_ttl=60.0)
+        release.event.set()
+
+        service.speculate(SQL)
+        fake_monotonic.now += 61.0
+        service.speculate("SELECT 1")
+
+        assert list(service._speculative) == ["SELECT 1"]
+
+
+class TestResultCache:
+    """In-process cache of successful query results."""
+
+    async def test_repeated_query_hits_cache(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service()
+
+        first = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        second = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+
+        assert second == first
+        assert execute.calls == [(SQL,)]
+
+    async def test_errors_are_not_cached(self, fake_monotonic: FakeClock, fake_method):
+        execute = fake_method(
+            SQLExecutionHandlerService,
+            "_execute",
+            lambda sql_query: SQLExecutionHandlerOutput(error_message="relation does not exist"),
+        )
+        service = _make_service()
+
+        await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        result = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+
+        assert result.error_message == "relation does not exist"
+        assert execute.calls == [(SQL,), (SQL,)]
+
+    async def test_zero_size_disables_cache(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service(result_cache_size=0)
+
+        await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+
+        assert execute.calls == [(SQL,), (SQL,)]
+        assert not service._result_cache
+
+    async def test_entries_expire_after_ttl(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service(result_cache_ttl=10.0)
+
+        await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        fake_monotonic.now += 9.0
+        await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        assert execute.calls == [(SQL,)]
+
+        fake_monotonic.now += 2.0
+        result = await service.process(SQLExecutionHandlerInput(sql_query=SQL))
+        assert result.execution_result == "run 2"
+        assert execute.calls == [(SQL,), (SQL,)]
+
+    async def test_least_recently_used_entry_is_evicted(self, fake_monotonic: FakeClock, execute: FakeMethod):
+        service = _make_service(result_cache_size=2)
+
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 1", "SELECT 3", "SELECT 1", "SELECT 2"):
+            await service.process(SQLExecutionHandlerInput(sql_query=sql))
+
+        assert [sql for (sql,) in execute.calls] == ["SELECT 1", "SELECT 2", "SELECT 3", "SELECT 2"]
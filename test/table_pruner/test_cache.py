@@ -0,0 +1,112 @@
+"""
+Unit tests for the table pruner SemanticCache.
+
+Run with:
+    pytest test/table_pruner/test_cache.py -v
+"""
+from __future__ import annotations
+
+import pytest
+
+from aqi_agent.domain.table_pruner import cache as cache_module
+from aqi_agent.domain.table_pruner.cache import SemanticCache
+from conftest import FakeClock
+
+
+pytestmark = pytest.mark.parametrize("fake_monotonic", [cache_module], indirect=True, ids=["clock"])
+
+
+# ---------------------------------------------------------------------------
+# Unit tests
+# ---------------------------------------------------------------------------
+
+class TestSemanticCacheLookup:
+    """Exact-key and similarity lookups."""
+
+    def test_miss_on_empty_cache(self, fake_monotonic: FakeClock):
+        cache = SemanticCache()
+        assert cache.get("aqi hà nội", [1.0, 0.0, 0.0]) is None
+
+    def test_exact_key_hit(self, fake_monotonic: FakeClock):
+        cache = SemanticCache()
+        cache.put("aqi hà nội", [1.0, 0.0, 0.0], "payload")
+        assert cache.get("aqi hà nội", [0.0, 1.0, 0.0]) == "payload"
+
+    def test_similar_vector_hits_above_threshold(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(threshold=0.9)
+        cache.put("aqi hà nội hôm nay", [1.0, 0.0, 0.0], "payload")
+        assert cache.get("aqi hôm nay ở hà nội", [0.95, 0.1, 0.0]) == "payload"
+
+    def test_dissimilar_vector_misses_below_threshold(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(threshold=0.9)
+        cache.put("aqi hà nội hôm nay", [1.0, 0.0, 0.0], "payload")
+        assert cache.get("pm2.5 cao nhất", [0.5, 0.8, 0.0]) is None
+
+    def test_returns_most_similar_entry(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(threshold=0.5)
+        cache.put("a", [1.0, 0.0, 0.0], "first")
+        cache.put("b", [0.8, 0.6, 0.0], "second")
+        assert cache.get("c", [0.7, 0.7, 0.0]) == "second"
+
+    def test_dimension_mismatch_misses(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(threshold=0.5)
+        cache.put("a", [1.0, 0.0, 0.0], "payload")
+        assert cache.get("b", [1.0, 0.0]) is None
+
+
+class TestSemanticCacheExpiry:
+    """Entries stop matching once their TTL has passed."""
+
+    def test_entry_expires_after_ttl(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(ttl=10.0)
+        cache.put("a", [1.0, 0.0, 0.0], "payload")
+        fake_monotonic.now += 9.0
+        assert cache.get("a", [1.0, 0.0, 0.0]) == "payload"
+        fake_monotonic.now += 2.0
+        assert cache.get("a", [1.0, 0.0, 0.0]) is None
+
+    def test_expired_entry_not_matched_by_similarity(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(ttl=10.0, threshold=0.5)
+        cache.put("a", [1.0, 0.0, 0.0], "payload")
+        fake_monotonic.now += 11.0
+        assert cache.get("b", [1.0, 0.0, 0.0]) is None
+
+    def test_put_refreshes_ttl(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(ttl=10.0)
+        cache.put("a", [1.0, 0.0, 0.0], "old")
+        fake_monotonic.now += 8.0
+        cache.put("a", [1.0, 0.0, 0.0], "new")
+        fake_monotonic.now += 8.0
+        assert cache.get("a", [1.0, 0.0, 0.0]) == "new"
+
+
+class TestSemanticCacheEviction:
+    """Least recently used entries are evicted beyond max_size."""
+
+    def test_evicts_least_recently_put(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(max_size=2, threshold=0.99)
+        cache.put("a", [1.0, 0.0, 0.0], "a")
+        cache.put("b", [0.0, 1.0, 0.0], "b")
+        cache.put("c", [0.0, 0.0, 1.0], "c")
+        assert cache.get("a", [1.0, 0.0, 0.0]) is None
+        assert cache.get("b", [0.0, 1.0, 0.0]) == "b"
+        assert cache.get("c", [0.0, 0.0, 1.0]) == "c"
+
+    def test_get_marks_entry_recently_used(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(max_size=2, threshold=0.99)
+        cache.put("a", [1.0, 0.0, 0.0], "a")
+        cache.put("b", [0.0, 1.0, 0.0], "b")
+        assert cache.get("a", [1.0, 0.0, 0.0]) == "a"
+        cache.put("c", [0.0, 0.0, 1.0], "c")
+        assert cache.get("a", [1.0, 0.0, 0.0]) == "a"
+        assert cache.get("b", [0.0, 1.0, 0.0]) is None
+
+    def test_expired_slot_reused_before_eviction(self, fake_monotonic: FakeClock):
+        cache = SemanticCache(max_size=2, ttl=10.0, threshold=0.99)
+        cache.put("a", [1.0, 0.0, 0.0], "a")
+        fake_monotonic.now += 5.0
+        cache.put("b", [0.0, 1.0, 0.0], "b")
+        fake_monotonic.now += 6.0
+        cache.put("c", [0.0, 0.0, 1.0], "c")
+        assert cache.get("b", [0.0, 1.0, 0.0]) == "b"
+        assert cache.get("c", [0.0, 0.0, 1.0]) == "c"